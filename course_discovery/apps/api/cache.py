@@ -1,10 +1,15 @@
 import logging
+import re
 import time
 import zlib
 
 from django.conf import settings
 from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import post_delete
 from django.http.response import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.module_loading import import_string
 from rest_framework.renderers import JSONRenderer
 from rest_framework_extensions.cache.decorators import CacheResponse
 from rest_framework_extensions.key_constructor.bits import KeyBitBase, QueryParamsKeyBit
@@ -17,6 +22,11 @@ from course_discovery.apps.api.utils import conditional_decorator
 
 logger = logging.getLogger(__name__)
 API_TIMESTAMP_KEY = 'api_timestamp'
+API_CACHE_TAG_KEY_PREFIX = 'api_cache_tag'
+# Families of objects whose changes invalidate only the cached responses tagged with them.
+# Changes to any other course_metadata model still invalidate every cached response.
+CACHE_TAG_FAMILIES = ('course', 'program', 'person')
+REJECTED_CODING_PARAMS_PATTERN = re.compile(r'\s*q\s*=\s*0(\.0*)?\s*')
 
 
 class ApiTimestampKeyBit(KeyBitBase):
@@ -24,8 +34,7 @@ class ApiTimestampKeyBit(KeyBitBase):
         return cache.get_or_set(API_TIMESTAMP_KEY, time.time, None)
 
 
-class TimestampedListKeyConstructor(DefaultListKeyConstructor):
-    timestamp = ApiTimestampKeyBit()
+class ListKeyConstructor(DefaultListKeyConstructor):
     # The DefaultListKeyConstructor includes the PaginationKeyBit. While it does
     # subclass QueryParamsKeyBit, it also bypasses logic which includes all query
     # params in the cache key, restricting the set of query params that end up in
@@ -35,13 +44,20 @@ class TimestampedListKeyConstructor(DefaultListKeyConstructor):
     querystring = QueryParamsKeyBit()
 
 
-class TimestampedObjectKeyConstructor(DefaultObjectKeyConstructor):
-    timestamp = ApiTimestampKeyBit()
+class ObjectKeyConstructor(DefaultObjectKeyConstructor):
     # The DefaultObjectKeyConstructor doesn't include querystring parameters
     # in its cache key.
     querystring = QueryParamsKeyBit()
 
 
+class TimestampedListKeyConstructor(ListKeyConstructor):
+    timestamp = ApiTimestampKeyBit()
+
+
+class TimestampedObjectKeyConstructor(ObjectKeyConstructor):
+    timestamp = ApiTimestampKeyBit()
+
+
 def timestamped_list_key_constructor(*args, **kwargs):
     return TimestampedListKeyConstructor()(**kwargs)
 
@@ -50,17 +66,179 @@ def timestamped_object_key_constructor(*args, **kwargs):
     return TimestampedObjectKeyConstructor()(**kwargs)
 
 
+# Keys of the previously rendered responses served while stale, which must survive API timestamp changes.
+def stale_list_key_constructor(*args, **kwargs):
+    return 'stale:' + ListKeyConstructor()(**kwargs)
+
+
+def stale_object_key_constructor(*args, **kwargs):
+    return 'stale:' + ObjectKeyConstructor()(**kwargs)
+
+
 def set_api_timestamp():
     timestamp = time.time()
     cache.set(API_TIMESTAMP_KEY, timestamp, None)
 
 
+def get_cache_tag_key(tag):
+    return f'{API_CACHE_TAG_KEY_PREFIX}:{tag}'
+
+
+def get_cache_tag_versions(tags, initial_version):
+    """
+    Return the current version of each of the given cache tags, initializing the ones that have none.
+    """
+    keys = {get_cache_tag_key(tag): tag for tag in tags}
+    versions = cache.get_many(keys)
+    missing = {key: initial_version for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+    return {keys[key]: version for key, version in versions.items()}
+
+
+def are_cache_tags_current(tag_versions):
+    """
+    Check whether none of the given cache tags has been invalidated since the given versions were read.
+    """
+    current_versions = cache.get_many([get_cache_tag_key(tag) for tag in tag_versions])
+    return all(current_versions.get(get_cache_tag_key(tag)) == version for tag, version in tag_versions.items())
+
+
+def invalidate_cache_tags(tags):
+    timestamp = time.time()
+    cache.set_many({get_cache_tag_key(tag): timestamp for tag in tags}, None)
+
+
+def get_family_cache_tags(family, uuid, partner_id):
+    return {family, f'{family}:partner:{partner_id}', f'{family}:{uuid}'}
+
+
+def get_instance_cache_tags(instance, deleted=False):
+    """
+    Return the cache tags invalidated by a change to the given course_metadata model instance.
+
+    Returns:
+        (set|None): The tags, or None if changes to the instance must invalidate every cached response.
+    """
+    model_name = instance._meta.model_name
+    if model_name == 'course' and deleted:
+        # The programs the course belonged to can't be found once its program memberships are deleted.
+        return None
+
+    try:
+        if model_name in ('courserun', 'courseentitlement'):
+            instance = instance.course
+        elif model_name == 'seat':
+            instance = instance.course_run.course
+        elif model_name in ('position', 'personsocialnetwork', 'personareaofexpertise'):
+            instance = instance.person
+        elif model_name == 'programaggregate':
+            instance = instance.program
+    except ObjectDoesNotExist:
+        return None
+
+    model_name = instance._meta.model_name
+    if model_name not in CACHE_TAG_FAMILIES:
+        return None
+
+    tags = get_family_cache_tags(model_name, instance.uuid, instance.partner_id)
+    if model_name == 'program' and instance.pk:
+        # Courses render the programs they belong to.
+        for course_uuid, partner_id in instance.courses.values_list('uuid', 'partner_id'):
+            tags |= get_family_cache_tags('course', course_uuid, partner_id)
+    elif model_name == 'course':
+        # Programs render values derived from the runs and seats of their courses, e.g. price ranges,
+        # even when they don't render the courses themselves.
+        for program_uuid, partner_id in instance.programs.values_list('uuid', 'partner_id'):
+            tags |= get_family_cache_tags('program', program_uuid, partner_id)
+    return tags
+
+
 def api_change_receiver(sender, **kwargs):  # pylint: disable=unused-argument
     """
     Receiver function for handling post_save and post_delete signals emitted by
     course_metadata models.
+
+    Changes to courses, programs and people (including their runs, seats, entitlements and profiles)
+    only invalidate the cached responses tagged with them. Any other change invalidates the whole API cache.
+    """
+    tags = None
+    if 'instance' in kwargs:
+        tags = get_instance_cache_tags(kwargs['instance'], deleted=kwargs.get('signal') is post_delete)
+    if tags is None:
+        set_api_timestamp()
+    else:
+        invalidate_cache_tags(tags)
+
+
+def iter_path_values(data, path):
     """
-    set_api_timestamp()
+    Yield the values found at a dotted path of serialized data, descending into lists along the way.
+    """
+    if isinstance(data, list):
+        for item in data:
+            yield from iter_path_values(item, path)
+    elif isinstance(data, dict):
+        name, __, rest = path.partition('.')
+        if name in data:
+            if rest:
+                yield from iter_path_values(data[name], rest)
+            elif isinstance(data[name], list):
+                yield from data[name]
+            else:
+                yield data[name]
+
+
+class GzipCacheCodec:
+    """
+    Compresses cached responses in the gzip format, so they can be served as they are to clients accepting gzip.
+
+    Codecs are configured with the API_CACHE_CODEC and API_CACHE_CODEC_OPTIONS settings. Other codecs need to
+    implement `encode`, `decode` and `get_content_encoding`.
+    """
+    content_encoding = 'gzip'
+    magic = b'\x1f\x8b'
+    # Window bits selecting the gzip format when compressing, and detecting the gzip or zlib format when decompressing.
+    encode_wbits = 16 + zlib.MAX_WBITS
+    decode_wbits = 32 + zlib.MAX_WBITS
+
+    def __init__(self, level=zlib.Z_DEFAULT_COMPRESSION):
+        self.level = level
+
+    def encode(self, content):
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, self.encode_wbits)
+        return compressor.compress(content) + compressor.flush()
+
+    def decode(self, data):
+        try:
+            return zlib.decompress(data, self.decode_wbits)
+        except (TypeError, zlib.error):
+            # If we get a type error or a zlib error, the response content was never compressed
+            return data
+
+    def get_content_encoding(self, data):
+        """
+        Return the HTTP content coding of the given encoded data, or None if it can't be served as it is.
+        """
+        return self.content_encoding if data[:2] == self.magic else None
+
+
+def get_cache_codec():
+    return import_string(settings.API_CACHE_CODEC)(**settings.API_CACHE_CODEC_OPTIONS)
+
+
+def accepted_encodings(request):
+    """
+    Return the content codings accepted by the client of a request.
+    """
+    encodings = set()
+    for coding in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        name, __, params = coding.partition(';')
+        name = name.strip().lower()
+        if name and not REJECTED_CODING_PARAMS_PATTERN.fullmatch(params):
+            encodings.add(name)
+    return encodings
 
 
 class CompressedCacheResponse(CacheResponse):
@@ -68,7 +246,55 @@ class CompressedCacheResponse(CacheResponse):
     Subclasses CacheResponse to allow for compression of content going into the cache
     See https://github.com/chibisov/drf-extensions/blob/master/rest_framework_extensions/cache/decorators.py#L52
     for a similar implementation of process_cache_response without compression
+
+    On a cache miss, only one worker renders the response while the others wait for it to be cached
+    (see API_CACHE_LOCK_TIMEOUT). When given a `stale_key_func`, whose keys must not change when the cache
+    is invalidated, the waiting workers are served the previously rendered response instead for a while
+    after the cache is invalidated (see API_CACHE_STALE_WHILE_REVALIDATE_SECONDS).
     """
+    lock_poll_interval = 0.1
+
+    def __init__(self, *args, stale_key_func=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stale_key_func = stale_key_func
+
+    def get_cached_response_triple(self, key):
+        response_triple = self.cache.get(key)
+        # Responses cached with tags carry the versions of their tags, and are stale once any of them changes.
+        if response_triple and len(response_triple) > 3:
+            response_triple, tag_versions = response_triple[:3], response_triple[3]
+            if not are_cache_tags_current(tag_versions):
+                response_triple = None
+        return response_triple
+
+    def get_stale_response_triple(self, stale_key):
+        """
+        Return the previously rendered response stored under the given key, if the cache was invalidated recently.
+        """
+        window = settings.API_CACHE_STALE_WHILE_REVALIDATE_SECONDS
+        response_triple = self.cache.get(stale_key) if window else None
+        if not response_triple:
+            return None
+
+        tag_versions = response_triple[3] if len(response_triple) > 3 else {}
+        change_keys = [API_TIMESTAMP_KEY] + [get_cache_tag_key(tag) for tag in tag_versions]
+        last_change = max(cache.get_many(change_keys).values(), default=0)
+        if time.time() - last_change > window:
+            return None
+        return response_triple[:3]
+
+    def wait_for_response_triple(self, key, lock_key):
+        """
+        Wait for the worker holding the lock to cache the response, returning None if it doesn't.
+        """
+        deadline = time.time() + settings.API_CACHE_LOCK_TIMEOUT
+        while time.time() < deadline:
+            time.sleep(self.lock_poll_interval)
+            response_triple = self.get_cached_response_triple(key)
+            if response_triple or not self.cache.has_key(lock_key):
+                return response_triple
+        return None
+
     def process_cache_response(self, view_instance, view_method, request, args, kwargs):
         flag_name = f'compressed_cache.{view_instance.__class__.__name__}.{view_method.__name__}'
         flag = get_waffle_flag_model().get(flag_name)
@@ -79,65 +305,146 @@ class CompressedCacheResponse(CacheResponse):
         # to define all of the flags ahead of time.
         use_page_cache = (not flag.pk) or flag.is_active(request)
 
+        response_triple = None
+        key = stale_key = lock_key = None
         if use_page_cache:
-            key = self.calculate_key(
-                view_instance=view_instance,
-                view_method=view_method,
-                request=request,
-                args=args,
-                kwargs=kwargs
-            )
-            response_triple = self.cache.get(key)
+            key_kwargs = {
+                'view_instance': view_instance,
+                'view_method': view_method,
+                'request': request,
+                'args': args,
+                'kwargs': kwargs,
+            }
+            key = self.calculate_key(**key_kwargs)
+            response_triple = self.get_cached_response_triple(key)
+            if not response_triple:
+                stale_key = self.stale_key_func(**key_kwargs) if self.stale_key_func else None
+                response_triple, lock_key = self.acquire_render_lock(key, stale_key)
         else:
             logger.info("Skipping page caching for %s", flag_name)
-            response_triple = None
 
         if not response_triple:
-            response = view_method(view_instance, request, *args, **kwargs)
-            response = view_instance.finalize_response(request, response, *args, **kwargs)
-            response.render()
-
-            if (not (response.status_code >= 400 or self.cache_errors) and
-                    isinstance(response.accepted_renderer, JSONRenderer) and
-                    use_page_cache):
-                # Put the response in the cache only if there are no cache errors, response errors,
-                # and the format is json. We avoid caching for the BrowsableAPIRenderer so that users don't see
-                # different usernames that are cached from the BrowsableAPIRenderer html
-
-                # django 3.0 has not .items() method, django 3.2 has not ._headers
-                if hasattr(response, '_headers'):
-                    headers = response._headers.copy()  # pylint: disable=protected-access
-                else:
-                    headers = {k: (k, v) for k, v in response.items()}
-
-                response_triple = (
-                    zlib.compress(response.rendered_content),
-                    response.status_code,
-                    headers
-                )
-                self.cache.set(key, response_triple, self.timeout)
-        else:
-            # If we get data from the cache, we reassemble the data to build a response
-            # We reassemble the pieces from the cache because we can't actually set rendered_content
-            # which is the part of the response that we compress
-            compressed_content, status, headers = response_triple
-
             try:
-                decompressed_content = zlib.decompress(compressed_content)
-            except (TypeError, zlib.error):
-                # If we get a type error or a zlib error, the response content was never compressed
-                decompressed_content = compressed_content
-
-            response = HttpResponse(content=decompressed_content, status=status)
+                render_started = time.time()
+                response = self.render_response(view_instance, view_method, request, args, kwargs)
+                if use_page_cache:
+                    self.cache_rendered_response(view_instance, view_method, request, response, render_started,
+                                                 key, stale_key)
+            finally:
+                if lock_key:
+                    self.cache.delete(lock_key)
+        else:
+            response = self.get_cached_response(request, response_triple)
 
-            for k, v in headers.values():
-                response[k] = v
+        if use_page_cache:
+            patch_vary_headers(response, ('Accept-Encoding',))
 
         if not hasattr(response, '_closable_objects'):
             response._closable_objects = []  # pylint: disable=protected-access
 
         return response
 
+    def acquire_render_lock(self, key, stale_key):
+        """
+        Take the lock to render the response of a cache miss, unless another worker holds it.
+
+        Returns:
+            (tuple): The response to serve instead of rendering it, when another worker holds the lock, and
+                the key of the lock to release once the response is rendered, when this worker took it.
+        """
+        lock_timeout = settings.API_CACHE_LOCK_TIMEOUT
+        if not lock_timeout:
+            return None, None
+
+        lock_key = f'{key}:lock'
+        if self.cache.add(lock_key, True, lock_timeout):
+            return None, lock_key
+
+        # Another worker is already rendering this response.
+        response_triple = (
+            (stale_key and self.get_stale_response_triple(stale_key)) or
+            self.wait_for_response_triple(key, lock_key)
+        )
+        return response_triple, None
+
+    def render_response(self, view_instance, view_method, request, args, kwargs):
+        response = view_method(view_instance, request, *args, **kwargs)
+        response = view_instance.finalize_response(request, response, *args, **kwargs)
+        response.render()
+        return response
+
+    def cache_rendered_response(self, view_instance, view_method, request, response, render_started, key, stale_key):
+        """
+        Cache a rendered response, with the versions of the cache tags of the view if it declares them.
+        """
+        response_triple = self.get_response_triple(response, use_page_cache=True)
+        if not response_triple:
+            return
+
+        get_cache_tags = getattr(view_instance, 'get_cache_tags', None)
+        tags = get_cache_tags(request, response, view_method.__name__) if get_cache_tags else None
+        if tags:
+            tag_versions = get_cache_tag_versions(tags, render_started)
+            # Don't cache a response whose data may predate a change made while it was being rendered.
+            if max(tag_versions.values()) <= render_started:
+                self.set_response_triple(key, stale_key, response_triple + (tag_versions,))
+        else:
+            self.set_response_triple(key, stale_key, response_triple)
+
+    def get_cached_response(self, request, response_triple):
+        """
+        Build a response from its cached pieces.
+
+        The pieces are reassembled because the rendered content, which is the part of the response that
+        is compressed, can't be set on a rendered response.
+        """
+        compressed_content, status, headers = response_triple
+
+        codec = get_cache_codec()
+        content_encoding = codec.get_content_encoding(compressed_content)
+        if content_encoding and content_encoding in accepted_encodings(request):
+            # Serve the cached bytes as they are instead of decompressing them.
+            response = HttpResponse(content=compressed_content, status=status)
+        else:
+            response = HttpResponse(content=codec.decode(compressed_content), status=status)
+            content_encoding = None
+
+        for k, v in headers.values():
+            response[k] = v
+
+        if content_encoding:
+            response['Content-Encoding'] = content_encoding
+        return response
+
+    def get_response_triple(self, response, use_page_cache):
+        """
+        Return the cacheable pieces of a rendered response, or None if it must not be cached.
+        """
+        if (not (response.status_code >= 400 or self.cache_errors) and
+                isinstance(response.accepted_renderer, JSONRenderer) and
+                use_page_cache):
+            # Put the response in the cache only if there are no cache errors, response errors,
+            # and the format is json. We avoid caching for the BrowsableAPIRenderer so that users don't see
+            # different usernames that are cached from the BrowsableAPIRenderer html
+
+            # django 3.0 has not .items() method, django 3.2 has not ._headers
+            if hasattr(response, '_headers'):
+                headers = response._headers.copy()  # pylint: disable=protected-access
+            else:
+                headers = {k: (k, v) for k, v in response.items()}
+
+            return (
+                get_cache_codec().encode(response.rendered_content),
+                response.status_code,
+                headers
+            )
+        return None
+
+    def set_response_triple(self, key, stale_key, response_triple):
+        self.cache.set(key, response_triple, self.timeout)
+        if stale_key and settings.API_CACHE_STALE_WHILE_REVALIDATE_SECONDS:
+            self.cache.set(stale_key, response_triple, self.timeout)
+
 
 # Decorator for mixin
 compressed_cache_response = CompressedCacheResponse
@@ -146,22 +453,68 @@ compressed_cache_response = CompressedCacheResponse
 class CompressedCacheResponseMixin():
     """
     Acts like drf-extensions CacheResponseMixin, but with compression into the cache and decompression out of it
+
+    Cached responses are tagged with the objects they render, see `get_cache_tags`.
     """
     object_cache_key_func = timestamped_object_key_constructor
     list_cache_key_func = timestamped_list_key_constructor
+    object_stale_cache_key_func = stale_object_key_constructor
+    list_stale_cache_key_func = stale_list_key_constructor
     object_cache_timeout = settings.REST_FRAMEWORK_EXTENSIONS['DEFAULT_CACHE_RESPONSE_TIMEOUT']
     list_cache_timeout = settings.REST_FRAMEWORK_EXTENSIONS['DEFAULT_CACHE_RESPONSE_TIMEOUT']
+    # Cache tag family of the objects returned by the view, and the paths to the uuids of the
+    # objects of each family rendered in its responses. Responses of views that don't declare
+    # them depend on every object of their partner.
+    cache_tag_family = None
+    cache_tag_uuid_paths = {}
+
+    def get_cache_tags(self, request, response, action):
+        """
+        Return the cache tags of the objects a response depends on.
+
+        Lists depend on every object of the view's family for the partner, since changes to any of them can change
+        which objects are listed. Otherwise, responses depend on the objects whose uuids they render, falling back
+        to every object of a family for the partner when objects of the family are rendered without their uuids.
+        """
+        partner = getattr(getattr(request, 'site', None), 'partner', None)
+        if partner is None:
+            return set(CACHE_TAG_FAMILIES)
+        if not self.cache_tag_family:
+            return {f'{family}:partner:{partner.id}' for family in CACHE_TAG_FAMILIES}
+
+        data = response.data
+        tags = set()
+        if action == 'list':
+            tags.add(f'{self.cache_tag_family}:partner:{partner.id}')
+            if isinstance(data, dict):
+                data = data.get('results', [])
+
+        for family, paths in self.cache_tag_uuid_paths.items():
+            for path in paths:
+                uuids = {str(uuid) for uuid in iter_path_values(data, path) if uuid}
+                if uuids:
+                    tags.update(f'{family}:{uuid}' for uuid in uuids)
+                elif next(iter_path_values(data, path.split('.')[0]), None) is not None:
+                    tags.add(f'{family}:partner:{partner.id}')
+
+        if action != 'list' and not any(tag.startswith(f'{self.cache_tag_family}:') for tag in tags):
+            tags.add(f'{self.cache_tag_family}:partner:{partner.id}')
+        return tags
 
     @conditional_decorator(
         settings.USE_API_CACHING,
-        compressed_cache_response(key_func=list_cache_key_func, timeout=list_cache_timeout),
+        compressed_cache_response(
+            key_func=list_cache_key_func, stale_key_func=list_stale_cache_key_func, timeout=list_cache_timeout,
+        ),
     )
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
     @conditional_decorator(
         settings.USE_API_CACHING,
-        compressed_cache_response(key_func=object_cache_key_func, timeout=object_cache_timeout),
+        compressed_cache_response(
+            key_func=object_cache_key_func, stale_key_func=object_stale_cache_key_func, timeout=object_cache_timeout,
+        ),
     )
     def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
@@ -3,7 +3,7 @@ import datetime
 import json
 import logging
 import re
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from decimal import ROUND_HALF_UP
 from operator import attrgetter
 from urllib.parse import urlencode
@@ -12,20 +12,21 @@ from uuid import uuid4
 import pytz
 import waffle  # lint-amnesty, pylint: disable=invalid-django-waffle-import
 from django.contrib.auth import get_user_model
-from django.db.models.query import Prefetch
+from django.db.models.query import Prefetch, QuerySet
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from django_countries.serializer_fields import CountryField
 from localflavor.us.us_states import CONTIGUOUS_STATES
 from opaque_keys.edx.locator import CourseLocator
+from rest_flex_fields import FIELDS_PARAM, OMIT_PARAM
 from rest_flex_fields.serializers import FlexFieldsSerializerMixin
 from rest_framework import serializers
 from rest_framework.fields import CreateOnlyDefault, UUIDField
 from rest_framework.metadata import SimpleMetadata
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.relations import ManyRelatedField
 from taggit.serializers import TaggitSerializer, TagListSerializerField
 from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_product_skills, get_whitelisted_serialized_skills
 
 from course_discovery.apps.api.fields import (
     HtmlField, ImageField, SlugRelatedFieldWithReadSerializer, SlugRelatedTranslatableField, StdImageSerializerField
@@ -44,9 +45,11 @@ from course_discovery.apps.course_metadata.models import (
     ProductMeta, ProductValue, Program, ProgramLocationRestriction, ProgramSubscription, ProgramSubscriptionPrice,
     ProgramType, Ranking, Seat, SeatType, Source, Specialization, Subject, TaxiForm, Topic, Track, Video
 )
+from course_discovery.apps.course_metadata.query import is_course_run_enrollable, is_course_run_marketable
 from course_discovery.apps.course_metadata.utils import get_course_run_estimated_hours, parse_course_key_fragment
 from course_discovery.apps.ietf_language_tags.models import LanguageTag
 from course_discovery.apps.publisher.api.serializers import GroupUserSerializer
+from course_discovery.apps.taxonomy_support.utils import ProductSkills
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -181,6 +184,117 @@ class TimestampModelSerializer(BaseModelSerializer):
     modified = serializers.DateTimeField(required=False)
 
 
+class ProductSkillsSerializerMixin:
+    """
+    Serializes `skill_names` and `skills` from a `ProductSkills` memo kept in the serializer context.
+
+    The memo is shared by every serializer of a request, and the skills of all the objects serialized
+    by the parent list serializer are loaded together the first time one of them is needed.
+    """
+    skills_product_type = ProductTypes.Course
+
+    def get_skills_key(self, obj):
+        return obj.key
+
+    def get_product_skills(self, obj):
+        context_key = 'product_skills:{}'.format(self.skills_product_type)
+        product_skills = self.context.get(context_key)
+        if product_skills is None:
+            product_skills = self.context[context_key] = ProductSkills(self.skills_product_type)
+
+        if not product_skills.is_loaded(self.get_skills_key(obj)):
+            objects = [obj]
+            if isinstance(self.parent, serializers.ListSerializer) and \
+                    isinstance(self.parent.instance, (list, tuple, QuerySet)):
+                objects = self.parent.instance
+            product_skills.load(self.get_skills_key(item) for item in objects)
+
+        return product_skills
+
+    def get_skill_names(self, obj):
+        return self.get_product_skills(obj).get_skill_names(self.get_skills_key(obj))
+
+    def get_skills(self, obj):
+        return self.get_product_skills(obj).get_serialized_skills(self.get_skills_key(obj))
+
+
+def get_flex_query_param_value(request, param):
+    """
+    Read a FlexFields query parameter (e.g. `fields` or `omit`) the way `FlexFieldsSerializerMixin` does.
+    """
+    values = request.query_params.getlist(param) or request.query_params.getlist(f'{param}[]')
+    if len(values) == 1:
+        values = values[0].split(',')
+    return [value.strip() for value in values if value.strip()]
+
+
+class FlexFieldsPrefetchMixin:
+    """
+    Plans the related objects loaded by `prefetch_queryset` from the FlexFields `fields` and `omit` of a request.
+
+    `prefetch_field_relations` maps field names to the relations (select_related or prefetch_related lookups,
+    including the lookups nested under them) that those fields read. Relations claimed only by fields that
+    were not requested are dropped from the queryset; relations not claimed by any field are always kept.
+    """
+    prefetch_field_relations = {}
+
+    @classmethod
+    def get_requested_fields(cls, request):
+        """
+        Return the names of the top-level fields requested, or None if all fields are.
+        """
+        fields = {field.split('.')[0] for field in get_flex_query_param_value(request, FIELDS_PARAM)}
+        # Dotted values only omit nested fields.
+        omit = {field for field in get_flex_query_param_value(request, OMIT_PARAM) if '.' not in field}
+        if not (fields or omit):
+            return None
+
+        return (fields or set(cls.Meta.fields)) - omit
+
+    @classmethod
+    def plan_prefetch_queryset(cls, queryset, request):
+        """
+        Drop the select_related and prefetch_related lookups of a queryset that the requested fields do not need.
+        """
+        if request is None or request.method not in SAFE_METHODS or not cls.prefetch_field_relations:
+            return queryset
+
+        requested_fields = cls.get_requested_fields(request)
+        if requested_fields is None:
+            return queryset
+
+        needed = {
+            relation for field in requested_fields for relation in cls.prefetch_field_relations.get(field, ())
+        }
+        claimed = {relation for relations in cls.prefetch_field_relations.values() for relation in relations}
+        droppable = claimed - needed
+
+        def is_needed(lookup):
+            if any(f'{lookup}__'.startswith(f'{relation}__') or relation.startswith(f'{lookup}__')
+                   for relation in needed):
+                return True
+            return not any(f'{lookup}__'.startswith(f'{relation}__') for relation in droppable)
+
+        if isinstance(queryset.query.select_related, dict):
+            select_related = [lookup for lookup in cls._flatten_select_related(queryset.query.select_related)
+                              if is_needed(lookup)]
+            queryset = queryset.select_related(None)
+            if select_related:
+                queryset = queryset.select_related(*select_related)
+
+        prefetch_related = [
+            lookup for lookup in queryset._prefetch_related_lookups  # pylint: disable=protected-access
+            if is_needed(lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup)
+        ]
+        return queryset.prefetch_related(None).prefetch_related(*prefetch_related)
+
+    @classmethod
+    def _flatten_select_related(cls, tree, prefix=''):
+        for name, subtree in tree.items():
+            yield prefix + name
+            yield from cls._flatten_select_related(subtree, f'{prefix}{name}__')
+
+
 class CommentSerializer(serializers.Serializer):
     """
     Serializer for retrieving comments from Salesforce.
@@ -1132,7 +1246,7 @@ class ContainedCourseRunsSerializer(serializers.Serializer):
     )
 
 
-class MinimalCourseSerializer(FlexFieldsSerializerMixin, TimestampModelSerializer):
+class MinimalCourseSerializer(FlexFieldsPrefetchMixin, FlexFieldsSerializerMixin, TimestampModelSerializer):
     course_runs = MinimalCourseRunSerializer(many=True)
     entitlements = CourseEntitlementSerializer(required=False, many=True)
     owners = MinimalOrganizationSerializer(many=True, source='authoring_organizations')
@@ -1143,6 +1257,12 @@ class MinimalCourseSerializer(FlexFieldsSerializerMixin, TimestampModelSerialize
     course_type = serializers.SerializerMethodField()
     enterprise_subscription_inclusion = serializers.BooleanField(required=False)
 
+    prefetch_field_relations = {
+        'course_runs': ('course_runs',),
+        'entitlements': ('entitlements',),
+        'owners': ('authoring_organizations',),
+    }
+
     @classmethod
     def prefetch_queryset(cls, queryset=None, course_runs=None):
         # Explicitly check for None to avoid returning all Courses when the
@@ -1249,7 +1369,7 @@ class ProgramLocationRestrictionSerializer(AbstractLocationRestrictionSerializer
         model = ProgramLocationRestriction
 
 
-class CourseSerializer(TaggitSerializer, MinimalCourseSerializer):
+class CourseSerializer(ProductSkillsSerializerMixin, TaggitSerializer, MinimalCourseSerializer):
     """Serializer for the ``Course`` model."""
     level_type = SlugRelatedTranslatableField(required=False, allow_null=True, slug_field='name_t',
                                               queryset=LevelType.objects.all())
@@ -1286,6 +1406,30 @@ class CourseSerializer(TaggitSerializer, MinimalCourseSerializer):
     in_year_value = ProductValueSerializer(required=False)
     product_source = serializers.SlugRelatedField(required=False, slug_field='slug', queryset=Source.objects.all())
 
+    prefetch_field_relations = {
+        **MinimalCourseSerializer.prefetch_field_relations,
+        # Derived from the course runs, like the course runs themselves.
+        'course_run_statuses': ('course_runs',),
+        'level_type': ('level_type',),
+        'subjects': ('subjects',),
+        'prerequisites': ('prerequisites',),
+        'expected_learning_items': ('expected_learning_items',),
+        'video': ('video',),
+        'sponsors': ('sponsoring_organizations',),
+        'canonical_course_run_key': ('canonical_course_run',),
+        'extra_description': ('extra_description',),
+        'additional_metadata': ('additional_metadata',),
+        'topics': ('topics',),
+        'url_slug_history': ('url_slug_history',),
+        'url_redirects': ('url_redirects',),
+        'editors': ('editors',),
+        'collaborators': ('collaborators',),
+        'geolocation': ('geolocation',),
+        'location_restriction': ('location_restriction',),
+        'in_year_value': ('in_year_value',),
+        'product_source': ('product_source',),
+    }
+
     def to_representation(self, instance):
         """
         Conversion of the source slug to the source serializer data
@@ -1375,13 +1519,6 @@ class CourseSerializer(TaggitSerializer, MinimalCourseSerializer):
             return obj.canonical_course_run.key
         return None
 
-    def get_skill_names(self, obj):
-        course_skills = get_whitelisted_product_skills(obj.key, product_type=ProductTypes.Course)
-        return list({course_skill.skill.name for course_skill in course_skills})
-
-    def get_skills(self, obj):
-        return get_whitelisted_serialized_skills(obj.key, product_type=ProductTypes.Course)
-
     def create(self, validated_data):
         return Course.objects.create(**validated_data)
 
@@ -1517,6 +1654,14 @@ class CourseWithProgramsSerializer(CourseSerializer):
     programs = NestedProgramSerializer(read_only=True, many=True)
     editable = serializers.SerializerMethodField()
 
+    prefetch_field_relations = {
+        **CourseSerializer.prefetch_field_relations,
+        'advertised_course_run_uuid': ('course_runs',),
+        'course_run_keys': ('course_runs',),
+        'programs': ('programs',),
+        'editable': ('authoring_organizations',),
+    }
+
     @classmethod
     def prefetch_queryset(cls, partner, queryset=None, course_runs=None, programs=None):
         """
@@ -1647,6 +1792,16 @@ class ContainedCoursesSerializer(serializers.Serializer):
     )
 
 
+def group_course_runs_by_course(course_runs):
+    """
+    Index course runs by the id of their course, keeping their order.
+    """
+    course_runs_by_course = defaultdict(list)
+    for course_run in course_runs:
+        course_runs_by_course[course_run.course_id].append(course_run)
+    return dict(course_runs_by_course)
+
+
 class MinimalProgramCourseSerializer(MinimalCourseSerializer):
     """
     Serializer used to filter out excluded course runs in a course associated with the program.
@@ -1657,8 +1812,12 @@ class MinimalProgramCourseSerializer(MinimalCourseSerializer):
     course_runs = serializers.SerializerMethodField()
 
     def get_course_runs(self, course):
-        course_runs = self.context['course_runs']
-        course_runs = [course_run for course_run in course_runs if course_run.course == course]
+        # The course runs of all the courses serialized together are only indexed once.
+        course_runs_by_course = self.context.get('course_runs_by_course')
+        if course_runs_by_course is None:
+            course_runs_by_course = group_course_runs_by_course(self.context['course_runs'])
+            self.context['course_runs_by_course'] = course_runs_by_course
+        course_runs = course_runs_by_course.get(course.id, [])
 
         if self.context.get('published_course_runs_only'):
             course_runs = [course_run for course_run in course_runs if course_run.status == CourseRunStatus.Published]
@@ -1886,7 +2045,9 @@ class ProgramSubscriptionSerializer(BaseModelSerializer):
         )
 
 
-class MinimalProgramSerializer(TaggitSerializer, FlexFieldsSerializerMixin, BaseModelSerializer):
+class MinimalProgramSerializer(
+    TaggitSerializer, FlexFieldsPrefetchMixin, FlexFieldsSerializerMixin, BaseModelSerializer
+):
     """
     Basic program serializer
 
@@ -1913,6 +2074,16 @@ class MinimalProgramSerializer(TaggitSerializer, FlexFieldsSerializerMixin, Base
     taxi_form = TaxiFormSerializer()
     subscription = ProgramSubscriptionSerializer()
 
+    prefetch_field_relations = {
+        'courses': ('courses', 'excluded_course_runs'),
+        'is_program_eligible_for_one_click_purchase': ('courses', 'excluded_course_runs'),
+        'authoring_organizations': ('authoring_organizations',),
+        'degree': ('degree',),
+        'is_2u_degree_program': ('degree',),
+        'curricula': ('curricula',),
+        'subscription': ('subscription',),
+    }
+
     def get_organization_logo_override_url(self, obj):
         logo_image_override = getattr(obj, 'organization_logo_override', None)
         if logo_image_override:
@@ -1956,13 +2127,17 @@ class MinimalProgramSerializer(TaggitSerializer, FlexFieldsSerializerMixin, Base
         course_runs = list(program.course_runs)
 
         if self.context.get('marketable_enrollable_course_runs_with_archived'):
-            marketable_enrollable_course_runs = set()
-            for course in program.courses.all():
-                marketable_enrollable_course_runs.update(course.course_runs.marketable().enrollable())
-            course_runs = list(set(course_runs).intersection(marketable_enrollable_course_runs))
+            # Filter the course_runs in python, to avoid duplicate queries for course_runs after prefetching
+            now = datetime.datetime.now(pytz.UTC)
+            course_runs = [
+                course_run for course_run in course_runs
+                if is_course_run_marketable(course_run) and is_course_run_enrollable(course_run, now)
+            ]
+
+        course_runs_by_course = group_course_runs_by_course(course_runs)
 
         if program.order_courses_by_start_date:
-            courses = self.sort_courses(program, course_runs)
+            courses = self.sort_courses(program, course_runs_by_course)
         else:
             courses = program.courses.all()
 
@@ -1975,65 +2150,43 @@ class MinimalProgramSerializer(TaggitSerializer, FlexFieldsSerializerMixin, Base
                 'exclude_utm': self.context.get('exclude_utm'),
                 'program': program,
                 'course_runs': course_runs,
+                'course_runs_by_course': course_runs_by_course,
                 'use_full_course_serializer': self.context.get('use_full_course_serializer', False),
             }
         )
 
         return course_serializer.data
 
-    def sort_courses(self, program, course_runs):
+    def sort_courses(self, program, course_runs_by_course):
         """
-        Sorting by enrollment start then by course start yields a list ordered by course start, with
-        ties broken by enrollment start. This works because Python sorting is stable: two objects with
-        equal keys appear in the same order in sorted output as they appear in the input.
+        Sort the courses of a program by the earliest start of their course runs, with ties broken by the
+        earliest enrollment start of their course runs. Python sorting is stable: courses with equal keys
+        keep the order of the program.
 
-        Courses are only created if there's at least one course run belonging to that course, so
-        course_runs should never be empty. If it is, key functions in this method attempting to find the
-        min of an empty sequence will raise a ValueError.
+        Course runs excluded from the program must be left out of `course_runs_by_course`, a dict of the course
+        runs of each course, indexed by course id (see `group_course_runs_by_course`).
         """
-
-        def min_run_enrollment_start(course):
-            # Enrollment starts may be empty. When this is the case, we make the same assumption as
-            # the LMS: no enrollment_start is equivalent to (offset-aware) datetime.datetime.min.
-            min_datetime = datetime.datetime.min.replace(tzinfo=pytz.UTC)
-
-            # Course runs excluded from the program are excluded here, too.
-            #
+        # Course starts may be empty. Since this means the course can't be started, missing course
+        # start date is equivalent to (offset-aware) datetime.datetime.max.
+        max_datetime = datetime.datetime.max.replace(tzinfo=pytz.UTC)
+        # Enrollment starts may be empty. When this is the case, we make the same assumption as
+        # the LMS: no enrollment_start is equivalent to (offset-aware) datetime.datetime.min.
+        min_datetime = datetime.datetime.min.replace(tzinfo=pytz.UTC)
+
+        def sort_key(course):
             # If this becomes a candidate for optimization in the future, be careful sorting null values
             # in the database. PostgreSQL and MySQL sort null values as if they are higher than non-null
             # values, while SQLite does the opposite.
             #
             # For more, refer to https://docs.djangoproject.com/en/1.10/ref/models/querysets/#latest.
-            _course_runs = [course_run for course_run in course_runs if course_run.course == course]
-
-            # Return early if we have no course runs since min() will fail.
-            if not _course_runs:
-                return min_datetime
-
-            run = min(_course_runs, key=lambda run: run.enrollment_start or min_datetime)
-
-            return run.enrollment_start or min_datetime
-
-        def min_run_start(course):
-            # Course starts may be empty. Since this means the course can't be started, missing course
-            # start date is equivalent to (offset-aware) datetime.datetime.max.
-            max_datetime = datetime.datetime.max.replace(tzinfo=pytz.UTC)
-
-            _course_runs = [course_run for course_run in course_runs if course_run.course == course]
-
-            # Return early if we have no course runs since min() will fail.
-            if not _course_runs:
-                return max_datetime
-
-            run = min(_course_runs, key=lambda run: run.start or max_datetime)
-
-            return run.start or max_datetime
-
-        courses = list(program.courses.all())
-        courses.sort(key=min_run_enrollment_start)
-        courses.sort(key=min_run_start)
+            course_runs = course_runs_by_course.get(course.id, [])
+            min_run_start = min((run.start or max_datetime for run in course_runs), default=max_datetime)
+            min_run_enrollment_start = min(
+                (run.enrollment_start or min_datetime for run in course_runs), default=min_datetime
+            )
+            return min_run_start, min_run_enrollment_start
 
-        return courses
+        return sorted(program.courses.all(), key=sort_key)
 
     def get_card_image_url(self, obj):
         if obj.card_image:
@@ -2075,13 +2228,20 @@ class MinimalExtendedProgramSerializer(MinimalProgramSerializer):
     curricula = CurriculumSerializer(many=True)
     card_image_url = serializers.SerializerMethodField()
     expected_learning_items = serializers.SlugRelatedField(many=True, read_only=True, slug_field='value')
+    price_ranges = serializers.ReadOnlyField(source='aggregate_values.price_ranges')
+
+    prefetch_field_relations = {
+        **MinimalProgramSerializer.prefetch_field_relations,
+        'expected_learning_items': ('expected_learning_items',),
+        'price_ranges': ('aggregate',),
+    }
 
     @classmethod
     def prefetch_queryset(cls, partner, queryset=None):
         # Explicitly check if the queryset is None before selecting related
         queryset = queryset if queryset is not None else Program.objects.filter(partner=partner)
 
-        return queryset.select_related('type', 'partner').prefetch_related(
+        return queryset.select_related('type', 'partner', 'aggregate').prefetch_related(
             'excluded_course_runs',
             'expected_learning_items',
             # `type` is serialized by a third-party serializer. Providing this field name allows us to
@@ -2100,7 +2260,7 @@ class MinimalExtendedProgramSerializer(MinimalProgramSerializer):
         fields = MinimalProgramSerializer.Meta.fields + ('expected_learning_items', 'price_ranges')
 
 
-class ProgramSerializer(MinimalProgramSerializer):
+class ProgramSerializer(ProductSkillsSerializerMixin, MinimalProgramSerializer):
     authoring_organizations = OrganizationSerializer(many=True)
     video = VideoSerializer()
     expected_learning_items = serializers.SlugRelatedField(many=True, read_only=True, slug_field='value')
@@ -2109,10 +2269,13 @@ class ProgramSerializer(MinimalProgramSerializer):
     corporate_endorsements = CorporateEndorsementSerializer(many=True)
     job_outlook_items = serializers.SlugRelatedField(many=True, read_only=True, slug_field='value')
     individual_endorsements = EndorsementSerializer(many=True)
-    languages = serializers.SlugRelatedField(
-        many=True, read_only=True, slug_field='code',
+    weeks_to_complete_min = serializers.ReadOnlyField(source='aggregate_values.weeks_to_complete_min')
+    weeks_to_complete_max = serializers.ReadOnlyField(source='aggregate_values.weeks_to_complete_max')
+    languages = serializers.ListField(
+        child=serializers.CharField(), read_only=True, source='aggregate_values.languages',
         help_text=_('Languages that course runs in this program are offered in.'),
     )
+    price_ranges = serializers.ReadOnlyField(source='aggregate_values.price_ranges')
     transcript_languages = serializers.SlugRelatedField(
         many=True, read_only=True, slug_field='code',
         help_text=_('Languages that course runs in this program have available transcripts in.'),
@@ -2131,6 +2294,33 @@ class ProgramSerializer(MinimalProgramSerializer):
     skills = serializers.SerializerMethodField()
     product_source = SourceSerializer(required=False, read_only=True)
 
+    skills_product_type = ProductTypes.Program
+    prefetch_field_relations = {
+        **MinimalProgramSerializer.prefetch_field_relations,
+        **{
+            field: ('courses', 'excluded_course_runs')
+            for field in ('transcript_languages', 'subjects', 'staff', 'topics')
+        },
+        # Read from the ProgramAggregate of the program, see Program.aggregate_values.
+        **{
+            field: ('aggregate',) for field in (
+                'weeks_to_complete_min', 'weeks_to_complete_max', 'languages', 'price_ranges',
+            )
+        },
+        'video': ('video',),
+        'expected_learning_items': ('expected_learning_items',),
+        'faq': ('faq',),
+        'credit_backing_organizations': ('credit_backing_organizations',),
+        'corporate_endorsements': ('corporate_endorsements',),
+        'job_outlook_items': ('job_outlook_items',),
+        'individual_endorsements': ('individual_endorsements',),
+        'instructor_ordering': ('instructor_ordering',),
+        'geolocation': ('geolocation',),
+        'location_restriction': ('location_restriction',),
+        'in_year_value': ('in_year_value',),
+        'product_source': ('product_source',),
+    }
+
     @classmethod
     def prefetch_queryset(cls, partner, queryset=None):
         """
@@ -2146,6 +2336,7 @@ class ProgramSerializer(MinimalProgramSerializer):
             'type',
             'video',
             'partner',
+            'aggregate',
             'geolocation',
             'in_year_value',
             'product_source',
@@ -2175,12 +2366,8 @@ class ProgramSerializer(MinimalProgramSerializer):
     def get_topics(self, obj):
         return [topic.name for topic in obj.topics]
 
-    def get_skill_names(self, obj):
-        program_skills = get_whitelisted_product_skills(obj.uuid, product_type=ProductTypes.Program)
-        return list({program_skill.skill.name for program_skill in program_skills})
-
-    def get_skills(self, obj):
-        return get_whitelisted_serialized_skills(obj.uuid, product_type=ProductTypes.Program)
+    def get_skills_key(self, obj):
+        return obj.uuid
 
     class Meta(MinimalProgramSerializer.Meta):
         model = Program
@@ -7,6 +7,7 @@ from urllib.parse import urlencode
 import ddt
 import pytest
 import responses
+from django.db.models import Prefetch
 from django.test import TestCase
 from django.utils.text import slugify
 from elasticsearch_dsl.query import Q as ESDSLQ
@@ -43,7 +44,7 @@ from course_discovery.apps.core.tests.helpers import make_image_file
 from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin, LMSAPIClientMixin
 from course_discovery.apps.core.utils import serialize_datetime
 from course_discovery.apps.course_metadata.choices import CourseRunStatus, ProgramStatus
-from course_discovery.apps.course_metadata.models import AbstractLocationRestrictionModel, CourseReview
+from course_discovery.apps.course_metadata.models import AbstractLocationRestrictionModel, CourseReview, CourseRun
 from course_discovery.apps.course_metadata.search_indexes.documents import (
     CourseDocument, CourseRunDocument, LearnerPathwayDocument, PersonDocument, ProgramDocument
 )
@@ -1130,7 +1131,7 @@ class ProgramSerializerTests(MinimalProgramSerializerTests):
                 context={'request': request}
             ).data,
             'job_outlook_items': [item.value for item in program.job_outlook_items.all()],
-            'languages': [serialize_language_to_code(p_lang) for p_lang in program.languages],
+            'languages': sorted(serialize_language_to_code(p_lang) for p_lang in program.languages),
             'weeks_to_complete': program.weeks_to_complete,
             'total_hours_of_effort': program.total_hours_of_effort,
             'weeks_to_complete_min': program.weeks_to_complete_min,
@@ -3144,3 +3145,48 @@ class CourseReviewSerializerTests(TestCase):
             serializer = CourseReviewSerializer(data=data)
             self.assertFalse(serializer.is_valid())
             self.assertIn(field, serializer.errors)
+
+
+class FlexFieldsPrefetchMixinTests(TestCase):
+    def get_lookups(self, query_param=None):
+        partner = PartnerFactory()
+        queryset = CourseWithProgramsSerializer.prefetch_queryset(partner=partner)
+        queryset = CourseWithProgramsSerializer.plan_prefetch_queryset(queryset, make_request(query_param))
+        prefetch_related = {
+            lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+            for lookup in queryset._prefetch_related_lookups  # pylint: disable=protected-access
+        }
+        return set(queryset.query.select_related), prefetch_related
+
+    def test_all_fields(self):
+        """ Verify all related objects are loaded when no fields are selected. """
+        select_related, prefetch_related = self.get_lookups()
+        assert {'level_type', 'video', 'partner', 'canonical_course_run'} <= select_related
+        assert {'programs', 'course_runs', 'subjects', 'level_type__translations'} <= prefetch_related
+
+    def test_fields(self):
+        """ Verify only the related objects needed by the requested fields, and unclaimed ones, are loaded. """
+        select_related, prefetch_related = self.get_lookups({'fields': 'key,uuid,course_run_keys,owners'})
+        assert select_related == {'partner', 'type', '_official_version'}
+        assert prefetch_related == {'course_runs', 'authoring_organizations'}
+
+    def test_run_derived_fields(self):
+        """ Verify the filtered course runs are kept for every field derived from them, not only course_runs. """
+        partner = PartnerFactory()
+        course_runs = CourseRun.objects.filter(key='course-v1:edX+Filtered+1T2024')
+        for fields in ('key,advertised_course_run_uuid', 'key,course_run_statuses', 'key,course_run_keys'):
+            queryset = CourseWithProgramsSerializer.prefetch_queryset(partner=partner, course_runs=course_runs)
+            queryset = CourseWithProgramsSerializer.plan_prefetch_queryset(queryset, make_request({'fields': fields}))
+            course_runs_prefetches = [
+                lookup for lookup in queryset._prefetch_related_lookups  # pylint: disable=protected-access
+                if isinstance(lookup, Prefetch) and lookup.prefetch_through == 'course_runs'
+            ]
+            assert len(course_runs_prefetches) == 1
+            assert 'course-v1:edX+Filtered+1T2024' in str(course_runs_prefetches[0].queryset.query)
+
+    def test_omit(self):
+        """ Verify the related objects of omitted fields are not loaded. """
+        select_related, prefetch_related = self.get_lookups({'omit': 'programs,video,course_runs.seats'})
+        assert 'video' not in select_related
+        assert 'programs' not in prefetch_related
+        assert {'course_runs', 'subjects', 'canonical_course_run__seats__type'} <= prefetch_related
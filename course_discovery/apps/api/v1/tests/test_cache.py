@@ -1,4 +1,6 @@
+import gzip
 import zlib
+from unittest import mock
 
 import ddt
 from django.core.cache import cache
@@ -9,7 +11,11 @@ from rest_framework.response import Response
 from rest_framework_extensions.test import APIRequestFactory
 from waffle.testutils import override_flag
 
-from course_discovery.apps.api.cache import compressed_cache_response
+from course_discovery.apps.api.cache import (
+    API_TIMESTAMP_KEY, CompressedCacheResponseMixin, GzipCacheCodec, accepted_encodings, compressed_cache_response,
+    invalidate_cache_tags, set_api_timestamp
+)
+from course_discovery.apps.core.models import Partner
 
 factory = APIRequestFactory()
 
@@ -169,3 +175,236 @@ class CompressedCacheResponseTest(TestCase):
         cache.set('cache_response_key', response_dict)
         response = view_instance.dispatch(request=self.request)
         self.assertEqual(response['test'], 'foo')
+
+    def test_serve_encoded_content(self):
+        """ Verify that cached responses are served compressed to clients accepting their encoding. """
+        def key_func(**kwargs):
+            return self.cache_response_key
+
+        class TestView(views.APIView):
+            permission_classes = [permissions.AllowAny]
+            renderer_classes = [JSONRenderer]
+
+            @compressed_cache_response(key_func=key_func)
+            def get(self, request, *_args, **_kwargs):
+                return Response('test response')
+
+        def get_response(request):
+            view_instance = TestView()
+            view_instance.headers = {}  # pylint: disable=attribute-defined-outside-init
+            return view_instance.dispatch(request=request)
+
+        assert get_response(self.request).content == b'"test response"'
+
+        response = get_response(factory.get('', HTTP_ACCEPT_ENCODING='gzip, deflate'))
+        assert response['Content-Encoding'] == 'gzip'
+        assert response['Vary'] == 'Accept-Encoding'
+        assert gzip.decompress(response.content) == b'"test response"'
+
+        response = get_response(factory.get('', HTTP_ACCEPT_ENCODING='gzip;q=0, deflate'))
+        assert not response.has_header('Content-Encoding')
+        assert response['Vary'] == 'Accept-Encoding'
+        assert response.content == b'"test response"'
+
+    @override_settings(API_CACHE_CODEC_OPTIONS={'level': 1})
+    def test_codec_options(self):
+        """ Verify that the configured codec options are used to compress cached responses. """
+        def key_func(**kwargs):
+            return self.cache_response_key
+
+        class TestView(views.APIView):
+            permission_classes = [permissions.AllowAny]
+            renderer_classes = [JSONRenderer]
+
+            @compressed_cache_response(key_func=key_func)
+            def get(self, request, *_args, **_kwargs):
+                return Response('test response')
+
+        with mock.patch('course_discovery.apps.api.cache.GzipCacheCodec', wraps=GzipCacheCodec) as codec_class:
+            view_instance = TestView()
+            view_instance.headers = {}  # pylint: disable=attribute-defined-outside-init
+            view_instance.dispatch(request=self.request)
+        codec_class.assert_called_with(level=1)
+
+    def test_tagged_response_invalidated_by_tag(self):
+        """ Verify that responses cached with tags are served until one of their tags is invalidated. """
+        def key_func(**kwargs):
+            return self.cache_response_key
+
+        class TestView(views.APIView):
+            permission_classes = [permissions.AllowAny]
+            renderer_classes = [JSONRenderer]
+            calls = 0
+
+            def get_cache_tags(self, request, _response, _action):
+                return {'course:first', 'course:second'}
+
+            @compressed_cache_response(key_func=key_func)
+            def get(self, request, *_args, **_kwargs):
+                TestView.calls += 1
+                return Response(f'test response {TestView.calls}')
+
+        def get_content():
+            view_instance = TestView()
+            view_instance.headers = {}  # pylint: disable=attribute-defined-outside-init
+            return view_instance.dispatch(request=self.request).content.decode('utf-8')
+
+        assert get_content() == '"test response 1"'
+        assert get_content() == '"test response 1"'
+
+        invalidate_cache_tags({'course:other'})
+        assert get_content() == '"test response 1"'
+
+        invalidate_cache_tags({'course:second'})
+        assert get_content() == '"test response 2"'
+
+
+@override_settings(USE_API_CACHING=True, API_CACHE_STALE_WHILE_REVALIDATE_SECONDS=60)
+class CompressedCacheResponseSingleFlightTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.request = factory.get('')
+        self.generation = 1
+
+        def key_func(**kwargs):
+            return f'cache_response_key:{self.generation}'
+
+        def stale_key_func(**kwargs):
+            return 'stale_cache_response_key'
+
+        class TestView(views.APIView):
+            permission_classes = [permissions.AllowAny]
+            renderer_classes = [JSONRenderer]
+            calls = 0
+
+            @compressed_cache_response(key_func=key_func, stale_key_func=stale_key_func)
+            def get(self, request, *_args, **_kwargs):
+                TestView.calls += 1
+                return Response(f'test response {TestView.calls}')
+
+        self.view_class = TestView
+
+    def get_content(self):
+        view_instance = self.view_class()
+        view_instance.headers = {}  # pylint: disable=attribute-defined-outside-init
+        return view_instance.dispatch(request=self.request).content.decode('utf-8')
+
+    def invalidate(self):
+        self.generation += 1
+        set_api_timestamp()
+
+    def lock(self):
+        cache.add(f'cache_response_key:{self.generation}:lock', True)
+
+    def unlock(self):
+        cache.delete(f'cache_response_key:{self.generation}:lock')
+
+    def test_lock_released_after_render(self):
+        """ Verify that the worker rendering a response releases its lock. """
+        assert self.get_content() == '"test response 1"'
+        assert not cache.has_key('cache_response_key:1:lock')
+
+    def test_wait_for_render(self):
+        """ Verify that workers missing a response that is being rendered wait for it instead of rendering it. """
+        self.lock()
+
+        def render_elsewhere(_interval):
+            cache.set('cache_response_key:1', (b'"rendered elsewhere"', 200, {}))
+            self.unlock()
+
+        with mock.patch('course_discovery.apps.api.cache.time.sleep', side_effect=render_elsewhere):
+            assert self.get_content() == '"rendered elsewhere"'
+        assert self.view_class.calls == 0
+
+    def test_serve_stale_while_revalidating(self):
+        """ Verify that the previous response is served while it is being rendered again after an invalidation. """
+        assert self.get_content() == '"test response 1"'
+
+        self.invalidate()
+        self.lock()
+        with mock.patch('course_discovery.apps.api.cache.time.sleep') as sleep:
+            assert self.get_content() == '"test response 1"'
+        sleep.assert_not_called()
+
+        self.unlock()
+        assert self.get_content() == '"test response 2"'
+
+    def test_stale_window_expired(self):
+        """ Verify that the previous response is not served once the invalidation is older than the window. """
+        assert self.get_content() == '"test response 1"'
+
+        self.invalidate()
+        cache.set(API_TIMESTAMP_KEY, cache.get(API_TIMESTAMP_KEY) - 61, None)
+        self.lock()
+        with mock.patch('course_discovery.apps.api.cache.time.sleep', side_effect=lambda _interval: self.unlock()):
+            assert self.get_content() == '"test response 2"'
+
+    @override_settings(API_CACHE_LOCK_TIMEOUT=0)
+    def test_single_flight_disabled(self):
+        """ Verify that every worker renders missed responses when the lock is disabled. """
+        self.lock()
+        assert self.get_content() == '"test response 1"'
+
+
+@ddt.ddt
+class GzipCacheCodecTests(TestCase):
+    def test_round_trip(self):
+        """ Verify that encoded content is gzip data which decodes back to the content. """
+        codec = GzipCacheCodec(level=1)
+        encoded = codec.encode(b'"test response"')
+
+        assert codec.get_content_encoding(encoded) == 'gzip'
+        assert gzip.decompress(encoded) == codec.decode(encoded) == b'"test response"'
+
+    def test_decode_legacy_content(self):
+        """ Verify that content cached before gzip was used can still be decoded, but not served as it is. """
+        codec = GzipCacheCodec()
+        for content in (zlib.compress(b'"test response"'), b'"test response"'):
+            assert codec.get_content_encoding(content) is None
+            assert codec.decode(content) == b'"test response"'
+
+    @ddt.data(
+        ('', set()),
+        ('gzip', {'gzip'}),
+        ('GZip, deflate;q=0.5, br', {'gzip', 'deflate', 'br'}),
+        ('gzip;q=0, br;q=0.000', set()),
+    )
+    @ddt.unpack
+    def test_accepted_encodings(self, accept_encoding, expected):
+        assert accepted_encodings(factory.get('', HTTP_ACCEPT_ENCODING=accept_encoding)) == expected
+
+
+class CompressedCacheResponseMixinTests(TestCase):
+    def get_cache_tags(self, data, action, **attrs):
+        view = type('TestViewSet', (CompressedCacheResponseMixin,), attrs)()
+        request = factory.get('')
+        request.site = mock.Mock(partner=Partner(id=7))
+        return view.get_cache_tags(request, Response(data), action)
+
+    def test_undeclared_view(self):
+        """ Verify that responses of views without cache tag declarations depend on every object of the partner. """
+        assert self.get_cache_tags({}, 'retrieve') == {'course:partner:7', 'program:partner:7', 'person:partner:7'}
+
+    def test_rendered_uuids(self):
+        """ Verify that responses depend on the objects whose uuids they render. """
+        attrs = {
+            'cache_tag_family': 'course',
+            'cache_tag_uuid_paths': {'course': ('uuid',), 'program': ('programs.uuid',)},
+        }
+        data = {'uuid': 'abc', 'programs': [{'uuid': 'def'}, {'uuid': 'ghi'}]}
+        assert self.get_cache_tags(data, 'retrieve', **attrs) == {'course:abc', 'program:def', 'program:ghi'}
+
+        data = {'count': 1, 'results': [data]}
+        assert self.get_cache_tags(data, 'list', **attrs) == {
+            'course:partner:7', 'course:abc', 'program:def', 'program:ghi'
+        }
+
+    def test_rendered_without_uuids(self):
+        """ Verify that objects rendered without their uuids make responses depend on every object of the family. """
+        attrs = {
+            'cache_tag_family': 'course',
+            'cache_tag_uuid_paths': {'course': ('uuid',), 'program': ('programs.uuid',)},
+        }
+        data = {'key': 'edX+DemoX', 'programs': [{'title': 'Program'}]}
+        assert self.get_cache_tags(data, 'retrieve', **attrs) == {'course:partner:7', 'program:partner:7'}
@@ -0,0 +1,107 @@
+import datetime
+
+import pytest
+from django.test import TestCase
+from rest_framework.exceptions import ValidationError
+
+from course_discovery.apps.api.v1 import services
+from course_discovery.apps.core.tests.factories import PartnerFactory, UserFactory
+from course_discovery.apps.course_metadata.choices import CourseRunStatus
+from course_discovery.apps.course_metadata.models import Course, CourseEditor, CourseRun, CourseRunType, CourseType
+from course_discovery.apps.course_metadata.tests.factories import (
+    CourseFactory, CourseRunFactory, OrganizationFactory, SourceFactory
+)
+
+
+class CourseWriteServicesTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        # Without a Studio url, course runs are not pushed to Studio.
+        self.partner = PartnerFactory(studio_url=None)
+        self.user = UserFactory(is_staff=True)
+        self.org = OrganizationFactory(key='edX', partner=self.partner)
+        self.source = SourceFactory()
+        self.audit_type = CourseType.objects.get(slug=CourseType.AUDIT)
+
+    def get_course_data(self, **kwargs):
+        return {
+            'title': 'Course title',
+            'number': 'test101',
+            'org': self.org.key,
+            'type': str(self.audit_type.uuid),
+            'product_source': self.source.slug,
+            **kwargs,
+        }
+
+    def test_create_course(self):
+        """ Verify a draft course is created, with its entitlements, editor and run. """
+        course_run_data = {
+            'start': '2001-01-01T00:00:00Z',
+            'end': datetime.datetime.now() + datetime.timedelta(days=1),
+            'run_type': str(CourseRunType.objects.get(slug=CourseRunType.AUDIT).uuid),
+        }
+
+        course = services.create_course(self.get_course_data(course_run=course_run_data), self.user, self.partner)
+
+        assert course.draft
+        assert course.key == 'edX+test101'
+        assert list(course.authoring_organizations.all()) == [self.org]
+        assert CourseEditor.objects.filter(user=self.user, course=course).exists()
+        assert course.entitlements.count() == self.audit_type.entitlement_types.count()
+        course_run = CourseRun.everything.get(course=course)
+        assert course_run.draft
+        assert course.canonical_course_run == course_run
+
+    def test_create_course_with_incorrect_data(self):
+        """ Verify incorrect data is rejected, without creating anything. """
+        with pytest.raises(services.CourseWriteError) as exc_info:
+            services.create_course(self.get_course_data(org='fake org'), self.user, self.partner)
+
+        assert exc_info.value.message == 'Incorrect data sent. Organization [fake org] does not exist.'
+        assert exc_info.value.status_code == 400
+        assert not Course.everything.exists()
+
+    def test_create_course_run_without_course(self):
+        """ Verify a course run can't be created without a course. """
+        with pytest.raises(ValidationError):
+            services.create_course_run({'start': '2001-01-01T00:00:00Z'}, self.user)
+
+    def test_update_course(self):
+        """ Verify courses are updated as drafts. """
+        course = CourseFactory(partner=self.partner, type=self.audit_type, draft=False)
+
+        draft_course = services.update_course(course, {'title': 'New title'}, partial=True)
+
+        assert draft_course.draft
+        assert draft_course.title == 'New title'
+        assert draft_course.official_version == course
+
+    def test_update_course_run(self):
+        """ Verify course runs are updated as drafts. """
+        course_run = CourseRunFactory(course__partner=self.partner, draft=False, status=CourseRunStatus.Unpublished)
+
+        draft_run = services.update_course_run(course_run, {'title': 'New title'}, self.user, partial=True)
+
+        assert draft_run.draft
+        assert draft_run.title == 'New title'
+        assert draft_run.official_version == course_run
+
+    def test_update_course_run_in_review(self):
+        """ Verify course runs in review can't be edited. """
+        course_run = CourseRunFactory(course__partner=self.partner, draft=True, status=CourseRunStatus.LegalReview)
+
+        with pytest.raises(services.CourseWriteError) as exc_info:
+            services.update_course_run(course_run, {'title': 'New title'}, self.user, partial=True)
+
+        assert exc_info.value.status_code == 403
+        course_run.refresh_from_db()
+        assert course_run.title != 'New title'
+
+    def test_update_course_run_internal_review_fields(self):
+        """ Verify the fields of the internal review can only be updated while a course run is in review. """
+        course_run = CourseRunFactory(course__partner=self.partner, draft=True, status=CourseRunStatus.Unpublished)
+
+        with pytest.raises(services.CourseWriteError) as exc_info:
+            services.update_course_run(course_run, {'ofac_comment': 'Comment'}, self.user, partial=True)
+
+        assert exc_info.value.message == 'Invalid parameter'
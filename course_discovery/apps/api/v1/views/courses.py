@@ -1,10 +1,8 @@
 import logging
 import re
 
-from django.conf import settings
-from django.core import validators
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
+from django.db import transaction
 from django.db.models import Q
 from django.db.models.functions import Lower
 from django.http.response import Http404
@@ -17,31 +15,23 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework.mixins import RetrieveModelMixin
 from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
 from rest_framework.response import Response
-from taxonomy.signals.signals import UPDATE_COURSE_SKILLS
 
 from course_discovery.apps.api import filters, serializers
 from course_discovery.apps.api.cache import CompressedCacheResponseMixin
 from course_discovery.apps.api.pagination import ProxiedPagination
 from course_discovery.apps.api.permissions import IsCourseEditorOrReadOnly
-from course_discovery.apps.api.serializers import CourseEntitlementSerializer, MetadataWithType
-from course_discovery.apps.api.utils import decode_image_data, get_query_param, reviewable_data_has_changed
+from course_discovery.apps.api.serializers import MetadataWithType
+from course_discovery.apps.api.utils import get_query_param
+from course_discovery.apps.api.v1 import services
 from course_discovery.apps.api.v1.exceptions import EditableAndQUnsupported
-from course_discovery.apps.api.v1.views.course_runs import CourseRunViewSet
 from course_discovery.apps.course_metadata.choices import CourseRunStatus, ProgramStatus
 from course_discovery.apps.course_metadata.constants import COURSE_ID_REGEX, COURSE_UUID_REGEX
-from course_discovery.apps.course_metadata.models import (
-    Collaborator, Course, CourseEditor, CourseEntitlement, CourseRun, CourseType, CourseUrlSlug, Organization, Program,
-    Seat, Source, Video
-)
-from course_discovery.apps.course_metadata.utils import (
-    create_missing_entitlement, ensure_draft_world, validate_course_number
-)
+from course_discovery.apps.course_metadata.models import Course, CourseEditor, CourseRun, Program
+from course_discovery.apps.course_metadata.utils import create_missing_entitlement
 from course_discovery.apps.publisher.utils import is_publisher_user
 
 logger = logging.getLogger(__name__)
 
-COURSE_FIELDS_FOR_SKILLS = ['title', 'short_description', 'full_description']
-
 
 def writable_request_wrapper(method):
     def inner(*args, **kwargs):
@@ -51,6 +41,8 @@ def writable_request_wrapper(method):
         except ValidationError as exc:
             return Response(exc.message if hasattr(exc, 'message') else str(exc),
                             status=status.HTTP_400_BAD_REQUEST)
+        except services.CourseWriteError as exc:
+            return Response(exc.message, status=exc.status_code)
         except (PermissionDenied, Http404):
             raise  # just pass these along
         except Exception as e:  # pylint: disable=broad-except
@@ -75,6 +67,12 @@ class CourseViewSet(CompressedCacheResponseMixin, viewsets.ModelViewSet):
     serializer_class = serializers.CourseWithProgramsSerializer
     metadata_class = MetadataWithType
     metadata_related_choices_whitelist = ('mode', 'level_type', 'subjects',)
+    cache_tag_family = 'course'
+    cache_tag_uuid_paths = {
+        'course': ('uuid',),
+        'program': ('programs.uuid',),
+        'person': ('course_runs.staff.uuid',),
+    }
 
     course_key_regex = re.compile(COURSE_ID_REGEX)
     course_uuid_regex = re.compile(COURSE_UUID_REGEX)
@@ -155,6 +153,7 @@ class CourseViewSet(CompressedCacheResponseMixin, viewsets.ModelViewSet):
                 partner=partner,
                 programs=programs,
             )
+        queryset = self.get_serializer_class().plan_prefetch_queryset(queryset, self.request)
         if pub_q and edit_mode:
             return queryset.filter(Q(key__icontains=pub_q) | Q(title__icontains=pub_q)).order_by(Lower('key'))
 
@@ -169,270 +168,29 @@ class CourseViewSet(CompressedCacheResponseMixin, viewsets.ModelViewSet):
 
         return context
 
-    def get_course_key(self, data):
-        return '{org}+{number}'.format(org=data['org'], number=data['number'])
-
     @writable_request_wrapper
     def create(self, request, *args, **kwargs):
         """
         Create a Course, Course Entitlement, and Entitlement.
         """
-        course_run_creation_fields = request.data.pop('course_run', None)
-        course_creation_fields = {
-            'title': request.data.get('title'),
-            'number': request.data.get('number'),
-            'org': request.data.get('org'),
-            'type': request.data.get('type'),
-            'product_source': request.data.get('product_source'),
-        }
-        url_slug = request.data.get('url_slug', '')
-
-        missing_values = [k for k, v in course_creation_fields.items() if v is None]
-        error_message = ''
-        if missing_values:
-            error_message += ''.join([_('Missing value for: [{name}]. ').format(name=name) for name in missing_values])
-        if not Organization.objects.filter(key=course_creation_fields['org']).exists():
-            error_message += _('Organization [{org}] does not exist. ').format(org=course_creation_fields['org'])
-        if not CourseType.objects.filter(uuid=course_creation_fields['type']).exists():
-            error_message += _('Course Type [{course_type}] does not exist. ').format(
-                course_type=course_creation_fields['type'])
-        if not Source.objects.get(slug=course_creation_fields['product_source']):
-            error_message += _('Product Source [{product_source}] does not exist. ').format(
-                product_source=course_creation_fields['product_source'])
-
-        if error_message:
-            return Response((_('Incorrect data sent. ') + error_message).strip(), status=status.HTTP_400_BAD_REQUEST)
-
-        partner = request.site.partner
-        course_creation_fields['partner'] = partner.id
-        course_creation_fields['key'] = self.get_course_key(course_creation_fields)
-
-        validate_course_number(course_creation_fields['number'])
-
-        serializer = self.get_serializer(data=course_creation_fields)
-        serializer.is_valid(raise_exception=True)
-
-        # Confirm that this course doesn't already exist in an official non-draft form
-        if Course.objects.filter(partner=partner, key=course_creation_fields['key']).exists():
-            raise Exception(  # pylint: disable=broad-exception-raised
-                _('A course with key [{key}] already exists.').format(key=course_creation_fields['key'])
-            )
-
-        # if a manually entered url_slug, ensure it's not already taken (auto-generated are guaranteed uniqueness)
-        if url_slug:
-            validators.validate_slug(url_slug)
-            if CourseUrlSlug.objects.filter(url_slug=url_slug, partner=partner).exists():
-                raise Exception(  # pylint: disable=broad-exception-raised
-                    _('Course creation was unsuccessful. The course URL slug ‘[{url_slug}]’ is already in '
-                      'use. Please update this field and try again.').format(url_slug=url_slug)
-                )
-
-        course = serializer.save(draft=True)
-        course.set_active_url_slug(url_slug)
-
-        organization = Organization.objects.get(key=course_creation_fields['org'])
-        course.authoring_organizations.add(organization)
-
-        collaborators_uuid = request.data.get('collaborators')
-        if collaborators_uuid:
-            collaborators = Collaborator.objects.filter(uuid__in=collaborators_uuid)
-            course.collaborators.add(*collaborators)
-
-        entitlement_types = course.type.entitlement_types.all()
-        prices = request.data.get('prices', {})
-        for entitlement_type in entitlement_types:
-            CourseEntitlement.objects.create(
-                course=course,
-                mode=entitlement_type,
-                partner=partner,
-                price=prices.get(entitlement_type.slug, 0),
-                draft=True,
-            )
-
-        CourseEditor.objects.create(
-            user=request.user,
-            course=course,
-        )
-
-        # We want to create the course run here so it is captured as part of the atomic transaction.
-        # Note: We have to send the request object as well because it is used for its metadata
-        # (like request.user and is set as part of the serializer context)
-        if course_run_creation_fields:
-            course_run_creation_fields.update({'course': course.key, 'prices': prices})
-            run_response = CourseRunViewSet().create_run_helper(course_run_creation_fields, request)
-            if run_response.status_code != 201:
-                raise Exception(str(run_response.data))  # pylint: disable=broad-exception-raised
-
+        course = services.create_course(request.data, request.user, request.site.partner)
+        serializer = self.get_serializer(course)
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
-    def update_entitlement(self, course, entitlement_type, price, partial=False):
-        """
-        Finds and updates an existing entitlement from the incoming data, with verification.
-
-        Will create an entitlement if we're switching from Audit.
-        Returns a tuple of (CourseEntitlement, bool) where the second value is whether the entitlement changed.
-        """
-        entitlement = CourseEntitlement.everything.filter(course=course, draft=models.Value(1)).first()
-        existing_slug = entitlement.mode.slug if entitlement else Seat.AUDIT
-
-        # We want to allow upgrading an entitlement from Audit -> Verified, but allow no other
-        # entitlement type changes. We use the official version existing as an indicator for
-        # ecom products having already been created.
-        entitlement_type_switch_whitelist = {Seat.AUDIT: Seat.VERIFIED}
-        if (course.official_version and existing_slug != entitlement_type.slug and
-                entitlement_type_switch_whitelist.get(existing_slug) != entitlement_type.slug):
-            raise ValidationError(_('Switching entitlement types after being reviewed is not supported. Please reach '
-                                    'out to your project coordinator for additional help if necessary.'))
-
-        if entitlement:
-            data = {'mode': entitlement_type.slug, 'price': price}
-            serializer = CourseEntitlementSerializer(entitlement, data=data, partial=partial)
-            serializer.is_valid(raise_exception=True)
-            return serializer.save(), entitlement.price != float(price)
-        else:
-            return (CourseEntitlement.objects.create(
-                course=course,
-                mode=entitlement_type,
-                partner=course.partner,
-                price=price,
-                draft=True,
-            ), True)
-
-    def log_request_subjects_and_prices(self, data, course):  # pragma: no cover
-        req_subjects = ', '.join(data.get('subjects', []))
-        current_subjects = ', '.join(list(map(lambda s: s.slug, course.subjects.all())))
-        prices = data.get('prices', {})
-        logger.info(
-            'UPDATE to course uuid - {uuid}, req subjects - [{req_subjects}], request prices - {prices}, '  # lint-amnesty, pylint: disable=logging-format-interpolation
-            'current subjects - [{current_subjects}]'.format(uuid=data.get('uuid'), req_subjects=req_subjects,
-                                                             prices=prices, current_subjects=current_subjects)
-        )
-
     @writable_request_wrapper
-    def update_course(self, data, partial=False):  # pylint: disable=too-many-statements
+    def update_course(self, data, partial=False):
         """ Updates an existing course from incoming data. """
         # logging to help debug error around course url slugs incrementing
         logger.info('The raw course data coming from publisher is {}.'.format(data))  # lint-amnesty, pylint: disable=logging-format-interpolation
 
-        changed = False
-        # Sending draft=False means the course data is live and updates should be pushed out immediately
-        draft = data.pop('draft', True)
-        image_data = data.pop('image', None)
-        org_logo_override_image = data.pop('organization_logo_override', None)
-        video_data = data.pop('video', None)
-        url_slug = data.pop('url_slug', '')
-
-        # Get and validate object serializer
-        course = self.get_object()
-        course = ensure_draft_world(course)  # always work on drafts
-        serializer = self.get_serializer(course, data=data, partial=partial)
-        serializer.is_valid(raise_exception=True)
-
-        # TEMPORARY - log incoming request (subject and prices) for all course updates, see Jira DISCO-1593
-        self.log_request_subjects_and_prices(data, course)
-
-        # First, update course entitlements
-        if data.get('type') or data.get('prices'):
-            entitlements = []
-            prices = data.get('prices', {})
-            course_type = CourseType.objects.get(uuid=data.get('type')) if data.get('type') else course.type
-            entitlement_types = course_type.entitlement_types.all()
-            for entitlement_type in entitlement_types:
-                price = prices.get(entitlement_type.slug)
-                if price is None:
-                    continue
-                entitlement, did_change = self.update_entitlement(course, entitlement_type, price, partial=partial)
-                entitlements.append(entitlement)
-                changed = changed or did_change
-            # Deleting entitlements here since they would be orphaned otherwise.
-            # One example of how this situation can happen is if a course team is switching between
-            # "Verified and Audit" and "Audit Only" before actually publishing their course run.
-            course.entitlements.exclude(mode__in=entitlement_types).delete()
-            course.entitlements.set(entitlements)
-
-            # If entitlement has changed, get updated course object from DB that has new value for
-            # data modified timestamp.
-            if changed:
-                course.refresh_from_db()
-
-        # Save video if a new video source is provided, also allow removing the video from course
-        if video_data:
-            video_url = video_data.get('src')
-            if not video_url and course.video:
-                course.video = None
-            elif video_url and (not course.video or video_url != course.video.src):
-                video, __ = Video.objects.get_or_create(src=video_data['src'])
-                course.video = video
-
-        # Save image and convert to the correct format
-        if image_data and isinstance(image_data, str) and image_data.startswith('data:image'):
-            # base64 encoded image - decode
-            img_name, img_data = decode_image_data(image_data)
-            course.image.save(img_name, img_data)
-
-        # Save organization logo override and convert to the correct format
-        if org_logo_override_image and isinstance(org_logo_override_image, str) \
-                and org_logo_override_image.startswith('data:image'):
-            img_name, img_data = decode_image_data(org_logo_override_image)
-            course.organization_logo_override.save(img_name, img_data)
-
-        # If price didn't change, check the other fields on the course
-        # (besides image and video, they are popped off above)
-        changed_fields = reviewable_data_has_changed(
-            course,
-            serializer.validated_data.items(),
-            Course.STATUS_CHANGE_EXEMPT_FIELDS
-        )
-        changed = changed or bool(changed_fields)
-
-        if url_slug:
-            validators.validate_slug(url_slug)
-            all_course_historical_slugs_excluding_present = CourseUrlSlug.objects.filter(
-                url_slug=url_slug, partner=course.partner).exclude(course__uuid=course.uuid)
-            if all_course_historical_slugs_excluding_present.exists():
-                raise Exception(  # pylint: disable=broad-exception-raised
-                    _('Course edit was unsuccessful. The course URL slug ‘[{url_slug}]’ is already in use. '
-                      'Please update this field and try again.').format(url_slug=url_slug))
-
-        # Then the course itself
-        course = serializer.save()
-        if url_slug:
-            course.set_active_url_slug(url_slug)
-            if course.official_version and (not draft or self._is_course_run_reviewed(course)):
-                course.official_version.set_active_url_slug(url_slug)
-
-        if not draft:
-            for course_run in course.active_course_runs:
-                if course_run.status == CourseRunStatus.Published:
-                    # This will also update the course
-                    course_run.update_or_create_official_version()
-                    CourseRunViewSet.update_course_run_image_in_studio(course_run)
-
-                    if settings.FIRE_UPDATE_COURSE_SKILLS_SIGNAL:
-                        # If a skills relavant course field is updated than fire signal
-                        # so that a background task in taxonomy update the course skills
-                        if any(field in COURSE_FIELDS_FOR_SKILLS for field in changed_fields):
-                            logger.info('Signal fired to update course skills. Course: [%s]', course.uuid)
-                            UPDATE_COURSE_SKILLS.send(self.__class__, course_uuid=course.uuid)
-
-        # Revert any Reviewed course runs back to Unpublished
-        if changed:
-            for course_run in course.course_runs.filter(status=CourseRunStatus.Reviewed):
-                course_run.status = CourseRunStatus.Unpublished
-                course_run.save()
-                course_run.official_version.status = CourseRunStatus.Unpublished
-                course_run.official_version.save()
+        course = services.update_course(self.get_object(), data, partial=partial)
 
         # hack to get the correctly-updated url slug into the response
         return_dict = {'url_slug': course.active_url_slug}
-        return_dict.update(serializer.data)
+        return_dict.update(self.get_serializer(course).data)
         return Response(return_dict)
 
-    def _is_course_run_reviewed(self, course):
-        """ Checks if any course run for a course is in reviewed state """
-        return course.course_runs.filter(status=CourseRunStatus.Reviewed).exists()
-
     def update(self, request, *_args, **_kwargs):
         """ Update details for a course. """
         return self.update_course(request.data, partial=False)
@@ -28,6 +28,10 @@ class PersonViewSet(CompressedCacheResponseMixin, viewsets.ModelViewSet):
     pagination_class = PageNumberPagination
     metadata_class = MetadataWithRelatedChoices
     metadata_related_choices_whitelist = ('organization',)
+    cache_tag_family = 'person'
+    cache_tag_uuid_paths = {
+        'person': ('uuid',),
+    }
 
     def create(self, request, *args, **kwargs):
         """
@@ -23,6 +23,12 @@ class ProgramViewSet(CompressedCacheResponseMixin, viewsets.ReadOnlyModelViewSet
     permission_classes = (IsAuthenticated,)
     filter_backends = (DjangoFilterBackend, rest_framework_filters.OrderingFilter)
     filterset_class = filters.ProgramFilter
+    cache_tag_family = 'program'
+    cache_tag_uuid_paths = {
+        'program': ('uuid',),
+        'course': ('courses.uuid',),
+        'person': ('staff.uuid', 'instructor_ordering.uuid'),
+    }
 
     # Explicitly support PageNumberPagination and LimitOffsetPagination. Future
     # versions of this API should only support the system default, PageNumberPagination.
@@ -46,7 +52,9 @@ class ProgramViewSet(CompressedCacheResponseMixin, viewsets.ReadOnlyModelViewSet
             queryset = Program.objects.filter(uuid=program_uuid)
         elif q:
             queryset = Program.search(q, queryset=queryset)
-        return self.get_serializer_class().prefetch_queryset(queryset=queryset, partner=partner)
+        serializer_class = self.get_serializer_class()
+        queryset = serializer_class.prefetch_queryset(queryset=queryset, partner=partner)
+        return serializer_class.plan_prefetch_queryset(queryset, self.request)
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
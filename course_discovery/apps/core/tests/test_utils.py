@@ -1,7 +1,14 @@
+import datetime
+
+import pytest
+import pytz
+from django.core.management import CommandError
 from django.db import models
 from django.test import TestCase
 
-from course_discovery.apps.core.utils import SearchQuerySetWrapper, delete_orphans, get_all_related_field_names
+from course_discovery.apps.core.utils import (
+    DEFAULT_INCREMENTAL_WINDOW, SearchQuerySetWrapper, delete_orphans, get_all_related_field_names, parse_since
+)
 from course_discovery.apps.course_metadata.models import Video
 from course_discovery.apps.course_metadata.search_indexes.documents import CourseRunDocument
 from course_discovery.apps.course_metadata.tests.factories import CourseRunFactory, VideoFactory
@@ -79,3 +86,20 @@ class SearchQuerySetWrapperTests(TestCase):
 
     def test_getitem(self):
         assert self.course_runs[0] == self.wrapper[0]
+
+
+class ParseSinceTests(TestCase):
+    def test_parse_since(self):
+        """ Verify datetimes are UTC unless an offset is given. """
+        assert parse_since('2024-01-31T12:00:00') == datetime.datetime(2024, 1, 31, 12, tzinfo=pytz.UTC)
+        assert parse_since('2024-01-31T12:00:00+01:00') == datetime.datetime(2024, 1, 31, 11, tzinfo=pytz.UTC)
+
+    def test_parse_since_default(self):
+        """ Verify the default incremental window is used when no datetime is given. """
+        since = parse_since(None)
+        expected = datetime.datetime.now(pytz.UTC) - DEFAULT_INCREMENTAL_WINDOW
+        assert abs(since - expected) < datetime.timedelta(minutes=1)
+
+    def test_parse_since_invalid(self):
+        with pytest.raises(CommandError):
+            parse_since('yesterday')
@@ -3,12 +3,18 @@ import logging
 import re
 from collections import namedtuple
 
+import pytz
 from django.conf import settings
+from django.core.management import CommandError
+from django.utils.dateparse import parse_datetime
 from django_elasticsearch_dsl import Index
 
 IndexMeta = namedtuple("IndexMeta", "name alias")
 logger = logging.getLogger(__name__)
 
+# How far back incremental updates of the search indices look for changed objects when --since is not given.
+DEFAULT_INCREMENTAL_WINDOW = datetime.timedelta(days=1)
+
 INDEX_ALIAS_REGEX = re.compile(r'^(\w+)(?=[_]\d{8}[_]\d{6})')
 INDEX_ALIAS_SLICE = slice(0, -16)
 # Any elasticsearch index name for a django model has two parts:
@@ -24,6 +30,22 @@ def serialize_datetime(d):
     return d.strftime('%Y-%m-%dT%H:%M:%SZ') if d else None
 
 
+def parse_since(value):
+    """
+    Return the datetime given to the --since option of the commands updating the search indices incrementally,
+    UTC unless an offset is given, or DEFAULT_INCREMENTAL_WINDOW ago if none was given.
+    """
+    if not value:
+        return datetime.datetime.now(pytz.UTC) - DEFAULT_INCREMENTAL_WINDOW
+
+    since = parse_datetime(value) if isinstance(value, str) else value
+    if since is None:
+        raise CommandError('Invalid --since datetime [{}]. Use ISO 8601, e.g. 2021-01-31T12:00:00.'.format(value))
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=pytz.UTC)
+    return since
+
+
 class ElasticsearchUtils:
 
     @staticmethod
@@ -0,0 +1,118 @@
+"""
+In memory stand-in for the Algolia API client, to run and benchmark indexing offline.
+
+Only the calls algoliasearch_django and the product indices make are implemented.
+
+Usage:
+    index = ProductMetaIndex(AlgoliaProxyProduct, LocalAlgoliaClient(), algoliasearch_django.settings.SETTINGS)
+    index.reindex_all()
+"""
+from collections import Counter
+
+
+# The signatures of the Algolia client are kept, though most options make no sense in memory.
+# pylint: disable=unused-argument
+class LocalAlgoliaIndex:
+    """
+    In memory Algolia index, which counts the requests made to it.
+    """
+
+    def __init__(self, client, index_name):
+        self.client = client
+        self.index_name = index_name
+        self.objects = {}
+        self.settings = {}
+        self.rules = {}
+        self.synonyms = {}
+        # method name: number of calls
+        self.requests = Counter()
+
+    def _task(self, method):
+        self.requests[method] += 1
+        return {'taskID': 0}
+
+    def save_objects(self, objects, request_options=None):
+        for obj in objects:
+            self.objects[obj['objectID']] = dict(obj)
+        return self._task('save_objects')
+
+    def partial_update_objects(self, objects, no_create=False, request_options=None):
+        for obj in objects:
+            existing = self.objects.get(obj['objectID'])
+            if existing is None and no_create:
+                continue
+            self.objects[obj['objectID']] = {**(existing or {}), **obj}
+        return self._task('partial_update_objects')
+
+    def delete_objects(self, objects, request_options=None):
+        for object_id in objects:
+            self.objects.pop(object_id, None)
+        return self._task('delete_objects')
+
+    def clear_index(self, request_options=None):
+        self.objects = {}
+        return self._task('clear_index')
+
+    def get_settings(self, request_options=None):
+        self.requests['get_settings'] += 1
+        return dict(self.settings)
+
+    def set_settings(self, settings, forward_to_slaves=True, forward_to_replicas=None,
+                     request_options=None):
+        self.settings = dict(settings)
+        return self._task('set_settings')
+
+    def wait_task(self, task_id, time_before_retry=100, request_options=None):
+        return {'status': 'published'}
+
+    def iter_rules(self, hits_per_page=1000, request_options=None):
+        self.requests['iter_rules'] += 1
+        return iter(list(self.rules.values()))
+
+    def iter_synonyms(self, hits_per_page=1000, request_options=None):
+        self.requests['iter_synonyms'] += 1
+        return iter(list(self.synonyms.values()))
+
+    def replace_all_rules(self, rules, request_options=None):
+        self.rules = {rule['objectID']: rule for rule in rules}
+        return self._task('replace_all_rules')
+
+    def batch_rules(self, rules, forward_to_replicas=False, clear_existing_rules=False,
+                    request_options=None):
+        if clear_existing_rules:
+            self.rules = {}
+        self.rules.update((rule['objectID'], rule) for rule in rules)
+        return self._task('batch_rules')
+
+    def batch_synonyms(self, synonyms, forward_to_slaves=False, replace_existing_synonyms=False,
+                       forward_to_replicas=False, request_options=None):
+        if replace_existing_synonyms:
+            self.synonyms = {}
+        self.synonyms.update((synonym['objectID'], synonym) for synonym in synonyms)
+        return self._task('batch_synonyms')
+
+
+class LocalAlgoliaClient:
+    """
+    In memory Algolia client, whose indices live as long as the client.
+    """
+
+    def __init__(self):
+        self.indices = {}
+
+    def init_index(self, index_name):
+        if index_name not in self.indices:
+            self.indices[index_name] = LocalAlgoliaIndex(self, index_name)
+        return self.indices[index_name]
+
+    def move_index(self, src_index_name, dst_index_name, request_options=None):
+        """
+        Replace the destination index with the source index, which is left empty, as Algolia does.
+        """
+        source = self.init_index(src_index_name)
+        destination = self.init_index(dst_index_name)
+        destination.objects, source.objects = source.objects, {}
+        destination.settings, source.settings = source.settings, {}
+        destination.rules, source.rules = source.rules, {}
+        destination.synonyms, source.synonyms = source.synonyms, {}
+        return {'taskID': 0}
@@ -1,9 +1,11 @@
 import datetime
+import functools
 import itertools
 
 import pytz
 from django.conf import settings
 from django.db import models
+from django.utils.translation import get_language
 from django.utils.translation import gettext as _
 from django.utils.translation import override
 from sortedm2m.fields import SortedManyToManyField
@@ -24,6 +26,38 @@ ALGOLIA_EMPTY_LIST = ['null']
 ALGOLIA_DEFAULT_GEO_COORDINATES = 38.951302, -76.873100
 
 
+# Algolia fields whose values depend on the language of the index. Other fields are computed once per product and
+# shared by the English and Spanish indices.
+TRANSLATED_FIELDS = {'availability_level', 'subject_names', 'levels', 'active_languages', 'program_types'}
+
+
+class memoized_when_indexing(property):
+    '''
+    Decorator turning a method of a proxy course or program into a property, which is computed once per product
+    while the product is wrapped by AlgoliaProxyProduct, and once per language for TRANSLATED_FIELDS.
+
+    Outside of indexing, the property is computed every time it is read, like any other. It subclasses property,
+    like django.utils.functional.cached_property, so that linters infer the values of the properties.
+    '''
+
+    def __init__(self, method):
+        name = method.__name__
+        translated = name in TRANSLATED_FIELDS
+
+        @functools.wraps(method)
+        def _wrapper(instance):
+            memo = getattr(instance, 'algolia_memo', None)
+            if memo is None:
+                return method(instance)
+
+            key = (name, get_language()) if translated else name
+            if key not in memo:
+                memo[key] = method(instance)
+            return memo[key]
+
+        super().__init__(_wrapper)
+
+
 # Utility methods used by both courses and programs
 def get_active_language_tag(course):
     if course.advertised_course_run and course.advertised_course_run.language:
@@ -79,7 +113,9 @@ def delegate_attributes(cls):
     for field in fields:
         def _closure(name):
             def _wrap(self, *args, **kwargs):
-                with override(getattr(self.product, 'language', 'en')):
+                if name not in TRANSLATED_FIELDS:
+                    return getattr(self.product, name, None)
+                with override(self.language):
                     return getattr(self.product, name, None)
             return _wrap
         setattr(cls, field, _closure(field))
@@ -87,7 +123,8 @@ def delegate_attributes(cls):
 
 
 def get_course_availability(course):
-    all_runs = course.course_runs.filter(status=CourseRunStatus.Published)
+    # Filter the course_runs in python, to avoid duplicate queries for course_runs after prefetching
+    all_runs = [course_run for course_run in course.course_runs.all() if course_run.status == CourseRunStatus.Published]
     availability = set()
 
     for course_run in all_runs:
@@ -127,7 +164,10 @@ class AlgoliaProxyProduct(Program):
     def __init__(self, product, language='en', contentful_data=None):
         super().__init__()
         self.product = product
-        self.product.language = language
+        self.language = language
+        # Shared by the wrappers of the product for every language it is indexed in, see memoized_when_indexing.
+        if getattr(product, 'algolia_memo', None) is None:
+            product.algolia_memo = {}
         product_uuid = str(product.uuid)
 
         if contentful_data and product_uuid in contentful_data:
@@ -244,7 +284,7 @@ class AlgoliaProxyCourse(Course, AlgoliaBasicModelFieldsMixin):
     def tertiary_description(self):
         return self.full_description
 
-    @property
+    @memoized_when_indexing
     def active_languages(self):
         language = get_active_language(self)
         if language:
@@ -263,30 +303,30 @@ class AlgoliaProxyCourse(Course, AlgoliaBasicModelFieldsMixin):
     def active_run_type(self):
         return getattr(self.advertised_course_run, 'type', None)
 
-    @property
+    @memoized_when_indexing
     def availability_level(self):
         return get_course_availability(self)
 
     @property
     def partner_names(self):
-        return [org['name'] for org in get_owners(self)]
+        return [org['name'] for org in self.owners]
 
     @property
     def partner_keys(self):
-        return [org['key'] for org in get_owners(self)]
+        return [org['key'] for org in self.owners]
 
-    @property
+    @memoized_when_indexing
     def levels(self):
         level = getattr(self.level_type, 'name_t', None)
         if level:
             return [level]
         return None
 
-    @property
+    @memoized_when_indexing
     def subject_names(self):
         return [subject.name for subject in self.subjects.all()]
 
-    @property
+    @memoized_when_indexing
     def program_types(self):
         return [program.type.name_t for program in self.programs.all()]
 
@@ -308,24 +348,24 @@ class AlgoliaProxyCourse(Course, AlgoliaBasicModelFieldsMixin):
     def product_max_effort(self):
         return getattr(self.advertised_course_run, 'max_effort', None)
 
-    @property
+    @memoized_when_indexing
     def owners(self):
         return get_owners(self)
 
-    @property
+    @memoized_when_indexing
     def staff_slugs(self):
         staff = [course_run.staff.all() for course_run in self.active_course_runs]
         staff = itertools.chain.from_iterable(staff)
         return list({person.slug for person in staff})
 
-    @property
+    @memoized_when_indexing
     def promoted_in_spanish_index(self):
         language_tag = get_active_language_tag(self)
         if language_tag:
             return language_tag.code.startswith('es')
         return False
 
-    @property
+    @memoized_when_indexing
     def tags(self):
         return list(self.topics.names())
 
@@ -362,7 +402,7 @@ class AlgoliaProxyCourse(Course, AlgoliaBasicModelFieldsMixin):
     def product_external_url(self):
         return self.additional_metadata.external_url if self.additional_metadata else None
 
-    @property
+    @memoized_when_indexing
     def should_index(self):
         """Only index courses in the edX catalog with a non-hidden advertiseable course run, at least one owner, and
         a marketing url slug"""
@@ -382,7 +422,7 @@ class AlgoliaProxyCourse(Course, AlgoliaBasicModelFieldsMixin):
                 bool(self.advertised_course_run) and
                 not self.advertised_course_run.hidden)
 
-    @property
+    @memoized_when_indexing
     def should_index_spanish(self):
         if self.product_source and is_excluded_product_sources_check(self.product_source.slug):
             return False
@@ -390,14 +430,14 @@ class AlgoliaProxyCourse(Course, AlgoliaBasicModelFieldsMixin):
         return (self.should_index and
                 self.type.slug != CourseType.BOOTCAMP_2U)
 
-    @property
+    @memoized_when_indexing
     def skills(self):
         skills_data = get_whitelisted_serialized_skills(self.key, ProductTypes.Course)
         if not skills_data:
             return ALGOLIA_EMPTY_LIST
         return transform_skills_data(skills_data)
 
-    @property
+    @memoized_when_indexing
     def availability_rank(self):
         today_midnight = datetime.datetime.now(pytz.UTC).replace(hour=0, minute=0, second=0, microsecond=0)
         if self.advertised_course_run:
@@ -481,7 +521,7 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
     def product_max_effort(self):
         return self.max_hours_effort_per_week
 
-    @property
+    @memoized_when_indexing
     def subject_names(self):
         if self.primary_subject_override:
             return [self.primary_subject_override.name]
@@ -489,19 +529,19 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
 
     @property
     def partner_names(self):
-        return [org['name'] for org in get_owners(self)]
+        return [org['name'] for org in self.owners]
 
     @property
     def partner_keys(self):
-        return [org['key'] for org in get_owners(self)]
+        return [org['key'] for org in self.owners]
 
-    @property
+    @memoized_when_indexing
     def levels(self):
         if self.level_type_override:
             return [getattr(self.level_type_override, 'name_t', None)]
         return list(dict.fromkeys([getattr(course.level_type, 'name_t', None) for course in self.courses.all()]))
 
-    @property
+    @memoized_when_indexing
     def active_languages(self):
         if self.language_override:
             return [self.language_override.get_search_facet_display(translate=True)]
@@ -511,11 +551,11 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
     def expected_learning_items_values(self):
         return [item.value for item in self.expected_learning_items.all()]
 
-    @property
+    @memoized_when_indexing
     def owners(self):
         return get_owners(self)
 
-    @property
+    @memoized_when_indexing
     def staff_slugs(self):
         return [person.slug for person in self.staff]
 
@@ -523,13 +563,13 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
     def course_titles(self):
         return [course.title for course in self.courses.all()]
 
-    @property
+    @memoized_when_indexing
     def program_types(self):
         if self.type:
             return [self.type.name_t]
         return None
 
-    @property
+    @memoized_when_indexing
     def tags(self):
         topics = [topic.name for topic in self.topics]
         labels = [label.name for label in self.labels.all()]
@@ -561,7 +601,7 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
         else:
             return getattr(self.degree, 'display_on_org_page', False)
 
-    @property
+    @memoized_when_indexing
     def availability_level(self):
         # Master's and 2U programs don't have courses in the same way that our other programs do.
         # We got confirmation from masters POs that we should make masters Programs always
@@ -585,7 +625,7 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
 
         return list(availability)
 
-    @property
+    @memoized_when_indexing
     def promoted_in_spanish_index(self):
         if self.language_override and self.language_override.code.startswith('es'):
             return True
@@ -593,7 +633,7 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
         all_course_languages = [tag for tag in all_course_languages if tag is not None]
         return any(tag.code.startswith('es') for tag in all_course_languages)
 
-    @property
+    @memoized_when_indexing
     def should_index(self):
         # marketing_url and program_type should never be null, but include as a sanity check
         return (len(self.owners) > 0 and
@@ -604,14 +644,14 @@ class AlgoliaProxyProgram(Program, AlgoliaBasicModelFieldsMixin):
                 self.partner.name == 'edX' and
                 not self.hidden)
 
-    @property
+    @memoized_when_indexing
     def skills(self):
         skills_data = get_whitelisted_serialized_skills(self.uuid, ProductTypes.Program)
         if not skills_data:
             return ALGOLIA_EMPTY_LIST
         return transform_skills_data(skills_data)
 
-    @property
+    @memoized_when_indexing
     def should_index_spanish(self):
         return self.should_index
 
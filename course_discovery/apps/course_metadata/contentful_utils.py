@@ -1,14 +1,34 @@
 """
 Contains all utility functions for Contentful.
 """
+import json
 import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from contentful import Client
+from contentful import Client, Entry
+from contentful.errors import BadRequestError, HTTPError
 from django.conf import settings
 from django.core.cache import cache
+from requests.exceptions import RequestException
 
 logger = logging.getLogger(__name__)
 
+# Number of entries requested per Contentful call. It is halved as long as Contentful answers
+# that the response is too big, since entries are fetched with the entries they link to.
+CONTENTFUL_PAGE_SIZE = 100
+# Number of Contentful calls made concurrently.
+CONTENTFUL_MAX_WORKERS = 4
+# The depth of linked entries to be fetched from Contentful.
+CONTENTFUL_INCLUDE_DEPTH = 5
+# Version of the data transformed from Contentful kept in snapshots. Bump it whenever the transformation
+# changes, so that snapshots of the previous version are rebuilt.
+CONTENTFUL_SNAPSHOT_VERSION = 2
+# Name of the snapshot file, in CONTENTFUL_SNAPSHOT_DIR.
+CONTENTFUL_SNAPSHOT_FILE_NAME = 'contentful.json'
+
 
 def get_contentful_cache_key(content_type):
     """
@@ -22,11 +42,87 @@ def get_contentful_cache_key(content_type):
         return None
 
 
+def get_contentful_client():
+    return Client(
+        settings.CONTENTFUL_SPACE_ID,
+        settings.CONTENTFUL_CONTENT_DELIVERY_API_KEY,
+        environment=settings.CONTENTFUL_ENVIRONMENT,
+        timeout_s=30  # increases read timeout
+    )
+
+
+def is_response_too_big(error):
+    return 'Response size too big' in str(error)
+
+
+def fetch_contentful_entries_page(client, content_type, skip, limit):
+    """
+    Fetch `limit` entries of the content_type from the `skip`th one, splitting the request in halves as long as
+    Contentful answers that the response is too big.
+    """
+    try:
+        contentful_entries = client.entries({
+            'content_type': content_type,
+            'limit': limit,
+            'skip': skip,
+            'include': CONTENTFUL_INCLUDE_DEPTH
+        })
+    except BadRequestError as error:
+        if limit == 1 or not is_response_too_big(error):
+            raise
+        half = limit // 2
+        return (
+            fetch_contentful_entries_page(client, content_type, skip, half) +
+            fetch_contentful_entries_page(client, content_type, skip + half, limit - half)
+        )
+
+    logger.info(f'Successfully fetched Contentful Entries from {skip + 1} to {skip + len(contentful_entries.items)}')
+    return list(contentful_entries.items)
+
+
+def fetch_contentful_entries(client, content_type):
+    """
+    Fetch all the entries of the content_type from Contentful, with the entries they link to.
+
+    The first page tells how many entries there are, and the size of the pages Contentful accepts to return.
+    The other pages are then fetched concurrently.
+    """
+    limit = CONTENTFUL_PAGE_SIZE
+    while True:
+        try:
+            contentful_entries = client.entries({
+                'content_type': content_type,
+                'limit': limit,
+                'include': CONTENTFUL_INCLUDE_DEPTH
+            })
+            break
+        except BadRequestError as error:
+            if limit == 1 or not is_response_too_big(error):
+                raise
+            limit //= 2
+            logger.info(f'Contentful response too big, fetching {limit} entries per call for [{content_type}]')
+
+    total_entries = list(contentful_entries.items)
+    total_count = contentful_entries.total
+    logger.info(f'Fetching a total of {total_count} Contentful Entries for Content Type [{content_type}]')
+    logger.info(f'Successfully fetched Contentful Entries from 1 to {len(total_entries)}')
+
+    with ThreadPoolExecutor(max_workers=CONTENTFUL_MAX_WORKERS) as executor:
+        pages = executor.map(
+            lambda skip: fetch_contentful_entries_page(client, content_type, skip, limit),
+            range(limit, total_count, limit),
+        )
+        for page in pages:
+            total_entries.extend(page)
+
+    return total_entries
+
+
 def get_data_from_contentful(content_type):
     """
     Utility function to get data from Contentful. Returns contentful entries of the content_type.
-    Since fetching all objects results in a large amount of data, it gives us `Response size too big` error.
-    We're fetching 10 objects per Contentful Client call and returning an appended response.
+    Since fetching all objects at once results in a large amount of data, it gives us `Response size too big` error.
+    Entries are fetched in pages, see fetch_contentful_entries, and the appended response is cached for a day.
 
     Args:
         content_type (str): Contentful table-like instance comprised of fields.
@@ -38,38 +134,7 @@ def get_data_from_contentful(content_type):
         logger.info(f"Using cached Contentful entries data and skipping API call for {content_type}")
         return cached_entries
 
-    client = Client(
-        settings.CONTENTFUL_SPACE_ID,
-        settings.CONTENTFUL_CONTENT_DELIVERY_API_KEY,
-        environment=settings.CONTENTFUL_ENVIRONMENT,
-        timeout_s=30  # increases read timeout
-    )
-    limit = 10
-    skip = 10
-    include = 5  # the depth of linked entries to be fetched from contentful
-    total_entries = []
-    contentful_entries = client.entries({
-        'content_type': content_type,
-        'limit': limit,
-        'include': include
-    })
-    total_entries.extend(contentful_entries.items)
-    total_count = contentful_entries.total
-    logger.info(f'Fetching a total of {total_count} Contentful Entries for Content Type [{content_type}]')
-    logger.info(f'Successfully fetched Contentful Entries from 1 to {skip}')
-
-    while skip < total_count:
-        contentful_entries = client.entries({
-            'content_type': content_type,
-            'limit': limit,
-            'skip': skip,
-            'include': include
-        })
-        if contentful_entries:
-            total_entries.extend(contentful_entries.items)
-            logger.info(f'Successfully fetched Contentful Entries from {skip + 1} to '
-                        f'{skip + limit if skip + limit < total_count else total_count}')
-            skip += limit
+    total_entries = fetch_contentful_entries(get_contentful_client(), content_type)
 
     # cache contentful API response for one day
     cache.set(cache_key, total_entries, timeout=60 * 60 * 24)
@@ -77,6 +142,136 @@ def get_data_from_contentful(content_type):
     return total_entries
 
 
+def sync_contentful(client, sync_token=None):
+    """
+    Ask the Contentful Sync API which entries or assets of the space changed since the sync token was issued.
+
+    Without a sync token, an initial synchronization of the space is made to get one.
+
+    Returns:
+        (tuple): The content types of the changed entries, or None if assets or deleted entries changed, which
+        entries of any content type may link to, and the sync token to ask for the next changes with.
+    """
+    page = client.sync({'sync_token': sync_token} if sync_token else {'initial': True})
+    changed_content_types = set()
+    while True:
+        for item in page.items:
+            if changed_content_types is None:
+                break
+            if isinstance(item, Entry):
+                changed_content_types.add(item.sys['content_type'].id)
+            else:
+                changed_content_types = None
+        if not page.next_page_url:
+            return changed_content_types, page.next_sync_token
+        page = page.next(client)
+
+
+def get_linked_content_types(value):
+    """
+    Return the content types of the entries found in value, and of the entries they link to.
+    """
+    content_types = set()
+    seen = set()
+    values = [value]
+    while values:
+        value = values.pop()
+        if isinstance(value, Entry):
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            content_types.add(value.sys['content_type'].id)
+            values.extend(value.fields().values())
+        elif isinstance(value, dict):
+            # Rich text fields embed entries in their nodes.
+            values.extend(value.values())
+        elif isinstance(value, list):
+            values.extend(value)
+    return content_types
+
+
+def read_contentful_snapshot(path):
+    """
+    Return the snapshot stored at path, or an empty snapshot if there is none of the current version.
+    """
+    empty_snapshot = {'sync_token': None, 'synced': 0, 'content_types': {}}
+    try:
+        with open(path) as snapshot_file:
+            snapshot = json.load(snapshot_file)
+    except (OSError, ValueError):
+        return empty_snapshot
+
+    if snapshot.get('version') != CONTENTFUL_SNAPSHOT_VERSION:
+        return empty_snapshot
+    return snapshot
+
+
+def write_contentful_snapshot(path, snapshot):
+    """
+    Store a snapshot at path, replacing the previous one at once so that other processes never read half of it.
+    """
+    snapshot_dir = os.path.dirname(path)
+    os.makedirs(snapshot_dir, exist_ok=True)
+    fd, temporary_path = tempfile.mkstemp(dir=snapshot_dir, suffix='.tmp')
+    with os.fdopen(fd, 'w') as snapshot_file:
+        json.dump({**snapshot, 'version': CONTENTFUL_SNAPSHOT_VERSION}, snapshot_file)
+    os.replace(temporary_path, path)
+
+
+def sync_contentful_snapshot(client, snapshot):
+    """
+    Mark the content types of a snapshot whose entries, or the entries they link to, changed since it was synced
+    as stale, and return it with the sync token it is now up to date with.
+    """
+    changed_content_types, sync_token = sync_contentful(client, snapshot['sync_token'])
+    for content_type, content_type_snapshot in snapshot['content_types'].items():
+        if changed_content_types is None or changed_content_types & set(content_type_snapshot['linked_content_types']):
+            content_type_snapshot['stale'] = True
+        elif not content_type_snapshot['stale']:
+            logger.info(f'Contentful did not change since the last snapshot of [{content_type}]')
+    return {**snapshot, 'sync_token': sync_token, 'synced': time.time()}
+
+
+def get_transformed_contentful_data(content_type, transform):
+    """
+    Return the entries of the content_type transformed by the `transform` function.
+
+    When CONTENTFUL_SNAPSHOT_DIR is set, the transformed data of every content type is kept there in a snapshot
+    file shared by every process of the host, e.g. web workers and Algolia reindexes. Once the snapshot is older
+    than CONTENTFUL_SNAPSHOT_SYNC_INTERVAL seconds, the Sync API is asked once what changed since, and only the
+    content types whose entries, or the entries they link to, changed are fetched and transformed again. Should
+    Contentful fail to answer, the data of the snapshot is used.
+    """
+    if not settings.CONTENTFUL_SNAPSHOT_DIR:
+        return transform(get_data_from_contentful(content_type))
+
+    path = os.path.join(settings.CONTENTFUL_SNAPSHOT_DIR, CONTENTFUL_SNAPSHOT_FILE_NAME)
+    snapshot = read_contentful_snapshot(path)
+    client = None
+    try:
+        if time.time() - snapshot['synced'] >= settings.CONTENTFUL_SNAPSHOT_SYNC_INTERVAL:
+            client = get_contentful_client()
+            # Sync before fetching, so that changes made while fetching are caught by the next sync.
+            snapshot = sync_contentful_snapshot(client, snapshot)
+            write_contentful_snapshot(path, snapshot)
+
+        content_type_snapshot = snapshot['content_types'].get(content_type)
+        if content_type_snapshot is None or content_type_snapshot['stale']:
+            entries = fetch_contentful_entries(client or get_contentful_client(), content_type)
+            snapshot['content_types'][content_type] = {
+                'data': transform(entries),
+                'linked_content_types': sorted(get_linked_content_types(entries) | {content_type}),
+                'stale': False,
+            }
+            write_contentful_snapshot(path, snapshot)
+    except (HTTPError, RequestException):
+        if content_type not in snapshot['content_types']:
+            raise
+        logger.exception(f'Failed to refresh the Contentful data of [{content_type}], using its last snapshot')
+
+    return snapshot['content_types'][content_type]['data']
+
+
 def extract_plain_text_from_rich_text(rich_text_dict):
     """
     Recursive function to extract a list of values of all the keys containing plain text.
@@ -286,13 +481,21 @@ def get_placement_about_section_module(placement_about_section_module):
 
 
 def fetch_and_transform_bootcamp_contentful_data():
+    """
+    Returns the bootcamp data from contentful in algolia-usable form, see transform_bootcamp_contentful_data.
+    """
+    return get_transformed_contentful_data(
+        settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE, transform_bootcamp_contentful_data
+    )
+
+
+def transform_bootcamp_contentful_data(contentful_bootcamp_page_entries):
     """
     Transforms incoming bootcamp data from contentful to algolia-usable form.
 
     Each Contentful entry has seo, hero and modules list.
     Each rich text content field has been transformed into plain text using `rich_text_to_plain_text`.
     """
-    contentful_bootcamp_page_entries = get_data_from_contentful(settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE)
     transformed_bootcamp_data = {}
     for bootcamp_entry in contentful_bootcamp_page_entries:
         product_uuid = bootcamp_entry.uuid
@@ -390,14 +593,18 @@ def aggregate_contentful_data(data, product_uuid):
 
 
 def fetch_and_transform_degree_contentful_data():
+    """
+    Returns the degree data from contentful in algolia-usable form, see transform_degree_contentful_data.
+    """
+    return get_transformed_contentful_data(settings.DEGREE_CONTENTFUL_CONTENT_TYPE, transform_degree_contentful_data)
+
+
+def transform_degree_contentful_data(contentful_degree_page_entries):
     """
     Transforms incoming degree data from contentful to algolia-usable form.
 
     Each Contentful entry has seo, hero and modules list.
     """
-
-    contentful_degree_page_entries = get_data_from_contentful(settings.DEGREE_CONTENTFUL_CONTENT_TYPE)
-
     transformed_degree_data = {}
 
     for degree_entry in contentful_degree_page_entries:
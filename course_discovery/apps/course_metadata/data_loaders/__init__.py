@@ -1,9 +1,179 @@
 import abc
+import datetime
+import hashlib
+import json
+import logging
+import threading
+from collections import Counter
 
 from dateutil.parser import parse
+from django.utils import timezone
 from edx_rest_framework_extensions.auth.jwt.decoder import configured_jwt_decode_handler
 
-from course_discovery.apps.course_metadata.models import Image, Video
+from course_discovery.apps.course_metadata.models import DataLoaderCheckpoint, DataLoaderFingerprint, Image, Video
+
+logger = logging.getLogger(__name__)
+
+
+class PayloadFingerprints:
+    """
+    Fingerprints of the upstream data objects were last loaded from by a data loader, see DataLoaderFingerprint.
+
+    Loaders check `is_unchanged` before applying the data of an object, and `record` the data once applied.
+    Fingerprints older than `max_age` are ignored, so that every object is loaded again now and then, overwriting
+    any local change made to it since.
+    """
+
+    def __init__(self, partner, loader, max_age):
+        self.partner = partner
+        self.loader = loader
+        self.max_age = max_age
+        self.fingerprints = {}
+        self.counts = Counter()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_fingerprint(payload):
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def load(self):
+        """ Load the fingerprints recorded by the loader for the partner, and reset the counts. """
+        self.counts.clear()
+        self.fingerprints = dict(DataLoaderFingerprint.objects.filter(
+            partner=self.partner, loader=self.loader, modified__gte=timezone.now() - self.max_age,
+        ).values_list('key', 'fingerprint'))
+
+    def count(self, outcome):
+        with self.lock:
+            self.counts[outcome] += 1
+
+    def is_unchanged(self, key, payload):
+        """ Return True, counting the object as skipped, if its data didn't change since it was last recorded. """
+        unchanged = self.fingerprints.get(key) == self.get_fingerprint(payload)
+        if unchanged:
+            self.count('skipped')
+        return unchanged
+
+    def record(self, key, payload, created=False):
+        """ Record the data an object was loaded from, counting it as created or updated. """
+        fingerprint = self.get_fingerprint(payload)
+        if self.fingerprints.get(key) != fingerprint:
+            DataLoaderFingerprint.objects.update_or_create(
+                partner=self.partner, loader=self.loader, key=key, defaults={'fingerprint': fingerprint},
+            )
+            self.fingerprints[key] = fingerprint
+        self.count('created' if created else 'updated')
+
+    def log_counts(self):
+        logger.info(
+            '%s skipped %d unchanged objects, updated %d and created %d.',
+            self.loader, self.counts['skipped'], self.counts['updated'], self.counts['created'],
+        )
+
+
+class PageCheckpoints:
+    """
+    Pages of an upstream API a data loader completed during a run that did not complete, see DataLoaderCheckpoint.
+
+    Loaders skip the pages that `is_completed`, `record` each page once processed, and `clear` the checkpoints once
+    the whole run completed. Checkpoints older than `max_age` are discarded, so that a run is not resumed from pages
+    that may have shifted upstream since.
+    """
+
+    def __init__(self, partner, loader, max_age):
+        self.partner = partner
+        self.loader = loader
+        self.max_age = max_age
+        self.pages = set()
+        self.lock = threading.Lock()
+
+    def _get_queryset(self):
+        return DataLoaderCheckpoint.objects.filter(partner=self.partner, loader=self.loader)
+
+    def load(self):
+        """ Load the pages completed by the last run of the loader for the partner, if recent enough. """
+        self._get_queryset().filter(created__lt=timezone.now() - self.max_age).delete()
+        self.pages = set(self._get_queryset().values_list('page', flat=True))
+        if self.pages:
+            logger.info('%s is resuming its last run, skipping %d completed pages.', self.loader, len(self.pages))
+
+    def is_completed(self, page):
+        return page in self.pages
+
+    def record(self, page):
+        DataLoaderCheckpoint.objects.get_or_create(partner=self.partner, loader=self.loader, page=page)
+        with self.lock:
+            self.pages.add(page)
+
+    def clear(self):
+        """ Delete the checkpoints once a run completed, so that the next run starts over. """
+        self._get_queryset().delete()
+        self.pages = set()
+
+
+class ReferenceDataCache:
+    """
+    Reference data (organizations, types, subjects, languages...) a data loader looks up while ingesting.
+
+    Each lookup loads all the objects of a model matching `filters` at once, indexed by the value of `field`, so that
+    validating and ingesting rows doesn't query the database again. The default manager of the model is used, so that
+    course drafts are included. Loaders `clear` the cache at the start of each run, and `add` the objects they create.
+
+    Usage:
+        organization = cache.get(Organization, 'key', org_key)
+        subject = cache.get(Subject, 'translations__name', name, translations__language_code='en')
+        exists = cache.exists(Course, 'uuid', course_uuid)
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.values = {}
+
+    @staticmethod
+    def _get_index_key(model, field, filters):
+        return model, field, tuple(sorted(filters.items()))
+
+    @staticmethod
+    def _normalize(value):
+        # Lookups are case-insensitive, like the collation of the database columns.
+        return str(value).casefold()
+
+    def clear(self):
+        self.objects = {}
+        self.values = {}
+
+    def get(self, model, field, value, **filters):
+        """ Return the object of `model` matching `filters` whose `field` is `value`, or None. """
+        index_key = self._get_index_key(model, field, filters)
+        if index_key not in self.objects:
+            manager = model._default_manager  # pylint: disable=protected-access
+            pks = manager.filter(**filters).values_list(field, 'pk')
+            objects = manager.in_bulk({pk for __, pk in pks})
+            index = {}
+            for field_value, pk in pks:
+                index.setdefault(self._normalize(field_value), objects[pk])
+            self.objects[index_key] = index
+        return self.objects[index_key].get(self._normalize(value))
+
+    def exists(self, model, field, value, **filters):
+        """ Return True if an object of `model` matching `filters` has `value` for `field`. """
+        index_key = self._get_index_key(model, field, filters)
+        if index_key in self.objects:
+            return self._normalize(value) in self.objects[index_key]
+        if index_key not in self.values:
+            manager = model._default_manager  # pylint: disable=protected-access
+            field_values = manager.filter(**filters).values_list(field, flat=True)
+            self.values[index_key] = {self._normalize(field_value) for field_value in field_values}
+        return self._normalize(value) in self.values[index_key]
+
+    def add(self, model, field, obj, **filters):
+        """ Add an object created by the loader to the lookups of `model` by `field` already loaded. """
+        index_key = self._get_index_key(model, field, filters)
+        value = self._normalize(getattr(obj, field))
+        if index_key in self.objects:
+            self.objects[index_key][value] = obj
+        if index_key in self.values:
+            self.values[index_key].add(value)
 
 
 class AbstractDataLoader(metaclass=abc.ABCMeta):
@@ -17,6 +187,12 @@ class AbstractDataLoader(metaclass=abc.ABCMeta):
 
     LOADER_MAX_RETRY = 3
     PAGE_SIZE = 50
+    # Name the loader records the fingerprints of the data it loads under, if it skips unchanged objects.
+    FINGERPRINT_LOADER = None
+    FINGERPRINT_MAX_AGE = datetime.timedelta(days=7)
+    # Name the loader records the pages it completed under, if a failed run can be resumed.
+    CHECKPOINT_LOADER = None
+    CHECKPOINT_MAX_AGE = datetime.timedelta(hours=12)
 
     def __init__(self, partner, api_url=None, max_workers=None, is_threadsafe=False, enable_api=True):
         """
@@ -37,6 +213,13 @@ class AbstractDataLoader(metaclass=abc.ABCMeta):
 
         self.max_workers = max_workers
         self.is_threadsafe = is_threadsafe
+        self.reference_data = ReferenceDataCache()
+        self.fingerprints = None
+        if self.FINGERPRINT_LOADER and self.enable_api:
+            self.fingerprints = PayloadFingerprints(self.partner, self.FINGERPRINT_LOADER, self.FINGERPRINT_MAX_AGE)
+        self.checkpoints = None
+        if self.CHECKPOINT_LOADER and self.enable_api:
+            self.checkpoints = PageCheckpoints(self.partner, self.CHECKPOINT_LOADER, self.CHECKPOINT_MAX_AGE)
 
     @abc.abstractmethod
     def ingest(self):  # pragma: no cover
@@ -1,11 +1,12 @@
 import datetime
 import logging
+from collections import defaultdict
 
 import pytz
 from analyticsclient.client import Client
 
 from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
-from course_discovery.apps.course_metadata.models import CourseRun
+from course_discovery.apps.course_metadata.models import Course, CourseRun, Program
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +14,7 @@ logger = logging.getLogger(__name__)
 class AnalyticsAPIDataLoader(AbstractDataLoader):
 
     API_TIMEOUT = 120  # time in seconds
+    BULK_UPDATE_BATCH_SIZE = 500
 
     def __init__(self, partner, api_url, max_workers=None, is_threadsafe=False):
         super().__init__(partner, api_url, max_workers, is_threadsafe)
@@ -45,38 +47,77 @@ class AnalyticsAPIDataLoader(AbstractDataLoader):
                                                                                   'count',
                                                                                   'recent_count_change'])
 
+        course_runs = {
+            course_run.key.lower(): course_run
+            for course_run in CourseRun.objects.filter(course__partner=self.partner).select_related('course')
+        }
+        updated_course_runs = []
         for course_run_summary in course_run_summaries:
-            self._process_course_run_summary(course_run_summary=course_run_summary)
+            course_run = self._process_course_run_summary(course_run_summary, course_runs)
+            if course_run:
+                updated_course_runs.append(course_run)
+
+        updated_courses = []
+        program_courses = Program.courses.through.objects.filter(
+            course_id__in=[course_dict['course'].id for course_dict in self.course_dictionary.values()]
+        ).values_list('program_id', 'course_id')
+        programs_by_course = defaultdict(list)
+        for program_id, course_id in program_courses:
+            programs_by_course[course_id].append(program_id)
+        programs = Program.objects.in_bulk({program_id for program_id, __ in program_courses})
 
         for course_dict in self.course_dictionary.values():
-            self._process_course_enrollment_count(course_dict['course'],
-                                                  course_dict['count'],
-                                                  course_dict['recent_count'])
+            course = course_dict['course']
+            course_programs = [programs[program_id] for program_id in programs_by_course[course.id]]
+            if self._process_course_enrollment_count(course, course_dict['count'], course_dict['recent_count'],
+                                                     course_programs):
+                updated_courses.append(course)
 
+        updated_programs = []
         for program_dict in self.program_dictionary.values():
             # Update program count
             program = program_dict['program']
-            program.enrollment_count = program_dict['count']
-            program.recent_enrollment_count = program_dict['recent_count']
-            program.save(suppress_publication=True)
-            logger.info('Updating program: %s', program.uuid)
-
-    def _process_course_run_summary(self, course_run_summary):
+            if self._set_enrollment_counts(program, program_dict['count'], program_dict['recent_count']):
+                updated_programs.append(program)
+                logger.info('Updating program: %s', program.uuid)
+
+        # Only the enrollment counts are written, skipping the side effects of saving these objects.
+        for model, instances in ((CourseRun, updated_course_runs), (Course, updated_courses),
+                                 (Program, updated_programs)):
+            model._base_manager.bulk_update(  # pylint: disable=protected-access
+                instances, ['enrollment_count', 'recent_enrollment_count'], batch_size=self.BULK_UPDATE_BATCH_SIZE,
+            )
+            logger.info('Updated the enrollment counts of %d %s objects.', len(instances), model.__name__)
+
+    @staticmethod
+    def _set_enrollment_counts(instance, count, recent_count):
+        """ Set the enrollment counts of a course run, course or program, returning True if they changed. """
+        if (instance.enrollment_count, instance.recent_enrollment_count) == (count, recent_count):
+            return False
+        instance.enrollment_count = count
+        instance.recent_enrollment_count = recent_count
+        return True
+
+    def _process_course_run_summary(self, course_run_summary, course_runs):
+        """
+        Add up the counts of a course run summary to its course, returning the course run if its counts changed.
+
+        Arguments:
+            course_run_summary (dict): Course run summary from the Analytics API
+            course_runs (dict): Course runs of the partner by lowercase key
+        """
         # Get course run object from course run key
         course_run_key = course_run_summary['course_id']
         course_run_count = int(course_run_summary['count'])
         course_run_recent_count = int(course_run_summary['recent_count_change'])
-        try:
-            course_run = CourseRun.objects.get(key__iexact=course_run_key)
-        except CourseRun.DoesNotExist:
+        course_run = course_runs.get(course_run_key.lower())
+        if not course_run:
             logger.info('Course run: [%s] not found in DB.', course_run_key)
-            return
+            return None
 
         course = course_run.course
         # Update course run counts
-        course_run.enrollment_count = course_run_count
-        course_run.recent_enrollment_count = course_run_recent_count
-        course_run.save(suppress_publication=True)
+        changed = self._set_enrollment_counts(course_run, course_run_count, course_run_recent_count)
 
         # Add course run total to course total in dictionary
         if course.uuid in self.course_dictionary:
@@ -86,15 +127,17 @@ class AnalyticsAPIDataLoader(AbstractDataLoader):
             self.course_dictionary[course.uuid] = {'course': course,
                                                    'count': course_run_count,
                                                    'recent_count': course_run_recent_count}
+        return course_run if changed else None
 
-    def _process_course_enrollment_count(self, course, count, recent_count):
+    def _process_course_enrollment_count(self, course, count, recent_count, programs):
+        """
+        Set the counts of a course and add them up to its programs, returning True if the course counts changed.
+        """
         # update course count
-        course.enrollment_count = count
-        course.recent_enrollment_count = recent_count
-        course.save()
+        changed = self._set_enrollment_counts(course, count, recent_count)
 
         # Add course count to program dictionary for all programs
-        for program in course.programs.all():
+        for program in programs:
             # add course total to program total in dictionary
             if program.uuid in self.program_dictionary:
                 self.program_dictionary[program.uuid]['count'] += count
@@ -103,3 +146,4 @@ class AnalyticsAPIDataLoader(AbstractDataLoader):
                 self.program_dictionary[program.uuid] = {'program': program,
                                                          'count': count,
                                                          'recent_count': recent_count}
+        return changed
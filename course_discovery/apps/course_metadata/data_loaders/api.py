@@ -1,23 +1,28 @@
 import concurrent.futures
 import logging
 import math
+import queue
 import threading
-import time
 from decimal import Decimal
 from io import BytesIO
+from uuid import UUID
 
 import backoff
 import requests
 from django.conf import settings
 from django.core.files import File
 from django.core.management import CommandError
+from django.db import transaction
 from django.db.models import Q
+from django.utils import timezone
 from opaque_keys.edx.keys import CourseKey
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
 
 from course_discovery.apps.core.models import Currency
 from course_discovery.apps.course_metadata.choices import CourseRunPacing, CourseRunStatus
 from course_discovery.apps.course_metadata.data_loaders import AbstractDataLoader
 from course_discovery.apps.course_metadata.data_loaders.course_type import calculate_course_type
+from course_discovery.apps.course_metadata.data_loaders.rate_limiter import AdaptiveRateLimiter, get_retry_after
 from course_discovery.apps.course_metadata.models import (
     Course, CourseEntitlement, CourseRun, CourseRunType, CourseType, Organization, Program, ProgramType, Seat, SeatType,
     Video
@@ -27,6 +32,11 @@ from course_discovery.apps.course_metadata.utils import push_to_ecommerce_for_co
 
 logger = logging.getLogger(__name__)
 
+# Number of threads loaders use to request paginated APIs when they aren't given a number of workers.
+DEFAULT_MAX_WORKERS = 4
+# Number of rows written per query by bulk writes.
+BULK_WRITE_BATCH_SIZE = 500
+
 
 def _fatal_code(ex):
     """
@@ -45,46 +55,112 @@ class CoursesApiDataLoader(AbstractDataLoader):
     """ Loads course runs from the Courses API. """
 
     PAGE_SIZE = 50
+    # The courses endpoint has 40 requests/minute rate limit. Requests start at that pace, and speed up
+    # until the API starts throttling them, see AdaptiveRateLimiter.
+    REQUEST_RATE = 40 / 60
+    MIN_REQUEST_RATE = 1 / 60
+    MAX_REQUEST_RATE = 10
+    # Number of times a page is requested again after the API throttled the request.
+    MAX_THROTTLED_TRIES = 10
+    # Number of fetched pages waiting to be processed before fetching is held back.
+    RESPONSE_QUEUE_SIZE = 10
+    FINGERPRINT_LOADER = 'courses'
+    CHECKPOINT_LOADER = 'courses'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = AdaptiveRateLimiter(self.REQUEST_RATE, self.MIN_REQUEST_RATE, self.MAX_REQUEST_RATE)
 
     def ingest(self):
         logger.info('Refreshing Courses and CourseRuns from %s...', self.partner.courses_api_url)
+        self.fingerprints.load()
+        self.checkpoints.load()
 
         initial_page = 1
         response = self._make_request(initial_page)
         count = response['pagination']['count']
         pages = response['pagination']['num_pages']
-        self._process_response(response)
+        if not self.checkpoints.is_completed(initial_page):
+            self._process_response(response)
+            self.checkpoints.record(initial_page)
 
-        pagerange = range(initial_page + 1, pages + 1)
         logger.info('Looping to request all %d pages...', pages)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:  # pragma: no cover
-            if self.is_threadsafe:
-                for page in pagerange:
-                    # This time.sleep is to make it very likely that this method does not encounter a 429 status
-                    # code by increasing the amount of time between each code. More details at LEARNER-5560
-                    # The current crude estimation is for ~3000 courses with a PAGE_SIZE=50 which means this method
-                    # will take ~30 minutes.
-                    # TODO Ticket to gracefully handle 429 https://openedx.atlassian.net/browse/LEARNER-5565
-                    time.sleep(30)
-                    executor.submit(self._load_data, page)
-            else:
-                for future in [executor.submit(self._make_request, page) for page in pagerange]:
-                    response = future.result()
-                    self._process_response(response)
+        self._ingest_pages(
+            [page for page in range(initial_page + 1, pages + 1) if not self.checkpoints.is_completed(page)]
+        )
 
         logger.info('Retrieved %d course runs from %s.', count, self.partner.courses_api_url)
+        self.fingerprints.log_counts()
+        self.checkpoints.clear()
 
-    def _load_data(self, page):  # pragma: no cover
-        """Make a request for the given page and process the response."""
-        response = self._make_request(page)
-        self._process_response(response)
+    def _ingest_pages(self, pages):
+        """
+        Request the given pages and process their responses.
 
-    # The courses endpoint has 40 requests/minute rate limit.
-    # This will back off at a rate of 60/120/240 seconds (from the factor 60 and default value of base 2).
-    # This backoff code can still fail because of the concurrent requests all requesting at the same time.
-    # So even in the case of entering into the next minute, if we still exceed our limit for that min,
-    # any requests that failed in both limits are still approaching their max_tries limit.
+        Pages are requested by `max_workers` threads as fast as the rate limiter allows, and handed over through
+        a bounded queue to be processed by as many threads if writing data is threadsafe, or by the calling
+        thread otherwise. Requesting pages is only held back when processing them falls behind. Each page processed
+        is checkpointed, so that it is skipped if the run fails and is resumed.
+        """
+        fetcher_count = self.max_workers or DEFAULT_MAX_WORKERS
+        writer_count = fetcher_count if self.is_threadsafe else 0
+        # Let the fetching threads reuse their connections to the API.
+        self.api_client.mount(self.api_url, requests.adapters.HTTPAdapter(pool_maxsize=fetcher_count))
+
+        responses = queue.Queue(maxsize=self.RESPONSE_QUEUE_SIZE)
+        errors = []
+
+        def fetch(page):
+            try:
+                responses.put((page, self._make_request(page)))
+            except Exception as exc:  # pylint: disable=broad-except
+                responses.put((page, exc))
+
+        def process(page, response):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                self._process_response(response)
+                self.checkpoints.record(page)
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+
+        def write():
+            for page, response in iter(responses.get, None):
+                process(page, response)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=fetcher_count) as fetchers:
+            fetches = [fetchers.submit(fetch, page) for page in pages]
+            if writer_count:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=writer_count) as writers:
+                    writes = [writers.submit(write) for __ in range(writer_count)]
+                    concurrent.futures.wait(fetches)
+                    for __ in writes:
+                        responses.put(None)
+            else:
+                for __ in fetches:
+                    process(*responses.get())
+
+        if errors:
+            raise errors[0]
+
+    def _get_page(self, page):
+        """
+        Request a page at the pace allowed by the rate limiter, requesting it again when the API throttles it.
+        """
+        params = {'page': page, 'page_size': self.PAGE_SIZE, 'username': self.username, 'active_only': True}
+        for __ in range(self.MAX_THROTTLED_TRIES):
+            self.rate_limiter.acquire()
+            response = self.api_client.get(self.api_url + '/courses/', params=params)
+            if response.status_code != 429:
+                self.rate_limiter.record_success()
+                return response
+            logger.info('Request for course run page %d was throttled, retrying...', page)
+            self.rate_limiter.record_throttled(get_retry_after(response))
+        return response
+
+    # Throttled requests are retried by _get_page. This backs off from other failures
+    # at a rate of 60/120/240 seconds (from the factor 60 and default value of base 2).
     @backoff.on_exception(
         backoff.expo,
         factor=60,
@@ -94,8 +170,7 @@ class CoursesApiDataLoader(AbstractDataLoader):
     )
     def _make_request(self, page):
         logger.info('Requesting course run page %d...', page)
-        params = {'page': page, 'page_size': self.PAGE_SIZE, 'username': self.username, 'active_only': True}
-        response = self.api_client.get(self.api_url + '/courses/', params=params)
+        response = self._get_page(page)
         response.raise_for_status()
         return response.json()
 
@@ -113,7 +188,11 @@ class CoursesApiDataLoader(AbstractDataLoader):
         try:
             body = self.clean_strings(body)
             official_run, draft_run = self.get_course_run(body)
-            if official_run or draft_run:
+            run_exists = bool(official_run or draft_run)
+            if run_exists and self.fingerprints and self.fingerprints.is_unchanged(course_run_id, body):
+                logger.info(f"Skipping course processing for id {course_run_id}, which did not change")
+                return
+            if run_exists:
                 self.update_course_run(official_run, draft_run, body)
                 if not self.partner.uses_publisher:
                     # Without publisher, we'll use Studio as the source of truth for course data
@@ -129,6 +208,8 @@ class CoursesApiDataLoader(AbstractDataLoader):
                     logger.info(f"Course run created with uuid {course_run.uuid} and key {course_run.key}")
                     course.canonical_course_run = course_run
                     course.save()
+            if self.fingerprints:
+                self.fingerprints.record(course_run_id, body, created=not run_exists)
         except Exception:  # pylint: disable=broad-except
             if self.enable_api:
                 msg = 'An error occurred while updating {course_run} from {api_url}'.format(
@@ -313,6 +394,109 @@ class CoursesApiDataLoader(AbstractDataLoader):
         return video
 
 
+class EcommerceProductBatch:
+    """
+    Seats and entitlements loaded from a page of E-Commerce products, written in bulk.
+
+    The course runs, courses, currencies and seat types the products refer to are loaded upfront with one query
+    each. Changed seats and entitlements are collected by the loader, then written by `save` with a few bulk
+    queries, along with their history.
+    """
+
+    SEAT_FIELDS = ('price', 'sku', '_upgrade_deadline', 'credit_hours', 'bulk_sku')
+    ENTITLEMENT_FIELDS = ('partner', 'price', 'currency', 'sku')
+
+    def __init__(self, course_run_keys=(), course_uuids=()):
+        self.currencies = {currency.code: currency for currency in Currency.objects.all()}
+        self.seat_types = {seat_type.slug: seat_type for seat_type in SeatType.objects.all()}
+
+        self.course_runs = {}
+        if course_run_keys:
+            # Match the keys with iexact lookups rather than on a lowercased annotation, so the key index is used.
+            key_filter = Q()
+            for key in {key.casefold() for key in course_run_keys}:
+                key_filter |= Q(key__iexact=key)
+            course_runs = CourseRun.objects.filter(key_filter).select_related('type').prefetch_related(
+                'type__tracks', 'seats',
+            )
+            self.course_runs = {course_run.key.casefold(): course_run for course_run in course_runs}
+        self.seats = {course_run.pk: list(course_run.seats.all()) for course_run in self.course_runs.values()}
+
+        self.courses = {}
+        course_uuids = {str(course_uuid) for course_uuid in course_uuids if self.is_uuid(course_uuid)}
+        if course_uuids:
+            courses = Course.objects.filter(uuid__in=course_uuids).select_related('type').prefetch_related(
+                'type__entitlement_types', 'entitlements',
+            )
+            self.courses = {str(course.uuid): course for course in courses}
+        self.entitlements = {course.pk: list(course.entitlements.all()) for course in self.courses.values()}
+
+        self.created = {Seat: [], CourseEntitlement: []}
+        self.updated = {Seat: {}, CourseEntitlement: {}}
+        self.seat_ids_to_delete = []
+
+    @staticmethod
+    def is_uuid(value):
+        try:
+            UUID(str(value))
+        except ValueError:
+            return False
+        return True
+
+    def get_course_run(self, key, iexact=True):
+        course_run = self.course_runs.get(key.casefold()) if key else None
+        if course_run and not iexact and course_run.key != key:
+            return None
+        return course_run
+
+    def update_or_create(self, instances, model, lookups, values, parent):
+        """
+        Update the fields of the instance matching the given lookups, or create it if there is none.
+
+        Arguments:
+            instances (list): Existing instances of the model for the parent object, with the ones created so far.
+            model (Model): Seat or CourseEntitlement.
+            lookups (dict): Values of the fields identifying the instance.
+            values (dict): Values of the other fields of the instance.
+            parent (tuple): Name and value of the field referring to the course run or course of the instance.
+
+        Returns:
+            (bool): True if the instance was created.
+        """
+        for instance in instances:
+            if all(getattr(instance, field) == value for field, value in lookups.items()):
+                changed = [field for field, value in values.items() if getattr(instance, field) != value]
+                for field in changed:
+                    setattr(instance, field, values[field])
+                if changed and instance.pk:
+                    self.updated[model][instance.pk] = instance
+                return False
+
+        instance = model(**{parent[0]: parent[1]}, **lookups, **values)
+        instances.append(instance)
+        self.created[model].append(instance)
+        return True
+
+    @transaction.atomic
+    def save(self):
+        """ Write the collected changes to seats and entitlements. """
+        if self.seat_ids_to_delete:
+            Seat.everything.filter(pk__in=self.seat_ids_to_delete).delete()
+
+        now = timezone.now()
+        for model, fields in ((Seat, self.SEAT_FIELDS), (CourseEntitlement, self.ENTITLEMENT_FIELDS)):
+            if self.created[model]:
+                bulk_create_with_history(self.created[model], model, batch_size=BULK_WRITE_BATCH_SIZE)
+            if self.updated[model]:
+                instances = list(self.updated[model].values())
+                for instance in instances:
+                    instance.modified = now
+                bulk_update_with_history(
+                    instances, model, fields + ('modified',), batch_size=BULK_WRITE_BATCH_SIZE,
+                    manager=model.everything,
+                )
+
+
 class EcommerceApiDataLoader(AbstractDataLoader):
     """ Loads course seats, entitlements, and enrollment codes from the E-Commerce API. """
 
@@ -376,11 +560,11 @@ class EcommerceApiDataLoader(AbstractDataLoader):
                     )
                 for page in pageranges['entitlements']:
                     executor.submit(self._request_entitlements, page).add_done_callback(
-                        lambda future: self._check_future_and_process(future, self.process_entitlements)
+                        lambda future: self._check_future_and_process(future, self._process_entitlements)
                     )
                 for page in pageranges['enrollment_codes']:
                     executor.submit(self._request_enrollment_codes, page).add_done_callback(
-                        lambda future: self._check_future_and_process(future, self.process_enrollment_codes)
+                        lambda future: self._check_future_and_process(future, self._process_enrollment_codes)
                     )
             else:
                 # Process in batches and wait for the result from the futures
@@ -473,9 +657,12 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self.course_run_count_lock.acquire()  # lint-amnesty, pylint: disable=consider-using-with
         self.course_run_count += len(results)
         self.course_run_count_lock.release()
-        for body in results:
-            body = self.clean_strings(body)
-            self.update_seats(body)
+
+        bodies = [self.clean_strings(body) for body in results]
+        batch = EcommerceProductBatch(course_run_keys=[body['id'] for body in bodies])
+        for body in bodies:
+            self.update_seats(body, batch)
+        batch.save()
 
     def _process_entitlements(self, response):
         results = response['results']
@@ -485,9 +672,14 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self.entitlement_count += len(results)
         self.entitlement_count_lock.release()
 
-        for body in results:
-            body = self.clean_strings(body)
-            self.entitlement_skus.append(self.update_entitlement(body))
+        bodies = [self.clean_strings(body) for body in results]
+        batch = EcommerceProductBatch(course_uuids=[
+            attribute['value'] for body in bodies for attribute in body['attribute_values']
+            if attribute['name'] == 'UUID'
+        ])
+        for body in bodies:
+            self.entitlement_skus.append(self.update_entitlement(body, batch))
+        batch.save()
 
     def _process_enrollment_codes(self, response):
         results = response['results']
@@ -496,9 +688,14 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         self.enrollment_code_count += len(results)
         self.enrollment_code_lock.release()
 
-        for body in results:
-            body = self.clean_strings(body)
-            self.enrollment_skus.append(self.update_enrollment_code(body))
+        bodies = [self.clean_strings(body) for body in results]
+        batch = EcommerceProductBatch(course_run_keys=[
+            attribute['value'] for body in bodies for attribute in body['attribute_values']
+            if attribute['code'] == 'course_key' and attribute['value']
+        ])
+        for body in bodies:
+            self.enrollment_skus.append(self.update_enrollment_code(body, batch))
+        batch.save()
 
     def _delete_entitlements(self):
         entitlements_to_delete = CourseEntitlement.objects.filter(
@@ -522,11 +719,10 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             # Protect against deletes if exceptions occurred
             self.processing_failure_occurred = True
 
-    def update_seats(self, body):
+    def update_seats(self, body, batch):
         course_run_key = body['id']
-        try:
-            course_run = CourseRun.objects.get(key__iexact=course_run_key)
-        except CourseRun.DoesNotExist:
+        course_run = batch.get_course_run(course_run_key)
+        if not course_run:
             logger.warning('Could not find course run [%s]', course_run_key)
             return
 
@@ -534,45 +730,45 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             if product_body['structure'] != 'child':
                 continue
             product_body = self.clean_strings(product_body)
-            self.update_seat(course_run, product_body)
+            self.update_seat(course_run, product_body, batch)
 
         # Remove seats which no longer exist for that course run
         certificate_types = [self.get_certificate_type(product) for product in body['products']
                              if product['structure'] == 'child']
 
-        seats_to_remove = course_run.seats.exclude(type__slug__in=certificate_types)
-        if seats_to_remove.count() > 0:
+        seats_to_remove = [seat for seat in batch.seats[course_run.pk] if seat.type_id not in certificate_types]
+        if seats_to_remove:
             logger.info(
                 'Removing seats [%s] for course run with key [%s].',
-                ', '.join(s.type.slug for s in seats_to_remove),
+                ', '.join(seat.type_id for seat in seats_to_remove),
                 course_run_key,
             )
-        seats_to_remove.delete()
+            batch.seat_ids_to_delete.extend(seat.pk for seat in seats_to_remove if seat.pk)
 
-    def update_seat(self, course_run, product_body):
+    def update_seat(self, course_run, product_body, batch):
         stock_record = product_body['stockrecords'][0]
         currency_code = stock_record['price_currency']
         price = Decimal(stock_record['price_excl_tax'])
         sku = stock_record['partner_sku']
 
-        try:
-            currency = Currency.objects.get(code=currency_code)
-        except Currency.DoesNotExist:
+        currency = batch.currencies.get(currency_code)
+        if not currency:
             logger.warning("Could not find currency [%s]", currency_code)
             return
 
         attributes = {attribute['name']: attribute['value'] for attribute in product_body['attribute_values']}
 
         certificate_type = attributes.get('certificate_type', Seat.AUDIT)
-        try:
-            seat_type = SeatType.objects.get(slug=certificate_type)
-        except SeatType.DoesNotExist:
+        seat_type = batch.seat_types.get(certificate_type)
+        if not seat_type:
             msg = ('Could not find seat type {seat_type} while loading seat with sku {sku} for course run with key '
                    '{key}'.format(seat_type=certificate_type, sku=sku, key=course_run.key))
             logger.warning(msg)
             self.processing_failure_occurred = True
             return
-        if not course_run.type.empty and not course_run.type.tracks.filter(seat_type=seat_type).exists():
+        if not course_run.type.empty and not any(
+            track.seat_type_id == seat_type.id for track in course_run.type.tracks.all()
+        ):
             logger.warning(
                 'Seat type {seat_type} is not compatible with course run type {run_type} for course run {key}'.format(  # lint-amnesty, pylint: disable=logging-format-interpolation
                     seat_type=seat_type.slug, run_type=course_run.type.slug, key=course_run.key,
@@ -587,27 +783,29 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         if credit_hours:
             credit_hours = int(credit_hours)
 
-        defaults = {
+        values = {
             'price': price,
             'sku': sku,
-            'upgrade_deadline': self.parse_date(product_body.get('expires')),
+            '_upgrade_deadline': self.parse_date(product_body.get('expires')),
             'credit_hours': credit_hours,
         }
 
-        _, created = course_run.seats.update_or_create(
-            type=seat_type,
-            credit_provider=credit_provider,
-            currency=currency,
-            defaults=defaults
+        created = batch.update_or_create(
+            batch.seats[course_run.pk],
+            Seat,
+            {'type_id': seat_type.slug, 'credit_provider': credit_provider, 'currency_id': currency.code},
+            values,
+            ('course_run', course_run),
         )
 
         if created:
             logger.info('Created seat for course with key [%s] and sku [%s].', course_run.key, sku)
 
-    def validate_stockrecord(self, stockrecords, title, product_class):
+    def validate_stockrecord(self, stockrecords, title, product_class, currencies=None):
         """
         Argument:
             body (dict): product data from ecommerce, either entitlement or enrollment code
+            currencies (dict): Preloaded currencies by code, looked up in the database if not given
         Returns:
             product sku if no exceptions, else None
         """
@@ -654,9 +852,11 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             logger.warning(msg)
             return None
 
-        try:
-            Currency.objects.get(code=currency_code)
-        except Currency.DoesNotExist:
+        if currencies is not None:
+            currency_exists = currency_code in currencies
+        else:
+            currency_exists = Currency.objects.filter(code=currency_code).exists()
+        if not currency_exists:
             msg = 'Could not find currency {code} while loading {product} {title} with sku {sku}'.format(
                 product=product_class['value'], code=currency_code, title=title, sku=sku
             )
@@ -666,10 +866,11 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         # All validation checks passed!
         return True
 
-    def update_entitlement(self, body):
+    def update_entitlement(self, body, batch):
         """
         Argument:
             body (dict): entitlement product data from ecommerce
+            batch (EcommerceProductBatch): batch the entitlement is written with
         Returns:
             entitlement product sku if no exceptions, else None
         """
@@ -678,7 +879,7 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         title = body['title']
         stockrecords = body['stockrecords']
 
-        if not self.validate_stockrecord(stockrecords, title, 'entitlement'):
+        if not self.validate_stockrecord(stockrecords, title, 'entitlement', batch.currencies):
             return None
 
         stock_record = stockrecords[0]
@@ -686,18 +887,16 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         price = Decimal(stock_record['price_excl_tax'])
         sku = stock_record['partner_sku']
 
-        try:
-            course = Course.objects.get(uuid=course_uuid)
-        except Course.DoesNotExist:
+        course = batch.courses.get(str(course_uuid))
+        if not course:
             msg = 'Could not find course {uuid} while loading entitlement {title} with sku {sku}'.format(
                 uuid=course_uuid, title=title, sku=sku
             )
             logger.warning(msg)
             return None
 
-        try:
-            currency = Currency.objects.get(code=currency_code)
-        except Currency.DoesNotExist:
+        currency = batch.currencies.get(currency_code)
+        if not currency:
             msg = 'Could not find currency {code} while loading entitlement {title} with sku {sku}'.format(
                 code=currency_code, title=title, sku=sku
             )
@@ -705,9 +904,8 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             return None
 
         mode_name = attributes.get('certificate_type')
-        try:
-            mode = SeatType.objects.get(slug=mode_name)
-        except SeatType.DoesNotExist:
+        mode = batch.seat_types.get(mode_name)
+        if not mode:
             msg = 'Could not find mode {mode} while loading entitlement {title} with sku {sku}'.format(
                 mode=mode_name, title=title, sku=sku
             )
@@ -723,23 +921,26 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             self.processing_failure_occurred = True
             return None
 
-        defaults = {
-            'partner': self.partner,
+        values = {
+            'partner_id': self.partner.id,
             'price': price,
-            'currency': currency,
+            'currency_id': currency.code,
             'sku': sku,
         }
         msg = 'Creating entitlement {title} with sku {sku} for partner {partner}'.format(
             title=title, sku=sku, partner=self.partner
         )
         logger.info(msg)
-        course.entitlements.update_or_create(mode=mode, defaults=defaults)
+        batch.update_or_create(
+            batch.entitlements[course.pk], CourseEntitlement, {'mode_id': mode.id}, values, ('course', course),
+        )
         return sku
 
-    def update_enrollment_code(self, body):
+    def update_enrollment_code(self, body, batch):
         """
         Argument:
             body (dict): enrollment code product data from ecommerce
+            batch (EcommerceProductBatch): batch the enrollment code is written with
         Returns:
             enrollment code product sku if no exceptions, else None
         """
@@ -748,15 +949,14 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         title = body['title']
         stockrecords = body['stockrecords']
 
-        if not self.validate_stockrecord(stockrecords, title, "enrollment_code"):
+        if not self.validate_stockrecord(stockrecords, title, "enrollment_code", batch.currencies):
             return None
 
         stock_record = stockrecords[0]
         sku = stock_record['partner_sku']
 
-        try:
-            course_run = CourseRun.objects.get(key=course_key)
-        except CourseRun.DoesNotExist:
+        course_run = batch.get_course_run(course_key, iexact=False)
+        if not course_run:
             msg = 'Could not find course run {key} while loading enrollment code {title} with sku {sku}'.format(
                 key=course_key, title=title, sku=sku
             )
@@ -764,16 +964,15 @@ class EcommerceApiDataLoader(AbstractDataLoader):
             return None
 
         seat_type = attributes.get('seat_type')
-        try:
-            Seat.objects.get(course_run=course_run, type=seat_type)
-        except Seat.DoesNotExist:
+        seats = [seat for seat in batch.seats[course_run.pk] if seat.type_id == seat_type and not seat.draft]
+        if not seats:
             msg = 'Could not find seat type {type} while loading enrollment code {title} with sku {sku}'.format(
                 type=seat_type, title=title, sku=sku
             )
             logger.warning(msg)
             return None
 
-        defaults = {
+        values = {
             'bulk_sku': sku
         }
         msg = 'Creating enrollment code {title} with sku {sku} for partner {partner}'.format(
@@ -781,7 +980,9 @@ class EcommerceApiDataLoader(AbstractDataLoader):
         )
         logger.info(msg)
 
-        course_run.seats.update_or_create(type=seat_type, defaults=defaults)
+        batch.update_or_create(
+            batch.seats[course_run.pk], Seat, {'type_id': seat_type}, values, ('course_run', course_run),
+        )
         return sku
 
     def get_certificate_type(self, product):
@@ -7,9 +7,10 @@ import logging
 
 import unicodecsv
 from django.conf import settings
-from django.db.models import Q
-from django.urls import reverse
+from django.utils.functional import cached_property
 
+from course_discovery.apps.api.v1 import services
+from course_discovery.apps.core.models import User
 from course_discovery.apps.core.utils import serialize_datetime
 from course_discovery.apps.course_metadata.choices import (
     CourseRunStatus, ExternalCourseMarketingType, ExternalProductStatus
@@ -23,7 +24,7 @@ from course_discovery.apps.course_metadata.models import (
     AdditionalMetadata, Collaborator, Course, CourseRun, CourseRunPacing, CourseRunType, CourseType, Organization,
     Person, ProgramType, Source, Subject
 )
-from course_discovery.apps.course_metadata.utils import download_and_save_course_image
+from course_discovery.apps.course_metadata.utils import ImageFetcher, download_and_save_course_image
 from course_discovery.apps.ietf_language_tags.models import LanguageTag
 
 logger = logging.getLogger(__name__)
@@ -115,8 +116,22 @@ class CSVDataLoader(AbstractDataLoader):
         self.reader = list(self.reader)
         self.ingestion_summary['total_products_count'] = len(self.reader)
 
-    def ingest(self):  # pylint: disable=too-many-statements
+    def ingest(self):
         logger.info("Initiating CSV data loader flow.")
+        self.reference_data.clear()
+        with self._prefetch_images() as image_fetcher:
+            course_external_identifiers = self._ingest_rows(image_fetcher)
+
+        self._archive_stale_products(course_external_identifiers)
+        logger.info("CSV loader ingest pipeline has completed.")
+
+        self._render_error_logs()
+        self._render_course_uuids()
+
+    def _ingest_rows(self, image_fetcher):  # pylint: disable=too-many-statements
+        """
+        Ingest the courses and course runs of all rows, returning the external identifiers of the courses in the sheet.
+        """
         course_external_identifiers = set()  # store external course ids for each course present in sheet
 
         for row in self.reader:
@@ -129,7 +144,7 @@ class CSVDataLoader(AbstractDataLoader):
                 course_external_identifiers.add(row['external_identifier'])
 
             logger.info('Starting data import flow for {}'.format(course_title))  # lint-amnesty, pylint: disable=logging-format-interpolation
-            if not Organization.objects.filter(key=org_key).exists():
+            if not self.reference_data.exists(Organization, 'key', org_key):
                 error_message = CSVIngestionErrorMessages.MISSING_ORGANIZATION.format(
                     org_key=org_key,
                     course_title=course_title,
@@ -138,21 +153,20 @@ class CSVDataLoader(AbstractDataLoader):
                 self._register_ingestion_error(CSVIngestionErrors.MISSING_ORGANIZATION, error_message)
                 continue
 
-            try:
-                course_type = CourseType.objects.get(name=row['course_enrollment_track'])
-                course_run_type = CourseRunType.objects.get(name=row['course_run_enrollment_track'])
-            except CourseType.DoesNotExist:
+            course_type = self.reference_data.get(CourseType, 'name', row['course_enrollment_track'])
+            if not course_type:
                 error_message = CSVIngestionErrorMessages.MISSING_COURSE_TYPE.format(
                     course_title=course_title, course_type=row['course_enrollment_track']
                 )
-                logger.exception(error_message)
+                logger.error(error_message)
                 self._register_ingestion_error(CSVIngestionErrors.MISSING_COURSE_TYPE, error_message)
                 continue
-            except CourseRunType.DoesNotExist:
+            course_run_type = self.reference_data.get(CourseRunType, 'name', row['course_run_enrollment_track'])
+            if not course_run_type:
                 error_message = CSVIngestionErrorMessages.MISSING_COURSE_RUN_TYPE.format(
                     course_title=course_title, course_run_type=row['course_run_enrollment_track']
                 )
-                logger.exception(error_message)
+                logger.error(error_message)
                 self._register_ingestion_error(CSVIngestionErrors.MISSING_COURSE_RUN_TYPE, error_message)
                 continue
 
@@ -195,7 +209,8 @@ class CSVDataLoader(AbstractDataLoader):
             is_downloaded = download_and_save_course_image(
                 course,
                 row['image'],
-                headers=self.REQUEST_USER_AGENT_HEADERS)
+                headers=self.REQUEST_USER_AGENT_HEADERS,
+                image_fetcher=image_fetcher)
             if not is_downloaded:
                 error_message = CSVIngestionErrorMessages.IMAGE_DOWNLOAD_FAILURE.format(course_title=course_title)
                 logger.error(error_message)
@@ -227,7 +242,8 @@ class CSVDataLoader(AbstractDataLoader):
                     course,
                     row['organization_logo_override'],
                     'organization_logo_override',
-                    headers=self.REQUEST_USER_AGENT_HEADERS
+                    headers=self.REQUEST_USER_AGENT_HEADERS,
+                    image_fetcher=image_fetcher,
                 )
                 if not is_logo_downloaded:
                     error_message = CSVIngestionErrorMessages.LOGO_IMAGE_DOWNLOAD_FAILURE.format(
@@ -263,11 +279,16 @@ class CSVDataLoader(AbstractDataLoader):
                 str(course.uuid), is_course_created, course.active_url_slug,
                 row.get('external_course_marketing_type', None))
 
-        self._archive_stale_products(course_external_identifiers)
-        logger.info("CSV loader ingest pipeline has completed.")
+        return course_external_identifiers
 
-        self._render_error_logs()
-        self._render_course_uuids()
+    def _prefetch_images(self):
+        """
+        Start downloading the images of all rows, so that they are ready by the time each row is ingested.
+        """
+        image_fetcher = ImageFetcher(headers=self.REQUEST_USER_AGENT_HEADERS)
+        rows = [self.transform_dict_keys(row) for row in self.reader]
+        image_fetcher.prefetch(row.get(field) for row in rows for field in ('image', 'organization_logo_override'))
+        return image_fetcher
 
     def validate_course_data(self, course_type, data):
         """
@@ -514,9 +535,10 @@ class CSVDataLoader(AbstractDataLoader):
         languages_list = language_str.split(',')
         for language in languages_list:
             language = language.strip()
-            language_obj = LanguageTag.objects.filter(
-                Q(name=language) | Q(code=language)
-            ).first()
+            language_obj = (
+                self.reference_data.get(LanguageTag, 'name', language) or
+                self.reference_data.get(LanguageTag, 'code', language)
+            )
             if not language_obj:
                 raise Exception(  # pylint: disable=broad-exception-raised
                     'Language {} from provided string {} is either missing or an invalid ietf language'.format(
@@ -526,58 +548,35 @@ class CSVDataLoader(AbstractDataLoader):
             languages_codes_list.append(language_obj.code)
         return languages_codes_list
 
-    def _call_course_api(self, method, url, data):
+    @cached_property
+    def user(self):
         """
-        Helper method to make course and course run api calls.
+        User the loader writes courses and course runs as, the one it authenticates to the APIs as.
         """
-        response = self.api_client.request(
-            method,
-            url,
-            json=data,
-            headers={'content-type': 'application/json'}
-        )
-        if not response.ok:
-            logger.info("API request failed for url {} with response: {}".format(url, response.content.decode('utf-8')))  # lint-amnesty, pylint: disable=logging-format-interpolation
-        response.raise_for_status()
-        return response
+        # Like the API does the first time a user authenticates, create the user if needed.
+        user, __ = User.objects.get_or_create(username=self.username)
+        return user
 
     def _create_course(self, data, course_type, course_run_type_uuid):
         """
-        Make a course entry through course api.
+        Make a course entry, with the same code as the course api.
         """
-        course_api_url = reverse('api:v1:course-list')
-        url = f"{settings.DISCOVERY_BASE_URL}{course_api_url}"
-
         request_data = self._create_course_api_request_data(data, course_type, course_run_type_uuid)
-        response = self._call_course_api('POST', url, request_data)
-        if response.status_code not in (200, 201):
-            logger.info("Course creation response: {}".format(response.content))  # lint-amnesty, pylint: disable=logging-format-interpolation
-        return response.json()
+        return services.create_course(request_data, self.user, self.partner)
 
     def _update_course(self, data, course, is_draft):
         """
         Update the course data.
         """
-        course_api_url = reverse('api:v1:course-detail', kwargs={'key': course.uuid})
-        url = f"{settings.DISCOVERY_BASE_URL}{course_api_url}?exclude_utm=1"
         request_data = self._update_course_api_request_data(data, course, is_draft)
-        response = self._call_course_api('PATCH', url, request_data)
-
-        if response.status_code not in (200, 201):
-            logger.info("Course update response: {}".format(response.content))  # lint-amnesty, pylint: disable=logging-format-interpolation
-        return response.json()
+        return services.update_course(course, request_data, partial=True)
 
     def _update_course_run(self, data, course_run, course_type, is_draft):
         """
         Update the course run data.
         """
-        course_run_api_url = reverse('api:v1:course_run-detail', kwargs={'key': course_run.key})
-        url = f"{settings.DISCOVERY_BASE_URL}{course_run_api_url}?exclude_utm=1"
         request_data = self._update_course_run_request_data(data, course_run, course_type, is_draft)
-        response = self._call_course_api('PATCH', url, request_data)
-        if response.status_code not in (200, 201):
-            logger.info("Course run update response: {}".format(response.content))  # lint-amnesty, pylint: disable=logging-format-interpolation
-        return response.json()
+        return services.update_course_run(course_run, request_data, self.user, partial=True)
 
     def _complete_run_review(self, data, course_run):
         """
@@ -629,14 +628,15 @@ class CSVDataLoader(AbstractDataLoader):
         subject_slugs = []
         subjects = [subject for subject in subjects if subject]
         for subject in subjects:
-            try:
-                sub_obj = Subject.objects.get(translations__name=subject, translations__language_code='en')
-                subject_slugs.append(sub_obj.slug)
-            except Subject.DoesNotExist:
-                logger.exception("Unable to locate subject {} in the database. Skipping subject association".format(  # lint-amnesty, pylint: disable=logging-format-interpolation
+            sub_obj = self.reference_data.get(
+                Subject, 'translations__name', subject, translations__language_code='en'
+            )
+            if not sub_obj:
+                logger.error("Unable to locate subject {} in the database. Skipping subject association".format(  # lint-amnesty, pylint: disable=logging-format-interpolation
                     subject
                 ))
-                raise
+                raise Subject.DoesNotExist(f'Subject {subject} does not exist.')
+            subject_slugs.append(sub_obj.slug)
 
         return subject_slugs
 
@@ -654,7 +654,11 @@ class CSVDataLoader(AbstractDataLoader):
         collaborators = [collaborator.strip() for collaborator in collaborators if collaborator.strip()]
         collaborator_uuids = []
         for collaborator in collaborators:
-            collaborator_obj, created = Collaborator.objects.get_or_create(name=collaborator)
+            collaborator_obj = self.reference_data.get(Collaborator, 'name', collaborator)
+            created = not collaborator_obj
+            if created:
+                collaborator_obj = Collaborator.objects.create(name=collaborator)
+                self.reference_data.add(Collaborator, 'name', collaborator_obj)
             collaborator_uuids.append(str(collaborator_obj.uuid))
             if created:
                 logger.info("Collaborator {} created for course {}".format(collaborator, course_key))  # lint-amnesty, pylint: disable=logging-format-interpolation
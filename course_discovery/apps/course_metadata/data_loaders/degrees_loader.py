@@ -17,7 +17,7 @@ from course_discovery.apps.course_metadata.models import (
     Curriculum, Degree, DegreeAdditionalMetadata, LanguageTag, LevelType, Organization, Program, ProgramType, Source,
     Specialization, Subject
 )
-from course_discovery.apps.course_metadata.utils import download_and_save_program_image
+from course_discovery.apps.course_metadata.utils import ImageFetcher, download_and_save_program_image
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +31,12 @@ class DegreeCSVDataLoader(AbstractDataLoader):
         'identifier', 'overview',
     ]
 
+    # TODO: Temporary addition of User agent to allow access to data CDNs
+    REQUEST_USER_AGENT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+                      '(KHTML, like Gecko) Chrome/101.0.4951.64 Safari/537.36'
+    }
+
     # Define the error type and error messages for various required data models for Degree ingestion
     MODEL_ERROR_MAPPING = {
         Organization: {
@@ -63,6 +69,7 @@ class DegreeCSVDataLoader(AbstractDataLoader):
 
         self.error_logs = {}
         self.degree_uuids = {}  # to show the discovery degrees/program ids for each processed degree
+        self.image_fetcher = None  # downloads the images of the degrees while they are ingested
         self.ingestion_summary = {
             'total_products_count': 0,
             'success_count': 0,
@@ -102,6 +109,26 @@ class DegreeCSVDataLoader(AbstractDataLoader):
 
     def ingest(self):
         logger.info("Initiating Degree CSV data loader flow.")
+        self.reference_data.clear()
+        self.image_fetcher = ImageFetcher(headers=self.REQUEST_USER_AGENT_HEADERS)
+        try:
+            rows = [self.transform_dict_keys(row) for row in self.reader]
+            self.image_fetcher.prefetch(
+                row.get(field) for row in rows for field in ('card_image_url', 'organization_logo_override')
+            )
+            self._ingest_rows()
+        finally:
+            self.image_fetcher.close()
+            self.image_fetcher = None
+        logger.info("Degree CSV loader ingest pipeline has completed.")
+
+        self._render_error_logs()
+        self._render_degree_uuids()
+
+    def _ingest_rows(self):
+        """
+        Ingest the degrees of all rows.
+        """
         for row in self.reader:
             row = self.transform_dict_keys(row)
 
@@ -182,11 +209,6 @@ class DegreeCSVDataLoader(AbstractDataLoader):
             self.degree_uuids[str(degree.uuid)] = degree.marketing_slug
             self._register_successful_ingestion(str(degree.uuid), is_degree_created)
 
-        logger.info("Degree CSV loader ingest pipeline has completed.")
-
-        self._render_error_logs()
-        self._render_degree_uuids()
-
     def validate_degree_data(self, data):
         """
         Verify the required data key-values for a program type are present in the provided
@@ -312,11 +334,8 @@ class DegreeCSVDataLoader(AbstractDataLoader):
         program = Program.objects.get(degree=degree, partner=self.partner)
         is_downloaded = download_and_save_program_image(
             program, data['card_image_url'],
-            # TODO: Temporary addition of User agent to allow access to data CDNs
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
-                              '(KHTML, like Gecko) Chrome/101.0.4951.64 Safari/537.36'
-            }
+            headers=self.REQUEST_USER_AGENT_HEADERS,
+            image_fetcher=self.image_fetcher,
         )
         if not is_downloaded:
             error_message = DegreeCSVIngestionErrorMessages.IMAGE_DOWNLOAD_FAILURE.format(
@@ -329,11 +348,8 @@ class DegreeCSVDataLoader(AbstractDataLoader):
             is_downloaded = download_and_save_program_image(
                 program, data['organization_logo_override'],
                 'organization_logo_override',
-                # TODO: Temporary addition of User agent to allow access to data CDNs
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
-                                  '(KHTML, like Gecko) Chrome/101.0.4951.64 Safari/537.36'
-                }
+                headers=self.REQUEST_USER_AGENT_HEADERS,
+                image_fetcher=self.image_fetcher,
             )
             if not is_downloaded:
                 error_message = DegreeCSVIngestionErrorMessages.LOGO_IMAGE_DOWNLOAD_FAILURE.format(
@@ -378,22 +394,23 @@ class DegreeCSVDataLoader(AbstractDataLoader):
             for specialization in specializations_data:
                 specialization = specialization.strip()
                 if specialization:
-                    specialization_obj, _ = Specialization.objects.get_or_create(value=specialization)
+                    specialization_obj = self.reference_data.get(Specialization, 'value', specialization)
+                    if not specialization_obj:
+                        specialization_obj = Specialization.objects.create(value=specialization)
+                        self.reference_data.add(Specialization, 'value', specialization_obj)
                     degree.specializations.add(specialization_obj)
 
     def _get_object(self, model, key, value, degree_slug):
         """
-        Get an object from the database by its key and value
+        Get an object by its key and value, from the reference data of the loader
         """
         model_name = model._meta.object_name
-        kwrags = {key: value}
+        filters = {}
         # for translatable models, we need to pass the language code
         if model_name in ['Subject', 'LevelType']:
-            kwrags['translations__language_code'] = 'en'
-        try:
-            obj = model.objects.get(**kwrags)
-            return obj
-        except model.DoesNotExist:
+            filters['translations__language_code'] = 'en'
+        obj = self.reference_data.get(model, key, value, **filters)
+        if not obj:
             error_dict = self.MODEL_ERROR_MAPPING[model]
             error_message = error_dict['error_message'].format(
                 value,
@@ -401,9 +418,9 @@ class DegreeCSVDataLoader(AbstractDataLoader):
             )
             error_type = error_dict['error_type']
 
-            logger.exception(error_message)
+            logger.error(error_message)
             self._register_ingestion_error(error_type, error_message)
-            return None
+        return obj
 
     def _handle_additional_metadata(self, data, degree):
         """
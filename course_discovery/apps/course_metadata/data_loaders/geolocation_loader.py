@@ -42,6 +42,7 @@ class GeolocationCSVDataLoader(AbstractDataLoader):
 
     def ingest(self):
         logger.info("Initiating Geolocation CSV data loader flow.")
+        self.reference_data.clear()
         processed_products = {
             'course': self.processed_courses,
             'program': self.processed_programs,
@@ -182,15 +183,11 @@ class GeolocationCSVDataLoader(AbstractDataLoader):
 
     def validate_product_exists(self, model, key, value):
         """
-        Get an object from the database by its key and value
+        Check whether an object exists by its key and value, in the reference data of the loader
         """
-        model_name = model._meta.object_name
-        kwrags = {key: value}
-
-        return (
-            model.everything.filter(**kwrags).exists() if model_name == 'Course'
-            else model.objects.filter(**kwrags).exists()
-        )
+        if key == 'uuid':
+            value = uuid.UUID(str(value))
+        return self.reference_data.exists(model, key, value)
 
     def check_for_potential_orphans_in_courses(self):
         for geolocation_id in self.updated_geolocations:
@@ -47,6 +47,7 @@ class GeotargetingCSVDataLoader(AbstractDataLoader):
 
     def ingest(self):  # pylint: disable=too-many-statements
         logger.info("Initiating Geotargeting CSV data loader flow.")
+        self.reference_data.clear()
         for row in self.reader:
             row = self.transform_dict_keys(row)
             row_uuid = row['uuid']
@@ -241,14 +242,8 @@ class GeotargetingCSVDataLoader(AbstractDataLoader):
 
     def validate_product_exists(self, model, key, value):
         """
-        Get an object from the database by its key and value
+        Check whether an object exists by its key and value, in the reference data of the loader
         """
-        model_name = model._meta.object_name
-        kwrags = {key: value}
-        try:
-            return (
-                model.everything.filter(**kwrags).exists() if model_name == 'Course'
-                else model.objects.filter(**kwrags).exists()
-            )
-        except model.DoesNotExist:
-            return False
+        if key == 'uuid':
+            value = uuid.UUID(str(value))
+        return self.reference_data.exists(model, key, value)
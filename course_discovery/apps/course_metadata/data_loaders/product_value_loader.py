@@ -121,16 +121,7 @@ class ProductValueCSVDataLoader(AbstractDataLoader):
             error_msgs.append("Unable to validate that product exists due to invalid Product Type")
             return
 
-        model_name = model._meta.object_name
-        kwrags = {'uuid': data['uuid']}
-        exists = False
-
-        if model_name == 'Course':
-            exists = model.everything.filter(**kwrags).exists()
-        else:
-            exists = model.objects.filter(**kwrags).exists()
-
-        if not exists:
+        if not self.reference_data.exists(model, 'uuid', uuid.UUID(str(data['uuid']))):
             error_msgs.append(f"{data['product_type'].capitalize()} with UUID: {data['uuid']} was not found")
 
     def generate_values_dict(self, data, product_value=None):
@@ -191,6 +182,7 @@ class ProductValueCSVDataLoader(AbstractDataLoader):
 
     def ingest(self):
         logger.info("Initiating Product Value CSV data loader flow.")
+        self.reference_data.clear()
         for row in self.reader:
             row = self.transform_dict_keys(row)
             row_uuid = row['uuid']
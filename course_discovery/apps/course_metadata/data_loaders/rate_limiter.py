@@ -0,0 +1,103 @@
+"""
+Rate limiting of the requests data loaders make to rate limited APIs.
+"""
+import datetime
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket shared by the threads requesting an API, whose rate adapts to the responses of the API.
+
+    The rate grows additively after each request the API accepts, and is cut multiplicatively whenever the
+    API throttles a request (AIMD). When the API tells how long to wait before retrying, no request is made
+    until then.
+
+    Usage:
+        limiter.acquire()
+        response = client.get(url)
+        if response.status_code == 429:
+            limiter.record_throttled(get_retry_after(response))
+        else:
+            limiter.record_success()
+    """
+
+    def __init__(self, rate, min_rate, max_rate, burst=1, increase=0.05, decrease_factor=0.5):
+        """
+        Arguments:
+            rate (float): Initial number of requests per second.
+            min_rate (float): Number of requests per second the rate is never cut below.
+            max_rate (float): Number of requests per second the rate never grows above.
+            burst (int): Number of requests that can be made at once after a quiet period.
+            increase (float): Number of requests per second the rate grows by after each accepted request.
+            decrease_factor (float): Factor the rate is multiplied by after each throttled request.
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + max(0, now - self.updated) * self.rate)
+        self.updated = max(self.updated, now)
+
+    def acquire(self):
+        """
+        Block until a request can be made.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1 and now >= self.updated:
+                    self.tokens -= 1
+                    return
+                # Tokens only accumulate once a pause ordered by the API is over.
+                wait = max(0, self.updated - now) + (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def record_success(self):
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def record_throttled(self, retry_after=None):
+        """
+        Slow down after the API throttled a request, pausing all requests for `retry_after` seconds if given.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self.tokens = 0
+            if retry_after:
+                self.updated = max(self.updated, now + retry_after)
+
+
+def get_retry_after(response):
+    """
+    Return the number of seconds the Retry-After header of a response asks to wait, or None.
+    """
+    retry_after = response.headers.get('Retry-After')
+    if not retry_after:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
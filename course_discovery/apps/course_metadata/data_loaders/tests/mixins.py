@@ -44,6 +44,21 @@ class DataLoaderTestMixin(OAuth2Mixin):
         assert self.loader.partner.short_code == self.partner.short_code
 
 
+class FakeClock:
+    """
+    Stand-in for the `time` module whose clock only advances when sleeping.
+    """
+
+    def __init__(self, start=0):
+        self.start = self.now = start
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
 class DegreeCSVLoaderMixin:
     """
     Mixin to contain various variables and methods used for DegreeCSVDataLoader testing.
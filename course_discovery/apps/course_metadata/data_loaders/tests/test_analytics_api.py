@@ -1,4 +1,5 @@
 import json
+from unittest import mock
 
 import responses
 from django.test import TestCase
@@ -38,7 +39,7 @@ class AnalyticsAPIDataLoaderTests(DataLoaderTestMixin, TestCase):
                 course_run = CourseRunFactory(key=course_summary['course_id'], course=course)
                 course_run.save()
             else:
-                course = CourseFactory(key=course_key)
+                course = CourseFactory(key=course_key, partner=self.partner)
                 course.save()
                 course_run = CourseRunFactory(key=course_summary['course_id'], course=course)
                 course_run.save()
@@ -48,10 +49,7 @@ class AnalyticsAPIDataLoaderTests(DataLoaderTestMixin, TestCase):
         program = ProgramFactory()
         program.courses.set(courses.values())
 
-    @responses.activate
-    def test_ingest(self):
-        self._define_course_metadata()
-
+    def mock_api(self):
         url = f'{self.api_url}course_summaries/'
         responses.add(
             method=responses.GET,
@@ -60,6 +58,11 @@ class AnalyticsAPIDataLoaderTests(DataLoaderTestMixin, TestCase):
             match_querystring=False,
             content_type=JSON
         )
+
+    @responses.activate
+    def test_ingest(self):
+        self._define_course_metadata()
+        self.mock_api()
         self.loader.ingest()
 
         # For runs, let's just confirm that enrollment counts were recorded and add up counts for courses
@@ -92,3 +95,23 @@ class AnalyticsAPIDataLoaderTests(DataLoaderTestMixin, TestCase):
         programs = Program.objects.all()
         assert programs[0].enrollment_count == expected_program_enrollment_count
         assert programs[0].recent_enrollment_count == expected_program_recent_enrollment_count
+
+    @responses.activate
+    def test_ingest_bulk_update(self):
+        """ Verify enrollment counts are written in bulk, without saving the objects nor recording their history. """
+        self._define_course_metadata()
+        other_partner_run = CourseRunFactory(key='00test/03test/00test')
+        self.mocked_data = self.mocked_data + [{'course_id': '00TEST/03TEST/00TEST', 'count': '4',
+                                                'recent_count_change': '1'}]
+        self.mock_api()
+
+        with mock.patch.object(CourseRun, 'save') as mock_run_save, \
+                mock.patch.object(Course, 'save') as mock_course_save:
+            self.loader.ingest()
+
+        mock_run_save.assert_not_called()
+        mock_course_save.assert_not_called()
+        assert CourseRun.objects.filter(course__partner=self.partner, enrollment_count=0).count() == 0
+        assert not CourseRun.history.filter(enrollment_count__gt=0).exists()  # pylint: disable=no-member
+        other_partner_run.refresh_from_db()
+        assert other_partner_run.enrollment_count == 0
@@ -1,5 +1,6 @@
 import datetime
 import json
+import time
 from decimal import Decimal
 from unittest import mock
 
@@ -21,9 +22,10 @@ from course_discovery.apps.course_metadata.data_loaders.api import (
     AbstractDataLoader, CoursesApiDataLoader, EcommerceApiDataLoader, ProgramsApiDataLoader, _fatal_code
 )
 from course_discovery.apps.course_metadata.data_loaders.tests import JPEG, JSON, mock_data
-from course_discovery.apps.course_metadata.data_loaders.tests.mixins import DataLoaderTestMixin
+from course_discovery.apps.course_metadata.data_loaders.tests.mixins import DataLoaderTestMixin, FakeClock
 from course_discovery.apps.course_metadata.models import (
-    Course, CourseEntitlement, CourseRun, CourseRunType, CourseType, Organization, Program, ProgramType, Seat, SeatType
+    Course, CourseEntitlement, CourseRun, CourseRunType, CourseType, DataLoaderCheckpoint, DataLoaderFingerprint,
+    Organization, Program, ProgramType, Seat, SeatType
 )
 from course_discovery.apps.course_metadata.tests.factories import (
     CourseEntitlementFactory, CourseFactory, CourseRunFactory, OrganizationFactory, SeatFactory, SeatTypeFactory
@@ -321,6 +323,82 @@ class CoursesApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         assert original_run1_deadline == updated_run1_upgrade_deadline
         assert run3.seats.first().upgrade_deadline is None
 
+    @responses.activate
+    def test_ingest_throttled(self):
+        """ Verify that pages whose requests are throttled are requested again after slowing down. """
+        api_data = mock_data.COURSES_API_BODIES
+        url = self.api_url + 'courses/'
+        callback = mock_api_callback(url, api_data, pagination=True)
+        throttled_responses = [(429, {'Retry-After': '5'}, '')]
+        responses.add_callback(
+            responses.GET,
+            url,
+            callback=lambda request: throttled_responses.pop() if throttled_responses else callback(request),
+            content_type=JSON
+        )
+
+        clock = FakeClock(time.monotonic())
+        with mock.patch('course_discovery.apps.course_metadata.data_loaders.rate_limiter.time', clock):
+            self.loader.ingest()
+
+        assert self.loader.rate_limiter.rate == CoursesApiDataLoader.REQUEST_RATE / 2 + 0.05
+        assert clock.now >= clock.start + 5
+        assert CourseRun.objects.count() == len(api_data)
+
+    @responses.activate
+    def test_ingest_unchanged(self):
+        """ Verify that course runs whose data didn't change since they were last loaded are skipped. """
+        api_data = self.mock_api()
+        self.loader.ingest()
+        assert self.loader.fingerprints.counts['created'] == len(api_data)
+        assert DataLoaderFingerprint.objects.filter(partner=self.partner, loader='courses').count() == len(api_data)
+
+        with mock.patch.object(self.loader, 'update_course_run') as mock_update_course_run:
+            self.loader.ingest()
+
+        mock_update_course_run.assert_not_called()
+        assert self.loader.fingerprints.counts == {'skipped': len(api_data)}
+
+    @responses.activate
+    def test_ingest_changed(self):
+        """ Verify that course runs are loaded again when their data changed, or their fingerprint is outdated. """
+        api_data = self.mock_api()
+        self.loader.ingest()
+
+        DataLoaderFingerprint.objects.filter(key=api_data[0]['id']).update(fingerprint='outdated')
+        DataLoaderFingerprint.objects.filter(key=api_data[1]['id']).update(
+            modified=datetime.datetime.now(UTC) - CoursesApiDataLoader.FINGERPRINT_MAX_AGE
+        )
+        self.loader.ingest()
+
+        assert self.loader.fingerprints.counts == {'skipped': len(api_data) - 2, 'updated': 2}
+        assert DataLoaderFingerprint.objects.get(key=api_data[0]['id']).fingerprint != 'outdated'
+
+    @responses.activate
+    def test_ingest_resume(self):
+        """ Verify that a failed run is resumed from the pages it completed, and that a completed run starts over. """
+        api_data = self.mock_api()
+        self.loader.PAGE_SIZE = 1
+        process_response = self.loader._process_response  # pylint: disable=protected-access
+
+        def fail_last_page(response):
+            if not response['pagination']['next']:
+                raise ConnectionError
+            process_response(response)
+
+        with mock.patch.object(self.loader, '_process_response', side_effect=fail_last_page):
+            with pytest.raises(ConnectionError):
+                self.loader.ingest()
+
+        checkpoints = DataLoaderCheckpoint.objects.filter(partner=self.partner, loader='courses')
+        assert set(checkpoints.values_list('page', flat=True)) == set(range(1, len(api_data)))
+
+        with mock.patch.object(self.loader, 'process_single_course_run') as mock_process_single_course_run:
+            self.loader.ingest()
+
+        mock_process_single_course_run.assert_called_once_with(api_data[-1])
+        assert not checkpoints.exists()
+
     @responses.activate
     def test_ingest_exception_handling(self):
         """ Verify the data loader properly handles exceptions during processing of the data from the API. """
@@ -854,6 +932,22 @@ class EcommerceApiDataLoaderTests(DataLoaderTestMixin, TestCase):
         # Verify multiple calls to ingest data do NOT result in data integrity errors.
         self.loader.ingest()
 
+    @responses.activate
+    def test_ingest_unchanged_products(self):
+        """ Verify that ingesting products which didn't change writes nothing. """
+        self.mock_courses_api()
+        products_api_data = self.mock_products_api()
+        self.loader.ingest()
+        seat_history_count = Seat.history.count()  # pylint: disable=no-member
+        entitlement_history_count = CourseEntitlement.history.count()  # pylint: disable=no-member
+
+        self.loader.ingest()
+
+        assert Seat.history.count() == seat_history_count  # pylint: disable=no-member
+        assert CourseEntitlement.history.count() == entitlement_history_count  # pylint: disable=no-member
+        self.assert_entitlements_loaded(products_api_data)
+        self.assert_enrollment_codes_loaded(products_api_data)
+
     @responses.activate
     @mock.patch(LOGGER_PATH)
     def test_ingest_deletes(self, mock_logger):
@@ -34,28 +34,10 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
     def setUp(self) -> None:
         super().setUp()
         self.mock_access_token()
-        self.user = UserFactory.create(username="test_user", password=USER_PASSWORD, is_staff=True)
+        # The loader writes courses as the user its API client authenticates as.
+        self.user = UserFactory.create(username="test_username", password=USER_PASSWORD, is_staff=True)
         self.client.login(username=self.user.username, password=USER_PASSWORD)
 
-    def mock_call_course_api(self, method, url, payload):
-        """
-        Helper method to make api calls using test client.
-        """
-        response = None
-        if method == 'POST':
-            response = self.client.post(
-                url,
-                data=payload,
-                format='json'
-            )
-        elif method == 'PATCH':
-            response = self.client.patch(
-                url,
-                data=payload,
-                format='json'
-            )
-        return response
-
     def _assert_default_logs(self, log_capture):
         """
         Assert the initiation and completion logs are present in the logger.
@@ -159,34 +141,29 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
-
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        )
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
+
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
                     )
+                )
 
-                    # Creation call results in creating course and course run objects
-                    assert Course.everything.count() == 1
-                    assert CourseRun.everything.count() == 1
+                # Creation call results in creating course and course run objects
+                assert Course.everything.count() == 1
+                assert CourseRun.everything.count() == 1
 
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'ERROR',
-                            '[IMAGE_DOWNLOAD_FAILURE] The course image download failed for the course CSV Course.'
-                        )
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'ERROR',
+                        '[IMAGE_DOWNLOAD_FAILURE] The course image download failed for the course CSV Course.'
                     )
+                )
 
     @data(
         ('csv-course-custom-slug', 'csv-course-custom-slug'),
@@ -214,54 +191,49 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [csv_data])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(
-                        self.partner, csv_path=csv.name,
-                        product_type=self.course_type.slug,
-                        product_source=self.source.slug
-                    )
-                    loader.ingest()
-
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        )
+                loader = CSVDataLoader(
+                    self.partner, csv_path=csv.name,
+                    product_type=self.course_type.slug,
+                    product_source=self.source.slug
+                )
+                loader.ingest()
+
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
                     )
+                )
 
-                    assert Course.everything.count() == 1
-                    assert CourseRun.everything.count() == 1
-
-                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
-                    course_run = CourseRun.everything.get(course=course)
-
-                    assert course.image.read() == image_content
-                    assert course.organization_logo_override.read() == image_content
-                    self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
-                    self._assert_course_run_data(course_run, self.BASE_EXPECTED_COURSE_RUN_DATA)
-
-                    assert course.active_url_slug == expected_slug
-                    assert loader.get_ingestion_stats() == {
-                        'total_products_count': 1,
-                        'success_count': 1,
-                        'failure_count': 0,
-                        'updated_products_count': 0,
-                        'created_products_count': 1,
-                        'created_products': [{
-                            'uuid': str(course.uuid),
-                            'external_course_marketing_type': 'short_course',
-                            'url_slug': expected_slug
-                        }],
-                        'archived_products_count': 0,
-                        'archived_products': [],
-                        'errors': loader.error_logs
-                    }
+                assert Course.everything.count() == 1
+                assert CourseRun.everything.count() == 1
+
+                course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
+                course_run = CourseRun.everything.get(course=course)
+
+                assert course.image.read() == image_content
+                assert course.organization_logo_override.read() == image_content
+                self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
+                self._assert_course_run_data(course_run, self.BASE_EXPECTED_COURSE_RUN_DATA)
+
+                assert course.active_url_slug == expected_slug
+                assert loader.get_ingestion_stats() == {
+                    'total_products_count': 1,
+                    'success_count': 1,
+                    'failure_count': 0,
+                    'updated_products_count': 0,
+                    'created_products_count': 1,
+                    'created_products': [{
+                        'uuid': str(course.uuid),
+                        'external_course_marketing_type': 'short_course',
+                        'url_slug': expected_slug
+                    }],
+                    'archived_products_count': 0,
+                    'archived_products': [],
+                    'errors': loader.error_logs
+                }
 
     @responses.activate
     def test_archived_flow_published_course(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -298,58 +270,53 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(
-                        self.partner,
-                        csv_path=csv.name,
-                        product_type=CourseType.EXECUTIVE_EDUCATION_2U,
-                        product_source=self.source.slug
-                    )
-                    loader.ingest()
-
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            f'Archived 2 products in CSV Ingestion for source {self.source.slug} and product type '
-                            f'{CourseType.EXECUTIVE_EDUCATION_2U}.'
-                        ),
-                    )
+                loader = CSVDataLoader(
+                    self.partner,
+                    csv_path=csv.name,
+                    product_type=CourseType.EXECUTIVE_EDUCATION_2U,
+                    product_source=self.source.slug
+                )
+                loader.ingest()
 
-                    # Verify the existence of both draft and non-draft versions
-                    assert Course.everything.count() == 4
-                    assert AdditionalMetadata.objects.count() == 4
-
-                    course = Course.everything.get(key=self.COURSE_KEY)
-                    stats = loader.get_ingestion_stats()
-                    archived_products = stats.pop('archived_products')
-                    assert stats == {
-                        'total_products_count': 1,
-                        'success_count': 1,
-                        'failure_count': 0,
-                        'updated_products_count': 0,
-                        'created_products_count': 1,
-                        'created_products': [{
-                            'uuid': str(course.uuid),
-                            'external_course_marketing_type': 'short_course',
-                            'url_slug': 'csv-course'
-                        }],
-                        'archived_products_count': 2,
-                        'errors': loader.error_logs
-                    }
-
-                    # asserting separately due to random sort order
-                    assert set(archived_products) == {additional_metadata_one.external_identifier,
-                                                      additional_metadata_two.external_identifier}
-
-                    # Assert that a product status with different product source is not affected in Archive flow.
-                    additional_metadata__source_2.refresh_from_db()
-                    assert additional_metadata__source_2.product_status == ExternalProductStatus.Published
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        f'Archived 2 products in CSV Ingestion for source {self.source.slug} and product type '
+                        f'{CourseType.EXECUTIVE_EDUCATION_2U}.'
+                    ),
+                )
+
+                # Verify the existence of both draft and non-draft versions
+                assert Course.everything.count() == 4
+                assert AdditionalMetadata.objects.count() == 4
+
+                course = Course.everything.get(key=self.COURSE_KEY)
+                stats = loader.get_ingestion_stats()
+                archived_products = stats.pop('archived_products')
+                assert stats == {
+                    'total_products_count': 1,
+                    'success_count': 1,
+                    'failure_count': 0,
+                    'updated_products_count': 0,
+                    'created_products_count': 1,
+                    'created_products': [{
+                        'uuid': str(course.uuid),
+                        'external_course_marketing_type': 'short_course',
+                        'url_slug': 'csv-course'
+                    }],
+                    'archived_products_count': 2,
+                    'errors': loader.error_logs
+                }
+
+                # asserting separately due to random sort order
+                assert set(archived_products) == {additional_metadata_one.external_identifier,
+                                                  additional_metadata_two.external_identifier}
+
+                # Assert that a product status with different product source is not affected in Archive flow.
+                additional_metadata__source_2.refresh_from_db()
+                assert additional_metadata__source_2.product_status == ExternalProductStatus.Published
 
     @responses.activate
     def test_ingest_flow_for_preexisting_published_course(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -383,52 +350,47 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
-
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course edx+csv_123 is located in the database.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to False for the course CSV Course'
-                        )
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
+
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course edx+csv_123 is located in the database.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to False for the course CSV Course'
                     )
+                )
 
-                    # Verify the existence of both draft and non-draft versions
-                    assert Course.everything.count() == 2
-                    assert CourseRun.everything.count() == 2
+                # Verify the existence of both draft and non-draft versions
+                assert Course.everything.count() == 2
+                assert CourseRun.everything.count() == 2
 
-                    course = Course.objects.get(key=self.COURSE_KEY, partner=self.partner)
-                    course_run = CourseRun.objects.get(course=course)
+                course = Course.objects.get(key=self.COURSE_KEY, partner=self.partner)
+                course_run = CourseRun.objects.get(course=course)
 
-                    self._assert_course_data(course, expected_course_data)
-                    self._assert_course_run_data(course_run, expected_course_run_data)
+                self._assert_course_data(course, expected_course_data)
+                self._assert_course_run_data(course_run, expected_course_run_data)
 
-                    assert course.product_source == self.source
-                    assert course.draft_version.product_source == self.source
+                assert course.product_source == self.source
+                assert course.draft_version.product_source == self.source
 
-                    assert loader.get_ingestion_stats() == {
-                        'total_products_count': 1,
-                        'success_count': 1,
-                        'failure_count': 0,
-                        'updated_products_count': 1,
-                        'created_products_count': 0,
-                        'created_products': [],
-                        'archived_products_count': 0,
-                        'archived_products': [],
-                        'errors': loader.error_logs
-                    }
+                assert loader.get_ingestion_stats() == {
+                    'total_products_count': 1,
+                    'success_count': 1,
+                    'failure_count': 0,
+                    'updated_products_count': 1,
+                    'created_products_count': 0,
+                    'created_products': [],
+                    'archived_products_count': 0,
+                    'archived_products': [],
+                    'errors': loader.error_logs
+                }
 
     @responses.activate
     def test_invalid_language(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -444,47 +406,42 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             csv = self._write_csv(csv, [mock_data.INVALID_LANGUAGE])
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
-
-                    self._assert_default_logs(log_capture)
-
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to True for the course CSV Course'
-                        )
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
+
+                self._assert_default_logs(log_capture)
+
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to True for the course CSV Course'
                     )
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'ERROR',
-                            '[COURSE_RUN_UPDATE_ERROR] Unable to update course run of the course CSV Course '
-                            'in the system. The update failed with the exception: '
-                            'Language gibberish-language from provided string gibberish-language'
-                            ' is either missing or an invalid ietf language'
-                        )
+                )
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'ERROR',
+                        '[COURSE_RUN_UPDATE_ERROR] Unable to update course run of the course CSV Course '
+                        'in the system. The update failed with the exception: '
+                        'Language gibberish-language from provided string gibberish-language'
+                        ' is either missing or an invalid ietf language'
                     )
+                )
 
-                    assert Course.everything.count() == 1
-                    assert CourseRun.everything.count() == 1
+                assert Course.everything.count() == 1
+                assert CourseRun.everything.count() == 1
 
-                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
+                course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
 
-                    assert course.image.read() == image_content
-                    assert course.organization_logo_override.read() == image_content
-                    self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
+                assert course.image.read() == image_content
+                assert course.organization_logo_override.read() == image_content
+                self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
 
     @responses.activate
     def test_ingest_flow_for_preexisting_unpublished_course(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -508,37 +465,32 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         with NamedTemporaryFile() as csv:
             csv = self._write_csv(csv, [mock_data.VALID_COURSE_AND_COURSE_RUN_CSV_DICT])
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
-
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course edx+csv_123 is located in the database.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to True for the course CSV Course'
-                        )
+
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
+
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course edx+csv_123 is located in the database.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to True for the course CSV Course'
                     )
+                )
 
-                    # Verify the existence of draft only
-                    assert Course.everything.count() == 1
-                    assert CourseRun.everything.count() == 1
+                # Verify the existence of draft only
+                assert Course.everything.count() == 1
+                assert CourseRun.everything.count() == 1
 
-                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
-                    course_run = CourseRun.everything.get(course=course)
+                course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
+                course_run = CourseRun.everything.get(course=course)
 
-                    self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
-                    self._assert_course_run_data(course_run, self.BASE_EXPECTED_COURSE_RUN_DATA)
+                self._assert_course_data(course, self.BASE_EXPECTED_COURSE_DATA)
+                self._assert_course_run_data(course_run, self.BASE_EXPECTED_COURSE_RUN_DATA)
 
     @responses.activate
     def test_active_slug(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -558,50 +510,45 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
                 ]
             )
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
-
-                    self._assert_default_logs(log_capture)
-
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to True for the course CSV Course'
-                        )
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
+
+                self._assert_default_logs(log_capture)
+
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to True for the course CSV Course'
                     )
+                )
+
+                assert Course.everything.count() == 2
+                assert CourseRun.everything.count() == 2
 
-                    assert Course.everything.count() == 2
-                    assert CourseRun.everything.count() == 2
-
-                    course1 = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
-                    course2 = Course.everything.get(key='testOrg+csv_123', partner=self.partner)
-
-                    assert course1.active_url_slug == 'csv-course'
-                    assert course2.active_url_slug == 'csv-course-2'
-
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            '{}:CSV Course'.format(course1.uuid)
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            '{}:CSV Course'.format(course2.uuid)
-                        )
+                course1 = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
+                course2 = Course.everything.get(key='testOrg+csv_123', partner=self.partner)
+
+                assert course1.active_url_slug == 'csv-course'
+                assert course2.active_url_slug == 'csv-course-2'
+
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        '{}:CSV Course'.format(course1.uuid)
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        '{}:CSV Course'.format(course2.uuid)
                     )
+                )
 
     @responses.activate
     def test_ingest_flow_for_minimal_course_data(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -617,45 +564,40 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
             )
 
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
-
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to True for the course CSV Course'
-                        )
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
+
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to True for the course CSV Course'
                     )
+                )
 
-                    assert Course.everything.count() == 1
-                    assert CourseRun.everything.count() == 1
+                assert Course.everything.count() == 1
+                assert CourseRun.everything.count() == 1
 
-                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
-                    course_run = CourseRun.everything.get(course=course)
+                course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
+                course_run = CourseRun.everything.get(course=course)
 
-                    # Asserting some required and optional values to verify the correctnesss
-                    assert course.title == 'CSV Course'
-                    assert course.short_description == '<p>Very short description</p>'
-                    assert course.full_description == (
-                        '<p>Organization,Title,Number,Course Enrollment track,Image,Short Description,Long Description,'
-                        'Organization,Title,Number,Course Enrollment track,Image,'
-                        'Short Description,Long Description,</p>'
-                    )
-                    assert course.syllabus_raw == '<p>Introduction to Algorithms</p>'
-                    assert course.subjects.first().slug == "computer-science"
-                    assert course_run.staff.exists() is False
+                # Asserting some required and optional values to verify the correctnesss
+                assert course.title == 'CSV Course'
+                assert course.short_description == '<p>Very short description</p>'
+                assert course.full_description == (
+                    '<p>Organization,Title,Number,Course Enrollment track,Image,Short Description,Long Description,'
+                    'Organization,Title,Number,Course Enrollment track,Image,'
+                    'Short Description,Long Description,</p>'
+                )
+                assert course.syllabus_raw == '<p>Introduction to Algorithms</p>'
+                assert course.subjects.first().slug == "computer-science"
+                assert course_run.staff.exists() is False
 
     @responses.activate
     def test_ingest_product_metadata_flow_for_non_exec_ed(self, jwt_decode_patch):  # pylint: disable=unused-argument
@@ -673,44 +615,39 @@ class TestCSVDataLoader(CSVLoaderMixin, OAuth2Mixin, APITestCase):
         with NamedTemporaryFile() as csv:
             csv = self._write_csv(csv, [csv_data], self.CSV_DATA_KEYS_ORDER)
             with LogCapture(LOGGER_PATH) as log_capture:
-                with mock.patch.object(
-                        CSVDataLoader,
-                        '_call_course_api',
-                        self.mock_call_course_api
-                ):
-                    loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
-                    loader.ingest()
-
-                    self._assert_default_logs(log_capture)
-                    log_capture.check_present(
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Course key edx+csv_123 could not be found in database, creating the course.'
-                        ),
-                        (
-                            LOGGER_PATH,
-                            'INFO',
-                            'Draft flag is set to True for the course CSV Course'
-                        )
+                loader = CSVDataLoader(self.partner, csv_path=csv.name, product_source=self.source.slug)
+                loader.ingest()
+
+                self._assert_default_logs(log_capture)
+                log_capture.check_present(
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Course key edx+csv_123 could not be found in database, creating the course.'
+                    ),
+                    (
+                        LOGGER_PATH,
+                        'INFO',
+                        'Draft flag is set to True for the course CSV Course'
                     )
+                )
 
-                    assert Course.everything.count() == 1
-                    assert CourseRun.everything.count() == 1
+                assert Course.everything.count() == 1
+                assert CourseRun.everything.count() == 1
 
-                    course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
+                course = Course.everything.get(key=self.COURSE_KEY, partner=self.partner)
 
-                    # Asserting some required and optional values to verify the correctness
-                    assert course.title == 'CSV Course'
-                    assert course.short_description == '<p>Very short description</p>'
-                    assert course.full_description == (
-                        '<p>Organization,Title,Number,Course Enrollment track,Image,Short Description,Long Description,'
-                        'Organization,Title,Number,Course Enrollment track,Image,'
-                        'Short Description,Long Description,</p>'
-                    )
-                    assert course.syllabus_raw == '<p>Introduction to Algorithms</p>'
-                    assert course.subjects.first().slug == "computer-science"
-                    assert course.additional_metadata.product_meta is None
+                # Asserting some required and optional values to verify the correctness
+                assert course.title == 'CSV Course'
+                assert course.short_description == '<p>Very short description</p>'
+                assert course.full_description == (
+                    '<p>Organization,Title,Number,Course Enrollment track,Image,Short Description,Long Description,'
+                    'Organization,Title,Number,Course Enrollment track,Image,'
+                    'Short Description,Long Description,</p>'
+                )
+                assert course.syllabus_raw == '<p>Introduction to Algorithms</p>'
+                assert course.subjects.first().slug == "computer-science"
+                assert course.additional_metadata.product_meta is None
 
     @data(
         (['certificate_header', 'certificate_text', 'stat1_text'],
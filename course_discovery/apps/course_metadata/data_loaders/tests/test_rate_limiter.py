@@ -0,0 +1,74 @@
+import datetime
+from email.utils import format_datetime
+from unittest import mock
+
+import ddt
+from django.test import SimpleTestCase
+
+from course_discovery.apps.course_metadata.data_loaders.rate_limiter import AdaptiveRateLimiter, get_retry_after
+from course_discovery.apps.course_metadata.data_loaders.tests.mixins import FakeClock
+
+TIME_PATH = 'course_discovery.apps.course_metadata.data_loaders.rate_limiter.time'
+
+
+class AdaptiveRateLimiterTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        patcher = mock.patch(TIME_PATH, self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = AdaptiveRateLimiter(rate=2, min_rate=0.5, max_rate=3, burst=2, increase=0.5)
+
+    def test_acquire_at_rate(self):
+        """ Verify that requests are spaced by the rate once the burst is used up. """
+        for __ in range(4):
+            self.limiter.acquire()
+
+        assert self.clock.now == 1
+
+    def test_additive_increase(self):
+        """ Verify that the rate grows after each accepted request, up to its maximum. """
+        self.limiter.record_success()
+        assert self.limiter.rate == 2.5
+
+        self.limiter.record_success()
+        self.limiter.record_success()
+        assert self.limiter.rate == 3
+
+    def test_multiplicative_decrease(self):
+        """ Verify that the rate is cut after each throttled request, down to its minimum. """
+        self.limiter.record_throttled()
+        assert self.limiter.rate == 1
+
+        self.limiter.record_throttled()
+        self.limiter.record_throttled()
+        assert self.limiter.rate == 0.5
+
+    def test_retry_after(self):
+        """ Verify that no request is made before the delay asked by the API has elapsed. """
+        self.limiter.record_throttled(retry_after=10)
+        self.limiter.acquire()
+
+        assert self.clock.now == 11
+
+
+@ddt.ddt
+class GetRetryAfterTests(SimpleTestCase):
+    @ddt.data(
+        (None, None),
+        ('', None),
+        ('invalid', None),
+        ('30', 30),
+        ('-1', 0),
+    )
+    @ddt.unpack
+    def test_get_retry_after(self, header, expected):
+        headers = {'Retry-After': header} if header is not None else {}
+        assert get_retry_after(mock.Mock(headers=headers)) == expected
+
+    def test_get_retry_after_date(self):
+        retry_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=60)
+        retry_after = get_retry_after(mock.Mock(headers={'Retry-After': format_datetime(retry_at, usegmt=True)}))
+
+        assert 55 < retry_after <= 60
@@ -0,0 +1,51 @@
+from django.test import TestCase
+
+from course_discovery.apps.course_metadata.data_loaders import ReferenceDataCache
+from course_discovery.apps.course_metadata.models import Course, Organization
+from course_discovery.apps.course_metadata.tests.factories import CourseFactory, OrganizationFactory
+
+
+class ReferenceDataCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = ReferenceDataCache()
+
+    def test_get(self):
+        """ Verify objects are looked up from a single load of the model. """
+        organizations = OrganizationFactory.create_batch(2)
+
+        with self.assertNumQueries(2):
+            assert self.cache.get(Organization, 'key', organizations[0].key) == organizations[0]
+            assert self.cache.get(Organization, 'key', organizations[1].key) == organizations[1]
+            assert self.cache.get(Organization, 'key', 'missing') is None
+
+    def test_case_insensitive(self):
+        """ Verify lookups ignore case, like the database does. """
+        organization = OrganizationFactory(key='edX')
+
+        assert self.cache.get(Organization, 'key', 'EDX') == organization
+        assert self.cache.exists(Organization, 'key', 'edx')
+        assert self.cache.exists(Organization, 'name', organization.name.upper())
+
+    def test_add(self):
+        """ Verify the objects created by the loader are found without loading the model again. """
+        self.cache.get(Organization, 'key', 'missing')
+        organization = OrganizationFactory()
+        self.cache.add(Organization, 'key', organization)
+
+        with self.assertNumQueries(0):
+            assert self.cache.get(Organization, 'key', organization.key) == organization
+            assert self.cache.get(Organization, 'key', organization.key.swapcase()) == organization
+
+    def test_exists(self):
+        """ Verify course drafts are included, and the cache is reloaded once cleared. """
+        draft = CourseFactory(draft=True)
+
+        with self.assertNumQueries(1):
+            assert self.cache.exists(Course, 'uuid', draft.uuid)
+            assert not self.cache.exists(Course, 'uuid', 'missing')
+
+        course = CourseFactory()
+        assert not self.cache.exists(Course, 'uuid', course.uuid)
+        self.cache.clear()
+        assert self.cache.exists(Course, 'uuid', course.uuid)
@@ -0,0 +1,55 @@
+"""
+Handling of the course catalog events received from the event bus.
+"""
+import datetime
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from course_discovery.apps.course_metadata.models import CourseCatalogEvent
+from course_discovery.apps.course_metadata.tasks import update_course_runs_from_events
+
+logger = logging.getLogger(__name__)
+
+
+def record_course_catalog_event(body, time, delay=0):
+    """
+    Store the course run data received with a COURSE_CATALOG_INFO_CHANGED event, and queue it to be applied.
+
+    The event is applied by the update_course_runs_from_events task, `delay` seconds after the end of the
+    EVENT_BUS_BATCH_WINDOW_SECONDS window, along with the other events received during the window. Only the latest
+    event of each course run is kept, and events older than the stored one are ignored.
+
+    Arguments:
+        body (dict): course run data, in the format of the Courses API
+        time (datetime): time the event was sent
+        delay (int): number of seconds to wait before applying the event
+
+    Returns:
+        bool: whether the event was recorded, rather than ignored as out of date
+    """
+    countdown = settings.EVENT_BUS_BATCH_WINDOW_SECONDS + delay
+    values = {
+        'body': body,
+        'time': time,
+        'apply_after': timezone.now() + datetime.timedelta(seconds=countdown),
+        'applied': False,
+    }
+
+    with transaction.atomic():
+        event, created = CourseCatalogEvent.objects.select_for_update().get_or_create(
+            course_run_key=body['id'], defaults=values,
+        )
+        if not created:
+            if event.time > time:
+                logger.info('Ignoring an out of date COURSE_CATALOG_INFO_CHANGED event for course run %s.', body['id'])
+                return False
+            for field, value in values.items():
+                setattr(event, field, value)
+            event.save()
+
+    # Events left pending, should the task fail to be queued, are applied by the next run of the task.
+    update_course_runs_from_events.apply_async(countdown=countdown or None)
+    return True
@@ -1,4 +1,14 @@
+import datetime
+import logging
+import operator
+from functools import reduce
+
+import pytz
+from algoliasearch.helpers import AlgoliaException
 from algoliasearch_django import AlgoliaIndex, register
+from algoliasearch_django.settings import DEBUG
+from django.conf import settings as django_settings
+from django.db.models import Q
 
 from course_discovery.apps.course_metadata.algolia_models import (
     AlgoliaProxyCourse, AlgoliaProxyProduct, AlgoliaProxyProgram, SearchDefaultResultsConfiguration
@@ -6,6 +16,135 @@ from course_discovery.apps.course_metadata.algolia_models import (
 from course_discovery.apps.course_metadata.contentful_utils import (
     fetch_and_transform_bootcamp_contentful_data, fetch_and_transform_degree_contentful_data
 )
+from course_discovery.apps.course_metadata.models import Course, CourseRun, Program
+
+logger = logging.getLogger(__name__)
+
+# Number of courses or programs loaded at a time, with their related data, when indexing.
+ALGOLIA_INDEX_CHUNK_SIZE = 500
+# Dates of course runs which, once passed, can change whether their course and its programs are indexed.
+COURSE_RUN_INDEXING_DATE_FIELDS = ('start', 'end', 'enrollment_start', 'enrollment_end')
+# Settings attaching replica indices, which cannot be set on the temporary index of a reindex.
+REPLICA_SETTINGS = ('replicas', 'slaves')
+
+
+def iterate_in_chunks(queryset, chunk_size=ALGOLIA_INDEX_CHUNK_SIZE):
+    """
+    Iterate over the objects of a queryset, loading `chunk_size` objects at a time.
+
+    Unlike QuerySet.iterator(), the prefetch_related lookups of the queryset are applied to every chunk.
+    """
+    pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+    for start in range(0, len(pks), chunk_size):
+        yield from queryset.filter(pk__in=pks[start:start + chunk_size]).order_by('pk')
+
+
+def iterate_products(course_queryset, program_queryset):
+    """
+    Yield the courses and programs of the given querysets, one chunk at a time, with their Contentful data.
+    """
+    bootcamp_contentful_data = fetch_and_transform_bootcamp_contentful_data()
+    for course in iterate_in_chunks(course_queryset):
+        yield course, bootcamp_contentful_data
+
+    degree_contentful_data = fetch_and_transform_degree_contentful_data()
+    for program in iterate_in_chunks(program_queryset):
+        yield program, degree_contentful_data
+
+
+class ModifiedRecords:
+    """
+    Partial updates and deletions of the records of an index, sent to Algolia in batches.
+    """
+
+    def __init__(self, indexer, batch_size):
+        self.indexer = indexer
+        __, self.index, __ = indexer.get_client_and_indices()
+        self.batch_size = batch_size
+        self.records = []
+        self.object_ids = []
+        self.updated_count = 0
+        self.deleted_count = 0
+
+    def add(self, product):
+        """
+        Queue the record of a wrapped product to be updated, or deleted if it should not be indexed.
+        """
+        if self.indexer._should_index(product):  # pylint: disable=protected-access
+            self.records.append(self.indexer.get_raw_record(product))
+            if len(self.records) >= self.batch_size:
+                self._send_records()
+        else:
+            self.delete(self.indexer.objectID(product))
+
+    def delete(self, object_id):
+        """
+        Queue a record to be deleted, whether or not it is in the index.
+        """
+        self.object_ids.append(object_id)
+        if len(self.object_ids) >= self.batch_size:
+            self._send_object_ids()
+
+    def _send_records(self):
+        self.index.partial_update_objects(self.records)
+        self.updated_count += len(self.records)
+        self.records = []
+
+    def _send_object_ids(self):
+        self.index.delete_objects(self.object_ids)
+        self.deleted_count += len(self.object_ids)
+        self.object_ids = []
+
+    def flush(self, since):
+        """
+        Send the queued records, returning the number of records updated and deleted.
+        """
+        if self.records:
+            self._send_records()
+        if self.object_ids:
+            self._send_object_ids()
+
+        logger.info(
+            'Updated %d and deleted %d records of Algolia index [%s] modified since %s.',
+            self.updated_count, self.deleted_count, self.indexer.index_name, since,
+        )
+        return self.updated_count, self.deleted_count
+
+
+class ReindexedRecords:
+    """
+    Records of a full reindex, saved to the temporary index in batches.
+    """
+
+    def __init__(self, indexer, batch_size):
+        self.indexer = indexer
+        __, __, self.tmp_index = indexer.get_client_and_indices()
+        self.batch_size = batch_size
+        self.records = []
+        self.count = 0
+
+    def add(self, product):
+        """
+        Queue the record of a wrapped product to be saved, if it should be indexed.
+        """
+        if self.indexer._should_index(product):  # pylint: disable=protected-access
+            self.records.append(self.indexer.get_raw_record(product))
+            if len(self.records) >= self.batch_size:
+                self._send_records()
+
+    def _send_records(self):
+        self.tmp_index.save_objects(self.records)
+        logger.info('Saved %d records to Algolia index [%s_tmp].', len(self.records), self.indexer.index_name)
+        self.count += len(self.records)
+        self.records = []
+
+    def flush(self):
+        """
+        Send the queued records, returning the number of records saved.
+        """
+        if self.records:
+            self._send_records()
+        return self.count
 
 
 class BaseProductIndex(AlgoliaIndex):
@@ -13,23 +152,110 @@ class BaseProductIndex(AlgoliaIndex):
 
     # Bit of a hack: Override get_queryset to return all wrapped versions of all courses and programs rather than an
     # actual queryset to get around the fact that courses and programs have different fields and therefore cannot be
-    # combined in a union of querysets. AlgoliaIndex only uses get_queryset as an iterable, so an array works as well.
+    # combined in a union of querysets. AlgoliaIndex only uses get_queryset as an iterable, so a generator works as
+    # well, and spares holding every product in memory at once.
 
-    def get_queryset(self):  # pragma: no cover
+    def get_queryset(self):
+        return self.get_products(self.get_course_queryset(), self.get_program_queryset())
+
+    def get_course_queryset(self):
+        return AlgoliaProxyCourse.objects.select_related(
+            'type', 'partner', 'level_type', 'product_source', 'video', 'geolocation', 'in_year_value',
+            'location_restriction', 'additional_metadata__product_meta',
+        ).prefetch_related(
+            'authoring_organizations',
+            'subjects__translations',
+            'programs__type__translations',
+            'course_runs__type',
+            'course_runs__language',
+            'course_runs__seats',
+        )
+
+    def get_program_queryset(self):
+        return AlgoliaProxyProgram.objects.select_related(
+            'type', 'partner', 'product_source', 'primary_subject_override', 'level_type_override',
+            'language_override', 'geolocation', 'in_year_value', 'location_restriction',
+            'degree__additional_metadata', 'subscription',
+        ).prefetch_related(
+            'type__translations',
+            'authoring_organizations',
+            'expected_learning_items',
+            'labels',
+            'subscription__prices__currency',
+            'courses__level_type__translations',
+            'courses__subjects__translations',
+            'courses__topics',
+            'courses__course_runs__type',
+            'courses__course_runs__language',
+            'courses__course_runs__seats',
+            'courses__course_runs__staff',
+        )
+
+    def get_products(self, course_queryset, program_queryset):
+        """
+        Yield the courses and programs of the given querysets wrapped for this index, one chunk at a time.
+        """
         if not self.language:
             raise Exception(  # pylint: disable=broad-exception-raised
                 'Cannot update Algolia index \'{index_name}\'. No language set'.format(index_name=self.index_name)
             )
 
-        bootcamp_contentful_data = fetch_and_transform_bootcamp_contentful_data()
-        qs1 = [AlgoliaProxyProduct(course, self.language, contentful_data=bootcamp_contentful_data)
-               for course in AlgoliaProxyCourse.objects.all()]
+        for product, contentful_data in iterate_products(course_queryset, program_queryset):
+            yield AlgoliaProxyProduct(product, self.language, contentful_data=contentful_data)
+
+    def get_modified_querysets(self, since):
+        """
+        Return the querysets of the courses and programs modified since the given datetime, or having course runs
+        which started, ended, or opened or closed enrollment since then.
+        """
+        now = datetime.datetime.now(pytz.UTC)
+        course_runs = CourseRun.objects.filter(reduce(operator.or_, (
+            Q(**{f'{field}__range': (since, now)}) for field in COURSE_RUN_INDEXING_DATE_FIELDS
+        )))
+        course_ids = course_runs.values('course_id')
+        program_ids = Program.objects.filter(courses__in=course_ids).values('pk')
+        return (
+            self.get_course_queryset().filter(Q(data_modified_timestamp__gte=since) | Q(pk__in=course_ids)),
+            self.get_program_queryset().filter(Q(data_modified_timestamp__gte=since) | Q(pk__in=program_ids)),
+        )
+
+    @staticmethod
+    def get_removed_object_ids(since):
+        """
+        Return the object IDs of the courses and programs deleted since the given datetime, and of the courses of
+        excluded product sources, none of which should be in the index.
+        """
+        object_ids = []
+        for product_type, model in (('course', Course), ('program', Program)):
+            deletions = model.history.filter(history_type='-', history_date__gte=since)  # pylint: disable=no-member
+            deleted_uuids = set(deletions.values_list('uuid', flat=True))
+            # Deleting a course draft leaves its official version.
+            deleted_uuids -= set(model.objects.filter(uuid__in=deleted_uuids).values_list('uuid', flat=True))
+            object_ids += [f'{product_type}-{uuid}' for uuid in sorted(deleted_uuids, key=str)]
+
+        excluded_sources = django_settings.ALGOLIA_INDEX_EXCLUDED_SOURCES
+        excluded_courses = Course.objects.filter(product_source__slug__in=excluded_sources)
+        object_ids += [f'course-{uuid}' for uuid in excluded_courses.values_list('uuid', flat=True)]
+        return object_ids
 
-        degree_contentful_data = fetch_and_transform_degree_contentful_data()
-        qs2 = [AlgoliaProxyProduct(program, self.language, contentful_data=degree_contentful_data)
-               for program in AlgoliaProxyProgram.objects.all()]
+    def update_modified_records(self, since, batch_size=1000):
+        """
+        Push the courses and programs modified since the given datetime to the index, without rebuilding it.
 
-        return qs1 + qs2
+        Records are sent with partial updates, which add the products that were not indexed yet. Products that
+        should no longer be indexed, were deleted, or come from excluded product sources are deleted. Products
+        whose indexability depends on other dates than those of their course runs are only caught up by
+        reindex_all.
+
+        Returns:
+            (tuple): The number of records updated and deleted.
+        """
+        records = ModifiedRecords(self, batch_size)
+        for product in self.get_products(*self.get_modified_querysets(since)):
+            records.add(product)
+        for object_id in self.get_removed_object_ids(since):
+            records.delete(object_id)
+        return records.flush(since)
 
     def generate_empty_query_rule(self, rule_object_id, product_type, results):
         promoted_results = [{'objectID': f'{product_type}-{result.uuid}',
@@ -57,18 +283,68 @@ class BaseProductIndex(AlgoliaIndex):
             return [course_rule, program_rule]
         return []
 
-    # Rules aren't automatically set in regular reindex_all, so set them explicitly
-    def reindex_all(self, batch_size=1000):
+    def get_client_and_indices(self):
+        """
+        Return the Algolia client, index and temporary index, which AlgoliaIndex keeps private.
+        """
+        return self._AlgoliaIndex__client, self._AlgoliaIndex__index, self._AlgoliaIndex__tmp_index
+
+    def start_reindex(self):
+        """
+        Prepare the temporary index a full reindex saves records to, see reindex_all.
+
+        Returns:
+            (tuple): The rules and synonyms of the index, to set on the temporary index once it replaces the index.
+        """
+        __, index, tmp_index = self.get_client_and_indices()
+
         # Since reindexing removes all the rules, we will need to recreate the 2U rules after reindexing
         rules_to_create = self.get_rules()
         rules_to_create_ids = {rule['objectID'] for rule in rules_to_create}
-        existing_rules_to_keep = [
-            rule for rule in self._AlgoliaIndex__index.iter_rules()
-            if rule['objectID'] not in rules_to_create_ids
-        ]
-        final_rules = rules_to_create + existing_rules_to_keep
-        super().reindex_all(batch_size)
-        self._AlgoliaIndex__index.replace_all_rules(final_rules)
+        existing_rules_to_keep = [rule for rule in index.iter_rules() if rule['objectID'] not in rules_to_create_ids]
+        synonyms = list(index.iter_synonyms())
+
+        if self.settings:
+            # Like AlgoliaIndex.reindex_all, the replicas are only set on the index once the temporary index replaced it
+            tmp_settings = dict(self.settings, **{key: [] for key in REPLICA_SETTINGS if key in self.settings})
+            tmp_index.wait_task(tmp_index.set_settings(tmp_settings)['taskID'])
+        tmp_index.clear_index()
+        return rules_to_create + existing_rules_to_keep, synonyms
+
+    def finish_reindex(self, rules, synonyms):
+        """
+        Replace the index with the temporary index a full reindex saved records to, see reindex_all.
+        """
+        client, index, tmp_index = self.get_client_and_indices()
+
+        client.move_index(tmp_index.index_name, index.index_name)
+        logger.info('Moved Algolia index [%s] to [%s].', tmp_index.index_name, index.index_name)
+        if self.settings and any(key in self.settings for key in REPLICA_SETTINGS):
+            index.wait_task(index.set_settings(self.settings)['taskID'])
+        if synonyms:
+            index.wait_task(index.batch_synonyms(synonyms, forward_to_replicas=True)['taskID'])
+        index.replace_all_rules(rules)
+
+    def reindex_all(self, batch_size=1000):
+        """
+        Save the indexable products to a temporary index, which then replaces the index.
+
+        Returns:
+            (int): The number of records saved.
+        """
+        try:
+            reindex = self.start_reindex()
+            records = ReindexedRecords(self, batch_size)
+            for product in self.get_queryset():
+                records.add(product)
+            count = records.flush()
+            self.finish_reindex(*reindex)
+            return count
+        except AlgoliaException as e:
+            if DEBUG:
+                raise
+            logger.warning('Error while reindexing Algolia index [%s]: %s', self.index_name, e)
+            return 0
 
 
 class EnglishProductIndex(BaseProductIndex):
@@ -212,9 +488,42 @@ class ProductMetaIndex(AlgoliaIndex):
         for indexer in self.model_index:
             indexer.clear_index()
 
+    def add_products(self, records, course_queryset, program_queryset):
+        """
+        Add the courses and programs of the given querysets to the records of every index.
+
+        Every product is loaded once, so the values computed for one index are reused for the others.
+        """
+        for product, contentful_data in iterate_products(course_queryset, program_queryset):
+            for indexer_records in records:
+                indexer_records.add(
+                    AlgoliaProxyProduct(product, indexer_records.indexer.language, contentful_data=contentful_data)
+                )
+
     def reindex_all(self, batch_size=1000):
-        for indexer in self.model_index:
-            indexer.reindex_all(batch_size)
+        indexers = self.model_index
+        try:
+            reindexes = [indexer.start_reindex() for indexer in indexers]
+            records = [ReindexedRecords(indexer, batch_size) for indexer in indexers]
+            self.add_products(records, indexers[0].get_course_queryset(), indexers[0].get_program_queryset())
+            for indexer, indexer_records, reindex in zip(indexers, records, reindexes):
+                indexer_records.flush()
+                indexer.finish_reindex(*reindex)
+        except AlgoliaException as e:
+            if DEBUG:
+                raise
+            logger.warning('Error while reindexing the Algolia product indices: %s', e)
+
+    def update_modified_records(self, since, batch_size=1000):
+        records = [ModifiedRecords(indexer, batch_size) for indexer in self.model_index]
+        self.add_products(records, *self.model_index[0].get_modified_querysets(since))
+
+        for object_id in self.model_index[0].get_removed_object_ids(since):
+            for indexer_records in records:
+                indexer_records.delete(object_id)
+
+        for indexer_records in records:
+            indexer_records.flush(since)
 
 
 register(AlgoliaProxyProduct, index_cls=ProductMetaIndex)
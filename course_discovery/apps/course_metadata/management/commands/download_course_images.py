@@ -3,7 +3,7 @@ import logging
 from django.core.management import BaseCommand
 
 from course_discovery.apps.course_metadata.models import Course
-from course_discovery.apps.course_metadata.utils import download_and_save_course_image
+from course_discovery.apps.course_metadata.utils import ImageFetcher, download_and_save_course_image
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +20,13 @@ class Command(BaseCommand):
             dest='overwrite_existing',
             help='Overwrite existing image content'
         )
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            default=None,
+            dest='max_workers',
+            help='Number of threads downloading images, defaults to the IMAGE_DOWNLOAD_MAX_WORKERS setting'
+        )
 
     def handle(self, *args, **options):
         courses = Course.objects.filter(card_image_url__isnull=False).exclude(card_image_url='').order_by('key')
@@ -34,6 +41,9 @@ class Command(BaseCommand):
 
         logger.info('Retrieving images for [%d] courses...', count)
 
-        for course in courses:
-            logger.info('Retrieving image for course [%s] from [%s]...', course.key, course.card_image_url)
-            download_and_save_course_image(course, course.card_image_url)
+        courses = list(courses)
+        with ImageFetcher(max_workers=options['max_workers']) as image_fetcher:
+            image_fetcher.prefetch(course.card_image_url for course in courses)
+            for course in courses:
+                logger.info('Retrieving image for course [%s] from [%s]...', course.key, course.card_image_url)
+                download_and_save_course_image(course, course.card_image_url, image_fetcher=image_fetcher)
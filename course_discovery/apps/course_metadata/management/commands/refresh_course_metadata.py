@@ -1,6 +1,7 @@
 import concurrent.futures
-import itertools
 import logging
+import time
+from collections import namedtuple
 
 import backoff
 import waffle  # lint-amnesty, pylint: disable=invalid-django-waffle-import
@@ -16,11 +17,76 @@ from course_discovery.apps.course_metadata.data_loaders.analytics_api import Ana
 from course_discovery.apps.course_metadata.data_loaders.api import (
     CoursesApiDataLoader, EcommerceApiDataLoader, ProgramsApiDataLoader
 )
-from course_discovery.apps.course_metadata.models import Course, DataLoaderConfig, Image, Video
-from course_discovery.apps.course_metadata.signals import connect_api_change_receiver
+from course_discovery.apps.course_metadata.models import (
+    Course, DataLoaderCheckpoint, DataLoaderConfig, Image, Program, ProgramAggregate, Video
+)
+from course_discovery.apps.course_metadata.signals import (
+    connect_api_change_receiver, connect_program_aggregate_receivers, disconnect_program_aggregate_receivers
+)
 
 logger = logging.getLogger(__name__)
 
+# The data loaders refreshing the metadata of a partner, in the order they run serially. Each item is the loader class,
+# the Partner attribute holding the URL of its API, its number of worker threads (None to use the configured number)
+# and the loaders whose data it needs. When run in parallel, a loader starts as soon as the loaders it needs have
+# completed for the partner, whether they succeeded or not.
+PIPELINE = (
+    (CoursesApiDataLoader, 'courses_api_url', None, ()),
+    (EcommerceApiDataLoader, 'ecommerce_api_url', 1, (CoursesApiDataLoader,)),
+    (ProgramsApiDataLoader, 'programs_api_url', None, (CoursesApiDataLoader,)),
+    (AnalyticsAPIDataLoader, 'analytics_url', 1, (EcommerceApiDataLoader, ProgramsApiDataLoader)),
+)
+
+LoaderTask = namedtuple('LoaderTask', 'loader_class partner api_url max_workers is_threadsafe dependencies')
+
+
+def get_stages(pipeline):
+    """
+    Return the stage of each loader of a pipeline: 1 for loaders needing no other, then 1 more than the latest
+    stage of the loaders it needs.
+    """
+    stages = {}
+    for loader_class, __, __, dependencies in pipeline:
+        stages[loader_class] = max((stages[dependency] for dependency in dependencies), default=0) + 1
+    return stages
+
+
+def run_loader_tasks(executor, tasks):
+    """
+    Run loader tasks in the worker processes of an executor, each as soon as the tasks of the same partner it
+    depends on have completed. Tasks of different partners run concurrently. Dependencies that are not among the
+    tasks, because their loader is not run, are ignored.
+
+    Returns:
+        bool: True if all the loaders succeeded.
+    """
+    success = True
+    pending = list(tasks)
+    running = {}
+    scheduled = {(task.partner.pk, task.loader_class) for task in tasks}
+    completed = set()
+    while pending or running:
+        for task in [task for task in pending if task.dependencies & scheduled <= completed]:
+            pending.remove(task)
+            logger.info(f'Executing Loader {task.loader_class.__name__}, url: {task.api_url}')
+            future = executor.submit(
+                execute_parallel_loader,
+                task.loader_class,
+                task.partner,
+                task.api_url,
+                task.max_workers,
+                task.is_threadsafe,
+            )
+            running[future] = task
+
+        done, __ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            task = running.pop(future)
+            completed.add((task.partner.pk, task.loader_class))
+            success = future.result() and success
+
+    return success
+
 
 def execute_loader(loader_class, *loader_args):
     @backoff.on_exception(
@@ -33,8 +99,10 @@ def execute_loader(loader_class, *loader_args):
     def run_loader():
         return loader_class(*loader_args).ingest()
 
+    start = time.time()
     try:
         run_loader()
+        logger.info('%s completed in %.1f seconds.', loader_class.__name__, time.time() - start)
         return True
     except Exception:  # pylint: disable=broad-except
         logger.exception('%s failed!', loader_class.__name__)
@@ -75,6 +143,20 @@ class Command(BaseCommand):
             help='The stage of pipeline to be run. If this argument is not provided it runs all pipeline stages.'
         )
 
+        parser.add_argument(
+            '--processes',
+            type=int,
+            help='Number of worker processes shared by the loaders of all partners when the parallel_refresh_pipeline '
+                 'switch is active. Defaults to the number of CPUs.'
+        )
+
+        parser.add_argument(
+            '--full_run',
+            action='store_true',
+            help='Load every page again, instead of resuming the runs of the loaders that failed last time from the '
+                 'pages they completed.'
+        )
+
     def handle(self, *args, **options):
         # For each partner defined...
         partners = Partner.objects.all()
@@ -95,103 +177,92 @@ class Command(BaseCommand):
         for model in apps.get_app_config('course_metadata').get_models():
             for signal in (post_save, post_delete):
                 signal.disconnect(receiver=api_change_receiver, sender=model)
+        # Likewise, the aggregates of all the programs are refreshed once, after data loading.
+        disconnect_program_aggregate_receivers()
 
-        success = True
-        for partner in partners:
+        stages = get_stages(PIPELINE)
+        if data_loader_stage and not 1 <= data_loader_stage <= max(stages.values()):
+            raise CommandError(f'Invalid data loader stage. It must be between 1-{max(stages.values())}')
 
-            # The Linux kernel implements copy-on-write when fork() is called to create a new
-            # process. Pages that the parent and child processes share, such as the database
-            # connection, are marked read-only. If a write is performed on a read-only page
-            # (e.g., closing the connection), it is then copied, since the memory is no longer
-            # identical between the two processes. This leads to the following behavior:
-            #
-            # 1) Newly forked process
-            #       parent
-            #              -> connection (Django open, MySQL open)
-            #       child
-            #
-            # 2) Child process closes the connection
-            #       parent -> connection (*Django open, MySQL closed*)
-            #       child  -> connection (Django closed, MySQL closed)
-            #
-            # Calling connection.close() from a child process causes the MySQL server to
-            # close a connection which the parent process thinks is still usable. Since
-            # the parent process thinks the connection is still open, Django won't attempt
-            # to open a new one, and the parent ends up running a query on a closed connection.
-            # This results in a 'MySQL server has gone away' error.
-            #
-            # To resolve this, we force Django to reconnect to the database before running any queries.
-            connection.connect()
+        if options.get('full_run'):
+            DataLoaderCheckpoint.objects.filter(partner__in=partners).delete()
 
+        tasks = []
+        max_workers = DataLoaderConfig.get_solo().max_workers
+        for partner in partners:
             # If no courses exist for this partner, this command is likely being run on a
             # new catalog installation. In that case, we don't want multiple threads racing
             # to create courses. If courses do exist, this command is likely being run
             # as an update, significantly lowering the probability of race conditions.
             courses_exist = Course.objects.filter(partner=partner).exists()
             is_threadsafe = courses_exist and waffle.switch_is_active('threaded_metadata_write')
-            max_workers = DataLoaderConfig.get_solo().max_workers
 
             logger.info(
                 'Command is{negation} using threads to write data.'.format(negation='' if is_threadsafe else ' not')  # lint-amnesty, pylint: disable=logging-format-interpolation
             )
 
-            pipeline = (
-                (
-                    (CoursesApiDataLoader, partner.courses_api_url, 1),
-                ),
-                (
-                    (EcommerceApiDataLoader, partner.ecommerce_api_url, 1),
-                    (ProgramsApiDataLoader, partner.programs_api_url, max_workers),
-                ),
-                (
-                    (AnalyticsAPIDataLoader, partner.analytics_url, 1),
-                ),
-            )
-
-            if data_loader_stage:
-                try:
-                    pipeline = (pipeline[data_loader_stage - 1],)
-                except IndexError:
-                    raise CommandError(f'Invalid data loader stage. It must be between 1-{len(pipeline)}')  # lint-amnesty, pylint: disable=raise-missing-from
-
-            if waffle.switch_is_active('parallel_refresh_pipeline'):
-                futures = []
-                for stage in pipeline:
-                    with concurrent.futures.ProcessPoolExecutor() as executor:
-                        for loader_class, api_url, max_workers in stage:
-                            if api_url:
-                                logger.info(f'Executing Loader {loader_class.__name__}, url: {api_url}')
-                                futures.append(executor.submit(
-                                    execute_parallel_loader,
-                                    loader_class,
-                                    partner,
-                                    api_url,
-                                    max_workers,
-                                    is_threadsafe,
-                                ))
-
-                success = success and all(f.result() for f in futures)
-            else:
-                # Flatten pipeline and run serially.
-                for loader_class, api_url, max_workers in itertools.chain(*(stage for stage in pipeline)):
-                    if api_url:
-                        logger.info(f'Executing Loader {loader_class.__name__}, url: {api_url}')
-                        success = execute_loader(
-                            loader_class,
-                            partner,
-                            api_url,
-                            max_workers,
-                            is_threadsafe,
-                        ) and success
+            for loader_class, api_url_attribute, loader_max_workers, dependencies in PIPELINE:
+                api_url = getattr(partner, api_url_attribute)
+                if api_url and (not data_loader_stage or stages[loader_class] == data_loader_stage):
+                    tasks.append(LoaderTask(
+                        loader_class,
+                        partner,
+                        api_url,
+                        loader_max_workers or max_workers,
+                        is_threadsafe,
+                        {(partner.pk, dependency) for dependency in dependencies},
+                    ))
 
             # TODO Cleanup CourseRun overrides equivalent to the Course values.
 
-        connection.connect()  # reconnect to django outside of loop (see connect comment above)
+        if waffle.switch_is_active('parallel_refresh_pipeline'):
+            # A single pool is shared by all partners, so that the loaders of different partners run concurrently
+            # within the same budget of worker processes.
+            with concurrent.futures.ProcessPoolExecutor(max_workers=options.get('processes')) as executor:
+                success = run_loader_tasks(executor, tasks)
+        else:
+            success = True
+            for task in tasks:
+                logger.info(f'Executing Loader {task.loader_class.__name__}, url: {task.api_url}')
+                success = execute_loader(
+                    task.loader_class,
+                    task.partner,
+                    task.api_url,
+                    task.max_workers,
+                    task.is_threadsafe,
+                ) and success
+
+        # The Linux kernel implements copy-on-write when fork() is called to create a new
+        # process. Pages that the parent and child processes share, such as the database
+        # connection, are marked read-only. If a write is performed on a read-only page
+        # (e.g., closing the connection), it is then copied, since the memory is no longer
+        # identical between the two processes. This leads to the following behavior:
+        #
+        # 1) Newly forked process
+        #       parent
+        #              -> connection (Django open, MySQL open)
+        #       child
+        #
+        # 2) Child process closes the connection
+        #       parent -> connection (*Django open, MySQL closed*)
+        #       child  -> connection (Django closed, MySQL closed)
+        #
+        # Calling connection.close() from a child process causes the MySQL server to
+        # close a connection which the parent process thinks is still usable. Since
+        # the parent process thinks the connection is still open, Django won't attempt
+        # to open a new one, and the parent ends up running a query on a closed connection.
+        # This results in a 'MySQL server has gone away' error.
+        #
+        # To resolve this, we force Django to reconnect to the database before running any queries.
+        connection.connect()
 
         # Clean up any media orphans that we might have created
         delete_orphans(Image)
         delete_orphans(Video)
 
+        connect_program_aggregate_receivers()
+        ProgramAggregate.refresh(Program.objects.filter(partner__in=partners))
+
         set_api_timestamp()
 
         # Re-connect back the api_change_receiver receiver to post_save and post_delete signals
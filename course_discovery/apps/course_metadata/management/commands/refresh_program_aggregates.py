@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from course_discovery.apps.api.cache import set_api_timestamp
+from course_discovery.apps.core.models import Partner
+from course_discovery.apps.course_metadata.models import Program, ProgramAggregate
+
+
+class Command(BaseCommand):
+    """
+    Management command computing and storing the aggregates of programs, see ProgramAggregate.
+    Example usage:
+      $ ./manage.py refresh_program_aggregates --partner_code edx
+    """
+    help = 'Refresh the values of programs computed from their courses, course runs, seats and entitlements.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--partner_code',
+            help='The short code for a specific partner whose programs are refreshed.'
+        )
+
+    def handle(self, *args, **options):
+        programs = Program.objects.all()
+        partner_code = options.get('partner_code')
+        if partner_code:
+            if not Partner.objects.filter(short_code=partner_code).exists():
+                raise CommandError(f'Partner {partner_code} does not exist.')
+            programs = programs.filter(partner__short_code=partner_code)
+
+        ProgramAggregate.refresh(programs)
+        # Aggregates are refreshed in bulk, without sending the signals invalidating the API cache.
+        set_api_timestamp()
@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import ddt
@@ -16,11 +17,11 @@ from course_discovery.apps.course_metadata.data_loaders.api import (
     CoursesApiDataLoader, EcommerceApiDataLoader, ProgramsApiDataLoader
 )
 from course_discovery.apps.course_metadata.data_loaders.tests import mock_data
-from course_discovery.apps.course_metadata.management.commands.refresh_course_metadata import execute_parallel_loader
-from course_discovery.apps.course_metadata.models import Image, Video
+from course_discovery.apps.course_metadata.models import DataLoaderCheckpoint, Image, Video
 from course_discovery.apps.course_metadata.tests.factories import CourseFactory
 
 JSON = 'application/json'
+COMMAND_PATH = 'course_discovery.apps.course_metadata.management.commands.refresh_course_metadata'
 
 
 @ddt.ddt
@@ -30,7 +31,7 @@ class RefreshCourseMetadataCommandTests(OAuth2Mixin, TransactionTestCase):
         self.partner = PartnerFactory()
         partner = self.partner
         self.pipeline = [
-            (CoursesApiDataLoader, partner.courses_api_url, 1),
+            (CoursesApiDataLoader, partner.courses_api_url, None),
             (EcommerceApiDataLoader, partner.ecommerce_api_url, 1),
             (ProgramsApiDataLoader, partner.programs_api_url, None),
             (AnalyticsAPIDataLoader, partner.analytics_url, 1),
@@ -131,12 +132,12 @@ class RefreshCourseMetadataCommandTests(OAuth2Mixin, TransactionTestCase):
     def test_refresh_course_metadata_parallel(self, mock_set_api_timestamp, mock_receiver):
         self.mock_apis()
 
-        with mock.patch('concurrent.futures.ProcessPoolExecutor.submit') as mock_executor:
-            call_command('refresh_course_metadata')
+        with mock.patch(f'{COMMAND_PATH}.concurrent.futures.ProcessPoolExecutor', ThreadPoolExecutor):
+            with mock.patch(f'{COMMAND_PATH}.execute_parallel_loader', return_value=True) as mock_executor:
+                call_command('refresh_course_metadata')
 
             # Set up expected calls
-            expected_calls = [mock.call(execute_parallel_loader, loader_class,
-                                        self.partner, api_url, max_workers or 7, True)
+            expected_calls = [mock.call(loader_class, self.partner, api_url, max_workers or 7, True)
                               for loader_class, api_url, max_workers in self.pipeline]
             mock_executor.assert_has_calls(expected_calls, any_order=True)
 
@@ -145,6 +146,39 @@ class RefreshCourseMetadataCommandTests(OAuth2Mixin, TransactionTestCase):
         assert mock_set_api_timestamp.call_count == 1
         assert not mock_receiver.called
 
+    @override_switch('parallel_refresh_pipeline', True)
+    def test_refresh_course_metadata_parallel_dependencies(self):
+        """ Verify loaders start once the loaders they need completed for the partner, across partners. """
+        other_partner = PartnerFactory()
+        executed = []
+
+        def execute(loader_class, partner, *args):
+            executed.append((loader_class, partner))
+            return True
+
+        with mock.patch(f'{COMMAND_PATH}.concurrent.futures.ProcessPoolExecutor', ThreadPoolExecutor):
+            with mock.patch(f'{COMMAND_PATH}.execute_parallel_loader', side_effect=execute):
+                call_command('refresh_course_metadata', '--processes=1')
+
+        for partner in (self.partner, other_partner):
+            partner_loaders = [
+                loader_class for loader_class, executed_partner in executed if executed_partner == partner
+            ]
+            assert partner_loaders[0] == CoursesApiDataLoader
+            assert set(partner_loaders[1:3]) == {EcommerceApiDataLoader, ProgramsApiDataLoader}
+            assert partner_loaders[3] == AnalyticsAPIDataLoader
+
+    def test_refresh_course_metadata_full_run(self):
+        """ Verify the pages completed by failed runs are forgotten when a full run is requested. """
+        DataLoaderCheckpoint.objects.create(partner=self.partner, loader='courses', page=1)
+
+        with mock.patch(f'{COMMAND_PATH}.execute_loader', return_value=True):
+            call_command('refresh_course_metadata')
+            assert DataLoaderCheckpoint.objects.exists()
+
+            call_command('refresh_course_metadata', '--full_run')
+            assert not DataLoaderCheckpoint.objects.exists()
+
     def test_refresh_course_metadata_with_invalid_partner_code(self):
         """ Verify an error is raised if an invalid partner code is passed on the command line. """
         with pytest.raises(CommandError):
@@ -0,0 +1,62 @@
+import logging
+import time
+
+from algoliasearch_django import algolia_engine
+from algoliasearch_django.settings import SETTINGS
+from django.core.management.base import BaseCommand
+
+from course_discovery.apps.core.utils import parse_since
+from course_discovery.apps.course_metadata.algolia_local import LocalAlgoliaClient
+from course_discovery.apps.course_metadata.algolia_models import AlgoliaProxyProduct
+from course_discovery.apps.course_metadata.index import ProductMetaIndex
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command updating the Algolia product indices, in English and Spanish.
+    Example usage:
+      $ ./manage.py update_algolia_index
+      $ ./manage.py update_algolia_index --since 2024-01-31T12:00:00
+      $ ./manage.py update_algolia_index --local
+    """
+    help = 'Reindex all the courses and programs in Algolia, or only push those modified since a given datetime.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Only push the products modified in the last day, with partial updates, instead of reindexing.'
+        )
+        parser.add_argument(
+            '--since',
+            help='ISO 8601 datetime (UTC unless an offset is given). Implies --incremental and only pushes '
+                 'the products modified since then.'
+        )
+        parser.add_argument(
+            '--batch_size',
+            type=int,
+            default=1000,
+            help='Number of records sent to Algolia per request.'
+        )
+        parser.add_argument(
+            '--local',
+            action='store_true',
+            help='Index into an in memory stand-in for Algolia, e.g. to benchmark indexing offline.'
+        )
+
+    def handle(self, *args, **options):
+        if options['local']:
+            index = ProductMetaIndex(AlgoliaProxyProduct, LocalAlgoliaClient(), SETTINGS)
+        else:
+            index = algolia_engine.get_adapter(AlgoliaProxyProduct)
+
+        start = time.time()
+        if options['incremental'] or options['since']:
+            since = parse_since(options['since'])
+            index.update_modified_records(since, batch_size=options['batch_size'])
+        else:
+            index.reindex_all(batch_size=options['batch_size'])
+
+        logger.info('Updated the Algolia product indices in %.1f seconds.', time.time() - start)
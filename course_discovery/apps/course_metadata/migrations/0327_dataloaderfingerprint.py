@@ -0,0 +1,27 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_alter_user_first_name'),
+        ('course_metadata', '0326_productvaluedataloaderconfiguration'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataLoaderFingerprint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('loader', models.CharField(max_length=64)),
+                ('key', models.CharField(max_length=255)),
+                ('fingerprint', models.CharField(max_length=64)),
+                ('modified', models.DateTimeField(auto_now=True)),
+                ('partner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.partner')),
+            ],
+            options={
+                'unique_together': {('partner', 'loader', 'key')},
+            },
+        ),
+    ]
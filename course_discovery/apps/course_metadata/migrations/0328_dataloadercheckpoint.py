@@ -0,0 +1,26 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_alter_user_first_name'),
+        ('course_metadata', '0327_dataloaderfingerprint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataLoaderCheckpoint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('loader', models.CharField(max_length=64)),
+                ('page', models.PositiveIntegerField()),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('partner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.partner')),
+            ],
+            options={
+                'unique_together': {('partner', 'loader', 'page')},
+            },
+        ),
+    ]
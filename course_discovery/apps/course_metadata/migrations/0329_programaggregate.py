@@ -0,0 +1,26 @@
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_metadata', '0328_dataloadercheckpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgramAggregate',
+            fields=[
+                ('program', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='aggregate', serialize=False, to='course_metadata.program')),
+                ('price_ranges', models.JSONField(default=list, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('start', models.DateTimeField(null=True)),
+                ('weeks_to_complete_min', models.PositiveSmallIntegerField(null=True)),
+                ('weeks_to_complete_max', models.PositiveSmallIntegerField(null=True)),
+                ('languages', models.JSONField(default=list)),
+                ('seat_types', models.JSONField(default=list)),
+                ('modified', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
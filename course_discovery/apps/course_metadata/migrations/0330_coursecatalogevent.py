@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_metadata', '0329_programaggregate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseCatalogEvent',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('course_run_key', models.CharField(max_length=255, unique=True)),
+                ('body', models.JSONField()),
+                ('time', models.DateTimeField()),
+                ('apply_after', models.DateTimeField()),
+                ('applied', models.BooleanField(db_index=True, default=False)),
+            ],
+        ),
+    ]
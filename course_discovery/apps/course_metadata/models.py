@@ -2,6 +2,7 @@ import datetime
 import itertools
 import logging
 from collections import Counter, defaultdict
+from decimal import Decimal
 from urllib.parse import urljoin
 from uuid import uuid4
 
@@ -12,9 +13,10 @@ from config_models.models import ConfigurationModel
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import FileExtensionValidator, MaxValueValidator, MinValueValidator, RegexValidator
 from django.db import IntegrityError, models, transaction
-from django.db.models import F, Q, UniqueConstraint
+from django.db.models import F, Prefetch, Q, UniqueConstraint
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django_countries import countries as COUNTRIES
@@ -3128,13 +3130,16 @@ class Program(PkSearchableMixin, TimeStampedModel):
 
         return None
 
+    def _get_excluded_course_run_ids(self):
+        return {course_run.id for course_run in self.excluded_course_runs.all()}
+
     @property
     def course_runs(self):
         """
         Warning! Only call this method after retrieving programs from `ProgramSerializer.prefetch_queryset()`.
         Otherwise, this method will incur many, many queries when fetching related courses and course runs.
         """
-        excluded_course_run_ids = [course_run.id for course_run in self.excluded_course_runs.all()]
+        excluded_course_run_ids = self._get_excluded_course_run_ids()
 
         for course in self.courses.all():
             for run in course.course_runs.all():
@@ -3143,7 +3148,7 @@ class Program(PkSearchableMixin, TimeStampedModel):
 
     @property
     def canonical_course_runs(self):
-        excluded_course_run_ids = [course_run.id for course_run in self.excluded_course_runs.all()]
+        excluded_course_run_ids = self._get_excluded_course_run_ids()
 
         for course in self.courses.all():
             canonical_course_run = course.canonical_course_run
@@ -3349,6 +3354,17 @@ class Program(PkSearchableMixin, TimeStampedModel):
 
         return None
 
+    @cached_property
+    def aggregate_values(self):
+        """
+        Values computed from the courses of the program, as stored in its ProgramAggregate, or computed now if it
+        has none yet.
+        """
+        try:
+            return self.aggregate.get_values()
+        except ProgramAggregate.DoesNotExist:
+            return ProgramAggregate.compute(self)
+
     @property
     def staff(self):
         advertised_course_runs = [course.advertised_course_run for
@@ -3444,6 +3460,88 @@ class Program(PkSearchableMixin, TimeStampedModel):
         self.save()
 
 
+class ProgramAggregate(models.Model):
+    """
+    Values of a program computed from its courses, course runs, seats and entitlements.
+
+    They are stored so that serializing and indexing a program doesn't load and walk all of these objects. Aggregates
+    are refreshed after the objects they are computed from change, and by refresh_course_metadata. Values depending
+    on the current date, like the seats counted in the total price of a program, are as current as the last refresh.
+    """
+    program = models.OneToOneField(Program, models.CASCADE, primary_key=True, related_name='aggregate')
+    price_ranges = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+    start = models.DateTimeField(null=True)
+    weeks_to_complete_min = models.PositiveSmallIntegerField(null=True)
+    weeks_to_complete_max = models.PositiveSmallIntegerField(null=True)
+    languages = models.JSONField(default=list)
+    seat_types = models.JSONField(default=list)
+    modified = models.DateTimeField(auto_now=True)
+
+    VALUE_FIELDS = (
+        'price_ranges', 'start', 'weeks_to_complete_min', 'weeks_to_complete_max', 'languages', 'seat_types',
+    )
+    REFRESH_BATCH_SIZE = 100
+
+    def __str__(self):
+        return str(self.program)
+
+    @staticmethod
+    def compute(program):
+        """
+        Compute the values of the aggregate of a program.
+        """
+        return {
+            'price_ranges': program.price_ranges,
+            'start': program.start,
+            'weeks_to_complete_min': program.weeks_to_complete_min,
+            'weeks_to_complete_max': program.weeks_to_complete_max,
+            'languages': sorted(language.code for language in program.languages),
+            'seat_types': sorted(seat_type.slug for seat_type in program.seat_types),
+        }
+
+    def get_values(self):
+        values = {field: getattr(self, field) for field in self.VALUE_FIELDS}
+        # Prices are stored as strings, to be read back as the Decimals they were computed as.
+        values['price_ranges'] = [
+            {**price_range, **{key: Decimal(price_range[key]) for key in ('min', 'max', 'total')}}
+            for price_range in self.price_ranges
+        ]
+        return values
+
+    @classmethod
+    def refresh(cls, programs):
+        """
+        Compute and store the aggregates of programs, given as a queryset.
+        """
+        seats = Seat.everything.select_related('type', 'currency')
+        course_runs = CourseRun.everything.select_related('language').prefetch_related(
+            Prefetch('seats', queryset=seats),
+        )
+        courses = Course.everything.select_related('canonical_course_run__course').prefetch_related(
+            Prefetch('canonical_course_run__seats', queryset=seats),
+            Prefetch('course_runs', queryset=course_runs),
+            'entitlements__mode',
+            'entitlements__currency',
+        )
+        programs = programs.select_related('type').prefetch_related(
+            'excluded_course_runs',
+            'type__applicable_seat_types',
+            Prefetch('courses', queryset=courses),
+        ).order_by('pk')
+
+        count = 0
+        program_ids = list(programs.values_list('pk', flat=True))
+        for start in range(0, len(program_ids), cls.REFRESH_BATCH_SIZE):
+            batch = programs.filter(pk__in=program_ids[start:start + cls.REFRESH_BATCH_SIZE])
+            aggregates = [cls(program=program, **cls.compute(program)) for program in batch]
+            with transaction.atomic():
+                cls.objects.filter(program__in=[aggregate.program for aggregate in aggregates]).delete()
+                cls.objects.bulk_create(aggregates)
+            count += len(aggregates)
+
+        logger.info('Refreshed the aggregates of %d programs.', count)
+
+
 class ProgramSubscription(PkSearchableMixin, TimeStampedModel):
     """Model for storing program subscription eligibility"""
     uuid = models.UUIDField(primary_key=True, default=uuid4, editable=False, unique=True, verbose_name=_('ID'))
@@ -4104,6 +4202,62 @@ class DataLoaderConfig(SingletonModel):
     max_workers = models.PositiveSmallIntegerField(default=7)
 
 
+class DataLoaderFingerprint(models.Model):
+    """
+    Fingerprint of the upstream data an object was last loaded from by a data loader.
+
+    Data loaders skip the objects whose upstream data has the same fingerprint as the last time they were loaded.
+    """
+    partner = models.ForeignKey(Partner, models.CASCADE)
+    loader = models.CharField(max_length=64)
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    modified = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('partner', 'loader', 'key')
+
+    def __str__(self):
+        return f'{self.loader}: {self.key}'
+
+
+class DataLoaderCheckpoint(models.Model):
+    """
+    Page of an upstream API a data loader completed during a run that did not complete.
+
+    Data loaders skip the pages they already completed when they are run again, and delete their checkpoints once
+    they complete a run.
+    """
+    partner = models.ForeignKey(Partner, models.CASCADE)
+    loader = models.CharField(max_length=64)
+    page = models.PositiveIntegerField()
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('partner', 'loader', 'page')
+
+    def __str__(self):
+        return f'{self.loader}: page {self.page}'
+
+
+class CourseCatalogEvent(models.Model):
+    """
+    Latest COURSE_CATALOG_INFO_CHANGED event received for a course run, see update_course_data_from_event.
+
+    Events are stored before they are acknowledged, then applied by the update_course_runs_from_events task once
+    `apply_after` is past. Events older than the one stored for a course run are ignored, so that the course run is
+    updated in the order its events were sent.
+    """
+    course_run_key = models.CharField(max_length=255, unique=True)
+    body = models.JSONField()
+    time = models.DateTimeField()
+    apply_after = models.DateTimeField()
+    applied = models.BooleanField(default=False, db_index=True)
+
+    def __str__(self):
+        return self.course_run_key
+
+
 class DeletePersonDupsConfig(SingletonModel):
     """
     Configuration for the delete_person_dups management command.
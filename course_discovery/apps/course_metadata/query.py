@@ -87,6 +87,8 @@ class CourseRunQuerySet(models.QuerySet):
         A course run is considered open for enrollment if its enrollment start date
         has passed, is now or is None, AND its enrollment end date is in the future or is None.
 
+        If you change this, also change is_course_run_enrollable().
+
         Returns:
             QuerySet
         """
@@ -107,6 +109,8 @@ class CourseRunQuerySet(models.QuerySet):
 
          A CourseRun is considered marketable if it has a defined slug, has seats, and has been published.
 
+         If you change this, also change is_course_run_marketable().
+
          Returns:
             QuerySet
          """
@@ -125,6 +129,30 @@ class CourseRunQuerySet(models.QuerySet):
         )
 
 
+def is_course_run_enrollable(course_run, now=None):
+    """
+    In memory counterpart of CourseRunQuerySet.enrollable(), for course runs that are already loaded.
+    """
+    now = now or datetime.datetime.now(pytz.UTC)
+    return (
+        (course_run.enrollment_end is None or course_run.enrollment_end > now) and
+        (course_run.enrollment_start is None or course_run.enrollment_start <= now)
+    )
+
+
+def is_course_run_marketable(course_run):
+    """
+    In memory counterpart of CourseRunQuerySet.marketable(), for course runs whose seats and type are prefetched.
+    """
+    return (
+        course_run.slug != '' and
+        len(course_run.seats.all()) > 0 and
+        not course_run.draft and
+        not (course_run.type_id and course_run.type.is_marketable is False) and
+        course_run.status == CourseRunStatus.Published
+    )
+
+
 class ProgramQuerySet(models.QuerySet):
     def marketable(self):
         """ Returns Programs that can be marketed to learners.
@@ -1,15 +1,21 @@
+import datetime
 import json
 from fnmatch import fnmatch
+from itertools import islice
 
+import pytz
 import waffle  # lint-amnesty, pylint: disable=invalid-django-waffle-import
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.template import loader
 from django.template.exceptions import TemplateDoesNotExist
 from django_elasticsearch_dsl import Document as OriginDocument
 from django_elasticsearch_dsl import fields
+from taxonomy.choices import ProductTypes
 
 from course_discovery.apps.edx_elasticsearch_dsl_extensions.search import Search
+from course_discovery.apps.taxonomy_support.utils import ProductSkills
 
 from .analyzers import case_insensitive_keyword, edge_ngram_completion, html_strip, synonym_text
 
@@ -23,6 +29,17 @@ def filter_visible_runs(course_runs):
     return course_runs.exclude(type__is_marketable=False)
 
 
+def chunked_iterable(iterable, chunk_size):
+    """
+    Yield lists of at most `chunk_size` items from `iterable` without materializing it as a whole.
+    """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
 class OrganizationsMixin:
     """
     OrganizationsMixin to be able prepare a set specific fields for es index.
@@ -111,9 +128,17 @@ class BaseDocument(Document, metaclass=DocumentMeta):
     and the absence of which in django-elasticsearch-dsl breaks the existing business logic.
     """
 
+    # Whitelisted skills of the indexed products, loaded in bulk by `prepare_chunk`.
+    product_skills = None
+    skills_product_type = ProductTypes.Course
+    # Datetime lookups used by `get_incremental_queryset` to find changed objects. Lookups spanning
+    # relations let changes to related objects, or run dates passing, refresh the document.
+    incremental_lookups = ('modified',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._object = None
+        self.product_skills = ProductSkills(self.skills_product_type)
 
     aggregation_key = fields.KeywordField()
     content_type = fields.KeywordField()
@@ -145,6 +170,50 @@ class BaseDocument(Document, metaclass=DocumentMeta):
     def _set_object(self, obj):
         self._object = obj
 
+    def get_indexing_queryset(self):
+        return self.iterate_for_indexing(self.get_queryset())
+
+    def get_incremental_indexing_queryset(self, since):
+        return self.iterate_for_indexing(self.get_incremental_queryset(since))
+
+    def get_incremental_queryset(self, since):
+        """
+        Return the indexed objects that may have changed since the given datetime.
+
+        An object is considered changed when any of its `incremental_lookups` falls between `since` and now.
+        """
+        now = datetime.datetime.now(pytz.UTC)
+        changed = models.Q()
+        for lookup in self.incremental_lookups:
+            changed |= models.Q(**{'{}__range'.format(lookup): (since, now)})
+
+        changed_ids = self.django.model._default_manager.filter(changed).values('pk')  # pylint: disable=protected-access
+        return self.get_queryset().filter(pk__in=changed_ids)
+
+    def iterate_for_indexing(self, queryset):
+        """
+        Iterate over the objects to index, loading their related data one chunk at a time.
+
+        The queryset iterator used for indexing ignores `prefetch_related`, so `prepare_chunk`
+        is called for every chunk of objects before they are handed out for preparation.
+        """
+        kwargs = {}
+        if self.django.queryset_pagination:
+            kwargs['chunk_size'] = self.django.queryset_pagination
+
+        objects = queryset.iterator(**kwargs)
+        for chunk in chunked_iterable(objects, settings.ELASTICSEARCH_DSL_PREPARE_CHUNK_SIZE):
+            self.prepare_chunk(chunk)
+            yield from chunk
+
+    def prepare_chunk(self, objects):
+        """
+        Bulk load the related data read by the `prepare_*` methods for a chunk of objects.
+
+        Subclasses override this to attach prefetched data to the objects, so that preparing
+        their documents reads from memory instead of querying once per object.
+        """
+
     def _prepare_language(self, language):
         if language:
             return language.get_search_facet_display()
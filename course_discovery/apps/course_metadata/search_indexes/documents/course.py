@@ -1,10 +1,9 @@
 from django.conf import settings
+from django.db.models import Prefetch, prefetch_related_objects
 from django_elasticsearch_dsl import Index, fields
 from opaque_keys.edx.keys import CourseKey
-from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_product_skills, get_whitelisted_serialized_skills
 
-from course_discovery.apps.course_metadata.models import Course
+from course_discovery.apps.course_metadata.models import Course, CourseRun
 
 from .analyzers import case_insensitive_keyword
 from .common import BaseCourseDocument, filter_visible_runs
@@ -57,14 +56,51 @@ class CourseDocument(BaseCourseDocument):
     external_course_marketing_type = fields.KeywordField(multi=True)
     product_source = fields.KeywordField(multi=True)
 
+    incremental_lookups = (
+        'modified',
+        'data_modified_timestamp',
+        'course_runs__modified',
+        'course_runs__seats__modified',
+        'course_runs__start',
+        'course_runs__end',
+        'course_runs__enrollment_start',
+        'course_runs__enrollment_end',
+    )
+
+    def prepare_chunk(self, objects):
+        visible_runs = filter_visible_runs(
+            CourseRun.everything.select_related('type', 'language')
+        ).prefetch_related('seats__type').order_by('pk')
+
+        prefetch_related_objects(
+            objects,
+            Prefetch('course_runs', queryset=visible_runs, to_attr='visible_course_runs'),
+            'course_runs',
+            'authoring_organizations',
+            'sponsoring_organizations',
+            'subjects__translations',
+            'expected_learning_items',
+            'prerequisites',
+        )
+        self.product_skills.load(course.key for course in objects)
+
+    def _get_visible_runs(self, obj):
+        """
+        Return the visible course runs loaded by `prepare_chunk`, or query them when the course was not bulk loaded.
+        """
+        visible_runs = getattr(obj, 'visible_course_runs', None)
+        if visible_runs is None:
+            visible_runs = list(filter_visible_runs(obj.course_runs).order_by('pk'))
+        return visible_runs
+
     def prepare_aggregation_key(self, obj):
         return 'course:{}'.format(obj.key)
 
     def prepare_availability(self, obj):
-        return [str(course_run.availability) for course_run in filter_visible_runs(obj.course_runs)]
+        return [str(course_run.availability) for course_run in self._get_visible_runs(obj)]
 
     def prepare_course_runs(self, obj):
-        return [course_run.key for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.key for course_run in self._get_visible_runs(obj)]
 
     def prepare_expected_learning_items(self, obj):
         return [item.value for item in obj.expected_learning_items.all()]
@@ -73,13 +109,13 @@ class CourseDocument(BaseCourseDocument):
         return list(
             {
                 self._prepare_language(course_run.language)
-                for course_run in filter_visible_runs(obj.course_runs)
+                for course_run in self._get_visible_runs(obj)
                 if course_run.language
             }
         )
 
     def prepare_end(self, obj):
-        return [course_run.end for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.end for course_run in self._get_visible_runs(obj)]
 
     def prepare_end_date(self, obj):
         return obj.end_date
@@ -88,33 +124,32 @@ class CourseDocument(BaseCourseDocument):
         return str(obj.course_ends)
 
     def prepare_enrollment_start(self, obj):
-        return [course_run.enrollment_start for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.enrollment_start for course_run in self._get_visible_runs(obj)]
 
     def prepare_enrollment_end(self, obj):
-        return [course_run.enrollment_end for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.enrollment_end for course_run in self._get_visible_runs(obj)]
 
     def prepare_org(self, obj):
-        course_run = filter_visible_runs(obj.course_runs).first()
-        if course_run:
-            return CourseKey.from_string(course_run.key).org
+        visible_runs = self._get_visible_runs(obj)
+        if visible_runs:
+            return CourseKey.from_string(visible_runs[0].key).org
         return None
 
     def prepare_seat_types(self, obj):
-        seat_types = [seat.slug for run in filter_visible_runs(obj.course_runs) for seat in run.seat_types]
+        seat_types = [seat.slug for run in self._get_visible_runs(obj) for seat in run.seat_types]
         return list(set(seat_types))
 
     def prepare_skill_names(self, obj):
-        course_skills = get_whitelisted_product_skills(obj.key, product_type=ProductTypes.Course)
-        return list(set(course_skill.skill.name for course_skill in course_skills))
+        return self.product_skills.get_skill_names(obj.key)
 
     def prepare_skills(self, obj):
-        return get_whitelisted_serialized_skills(obj.key, product_type=ProductTypes.Course)
+        return self.product_skills.get_serialized_skills(obj.key)
 
     def prepare_status(self, obj):
-        return [course_run.status for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.status for course_run in self._get_visible_runs(obj)]
 
     def prepare_start(self, obj):
-        return [course_run.start for course_run in filter_visible_runs(obj.course_runs)]
+        return [course_run.start for course_run in self._get_visible_runs(obj)]
 
     def prepare_partner(self, obj):
         return obj.partner.short_code
@@ -123,7 +158,9 @@ class CourseDocument(BaseCourseDocument):
         return [prerequisite.name for prerequisite in obj.prerequisites.all()]
 
     def get_queryset(self):
-        return super().get_queryset().prefetch_related('course_runs__seats__type')
+        return super().get_queryset().select_related(
+            'partner', 'type', 'level_type', 'additional_metadata', 'product_source'
+        ).prefetch_related('course_runs__seats__type')
 
     def prepare_course_type(self, obj):
         return obj.type.slug
@@ -1,8 +1,7 @@
 from django.conf import settings
+from django.db.models import prefetch_related_objects
 from django_elasticsearch_dsl import Index, fields
 from opaque_keys.edx.keys import CourseKey
-from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_product_skills, get_whitelisted_serialized_skills
 
 from course_discovery.apps.course_metadata.choices import CourseRunStatus
 from course_discovery.apps.course_metadata.models import CourseRun
@@ -78,6 +77,21 @@ class CourseRunDocument(BaseCourseDocument):
     )
     weeks_to_complete = fields.IntegerField()
 
+    incremental_lookups = (
+        'modified',
+        'seats__modified',
+        'start',
+        'end',
+        'enrollment_start',
+        'enrollment_end',
+        'course__modified',
+        'course__data_modified_timestamp',
+    )
+
+    def prepare_chunk(self, objects):
+        prefetch_related_objects(objects, 'seats__type', 'transcript_languages', 'staff')
+        self.product_skills.load(course_run.course.key for course_run in objects)
+
     def prepare_aggregation_key(self, obj):
         # Aggregate CourseRuns by Course key since that is how we plan to dedup CourseRuns on the marketing site.
         return 'courserun:{}'.format(obj.course.key)
@@ -118,11 +132,10 @@ class CourseRunDocument(BaseCourseDocument):
         return [seat_type.slug for seat_type in obj.seat_types]
 
     def prepare_skill_names(self, obj):
-        course_skills = get_whitelisted_product_skills(obj.course.key, product_type=ProductTypes.Course)
-        return list(set(course_skill.skill.name for course_skill in course_skills))
+        return self.product_skills.get_skill_names(obj.course.key)
 
     def prepare_skills(self, obj):
-        return get_whitelisted_serialized_skills(obj.course.key, product_type=ProductTypes.Course)
+        return self.product_skills.get_serialized_skills(obj.course.key)
 
     def prepare_staff_uuids(self, obj):
         return [str(staff.uuid) for staff in obj.staff.all()]
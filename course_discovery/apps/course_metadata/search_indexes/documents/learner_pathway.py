@@ -1,6 +1,7 @@
 from django.conf import settings
 from django_elasticsearch_dsl import Index, fields
 
+from course_discovery.apps.course_metadata.models import Course
 from course_discovery.apps.learner_pathway.choices import PathwayStatus
 from course_discovery.apps.learner_pathway.models import LearnerPathway
 
@@ -41,6 +42,16 @@ class LearnerPathwayDocument(BaseDocument, OrganizationsMixin):
         'description': fields.TextField(),
     })
 
+    def prepare_chunk(self, objects):
+        course_keys = set()
+        for course_lookup in (
+            'learner_pathway_courses__step__pathway__in',
+            'learner_pathway_blocks__step__pathway__in',
+            'programs__learner_pathway_programs__step__pathway__in',
+        ):
+            course_keys.update(Course.everything.filter(**{course_lookup: objects}).values_list('key', flat=True))
+        self.product_skills.load(course_keys)
+
     def prepare_aggregation_key(self, obj):
         return 'learnerpathway:{}'.format(obj.uuid)
 
@@ -57,10 +68,10 @@ class LearnerPathwayDocument(BaseDocument, OrganizationsMixin):
         )
 
     def prepare_skill_names(self, obj):
-        return [skill['name'] for skill in obj.skills]
+        return [skill['name'] for skill in self.prepare_skills(obj)]
 
     def prepare_skills(self, obj):
-        return obj.skills
+        return obj.get_skills(product_skills=self.product_skills)
 
     class Django:
         """
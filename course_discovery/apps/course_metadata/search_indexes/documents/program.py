@@ -1,7 +1,6 @@
 from django.conf import settings
 from django_elasticsearch_dsl import Index, fields
 from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_product_skills, get_whitelisted_serialized_skills
 
 from course_discovery.apps.course_metadata.choices import ProgramStatus
 from course_discovery.apps.course_metadata.models import Degree, Program
@@ -75,6 +74,18 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
     excluded_from_seo = fields.BooleanField()
     excluded_from_search = fields.BooleanField()
 
+    skills_product_type = ProductTypes.Program
+    incremental_lookups = (
+        'modified',
+        'data_modified_timestamp',
+        'courses__modified',
+        'courses__data_modified_timestamp',
+        'courses__course_runs__modified',
+    )
+
+    def prepare_chunk(self, objects):
+        self.product_skills.load(program.uuid for program in objects)
+
     def prepare_aggregation_key(self, obj):
         return 'program:{}'.format(obj.uuid)
 
@@ -94,14 +105,13 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
         return obj.status == ProgramStatus.Active
 
     def prepare_seat_types(self, obj):
-        return [seat_type.slug for seat_type in obj.seat_types]
+        return obj.aggregate_values['seat_types']
 
     def prepare_skill_names(self, obj):
-        program_skills = get_whitelisted_product_skills(obj.uuid, product_type=ProductTypes.Program)
-        return list(set(program_skill.skill.name for program_skill in program_skills))
+        return self.product_skills.get_skill_names(obj.uuid)
 
     def prepare_skills(self, obj):
-        return get_whitelisted_serialized_skills(obj.uuid, product_type=ProductTypes.Program)
+        return self.product_skills.get_serialized_skills(obj.uuid)
 
     def prepare_search_card_display(self, obj):
         try:
@@ -114,6 +124,15 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
     def prepare_subject_uuids(self, obj):
         return [str(subject.uuid) for subject in obj.subjects]
 
+    def prepare_start(self, obj):
+        return obj.aggregate_values['start']
+
+    def prepare_weeks_to_complete_min(self, obj):
+        return obj.aggregate_values['weeks_to_complete_min']
+
+    def prepare_weeks_to_complete_max(self, obj):
+        return obj.aggregate_values['weeks_to_complete_max']
+
     def prepare_staff_uuids(self, obj):
         return list({str(staff.uuid) for course_run in obj.course_runs for staff in course_run.staff.all()})
 
@@ -121,7 +140,7 @@ class ProgramDocument(BaseDocument, OrganizationsMixin):
         return obj.type.name_t
 
     def get_queryset(self):
-        return super().get_queryset().select_related('type').select_related('partner')
+        return super().get_queryset().select_related('type').select_related('partner').select_related('aggregate')
 
     class Django:
         """
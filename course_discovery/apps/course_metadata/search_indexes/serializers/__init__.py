@@ -2,7 +2,7 @@ from .aggregation import (
     AggregateFacetSearchSerializer, AggregateSearchModelSerializer, AggregateSearchSerializer,
     LimitedAggregateSearchSerializer
 )
-from .common import DocumentDSLSerializerMixin, ModelObjectDocumentSerializerMixin
+from .common import DocumentDSLListSerializer, DocumentDSLSerializerMixin, ModelObjectDocumentSerializerMixin
 from .course import CourseFacetSerializer, CourseSearchDocumentSerializer, CourseSearchModelSerializer
 from .course_run import CourseRunFacetSerializer, CourseRunSearchDocumentSerializer, CourseRunSearchModelSerializer
 from .learner_pathway import LearnerPathwaySearchDocumentSerializer, LearnerPathwaySearchModelSerializer
@@ -20,6 +20,7 @@ __all__ = (
     'CourseRunSearchDocumentSerializer',
     'CourseRunFacetSerializer',
     'CourseRunSearchModelSerializer',
+    'DocumentDSLListSerializer',
     'DocumentDSLSerializerMixin',
     'ModelObjectDocumentSerializerMixin',
     'LearnerPathwaySearchDocumentSerializer',
@@ -6,6 +6,7 @@ from course_discovery.apps.edx_elasticsearch_dsl_extensions.serializers import (
     BaseDjangoESDSLFacetSerializer, DummyDocument, MultiDocumentSerializerMixin
 )
 
+from .common import DocumentDSLListSerializer
 from .course import CourseSearchDocumentSerializer, CourseSearchModelSerializer
 from .course_run import CourseRunSearchDocumentSerializer, CourseRunSearchModelSerializer
 from .learner_pathway import LearnerPathwaySearchDocumentSerializer, LearnerPathwaySearchModelSerializer
@@ -23,6 +24,7 @@ class AggregateSearchModelSerializer(MultiDocumentSerializerMixin, DocumentSeria
         Meta options.
         """
         document = DummyDocument
+        list_serializer_class = DocumentDSLListSerializer
 
         serializers = {
             documents.CourseRunDocument: CourseRunSearchModelSerializer,
@@ -1,13 +1,96 @@
 import logging
+from collections import defaultdict
 
-from django.core.exceptions import ObjectDoesNotExist
 from django.utils.dateparse import parse_datetime
 from django_elasticsearch_dsl.registries import registry
+from rest_framework import serializers
 
 from course_discovery.apps.core.utils import ElasticsearchUtils, serialize_datetime
 
 log = logging.getLogger(__name__)
 
+# Serializer context key of the model objects loaded for search results, keyed by (document, pk).
+MODEL_OBJECTS_CONTEXT_KEY = 'search_model_objects'
+# Serializer context key of the registered documents, keyed by the alias of their index.
+DOCUMENTS_CONTEXT_KEY = 'search_documents'
+
+
+def get_documents_by_alias():
+    """
+    Return the registered documents, keyed by the alias of their index.
+
+    Index names are read on every call, since they change when indices are rebuilt and in tests.
+    """
+    documents = {}
+    for document in registry.get_documents():
+        alias = ElasticsearchUtils.get_alias_by_index_name(document._index._name)  # pylint: disable=protected-access
+        documents.setdefault(alias, document)
+    return documents
+
+
+def get_document_by_index_name(index_name, context=None):
+    """
+    Return the registered document whose index has the same alias as the given index, if any.
+
+    The documents stored in the serializer context by `DocumentDSLListSerializer` are used when available.
+    """
+    documents = (context or {}).get(DOCUMENTS_CONTEXT_KEY)
+    if documents is None:
+        documents = get_documents_by_alias()
+    return documents.get(ElasticsearchUtils.get_alias_by_index_name(index_name))
+
+
+def get_hit_pk(instance):
+    return instance.to_dict().get('pk')
+
+
+def load_model_objects(context, instances):
+    """
+    Load the model objects of several elasticsearch response instances, with one query per document.
+
+    The objects are stored in the serializer context, so that the serializers of the individual
+    instances, including nested and multi-document ones, find them there.
+
+    Returns:
+        (dict): The loaded objects, keyed by (document, pk). Objects missing from the database are None.
+    """
+    documents = context.get(DOCUMENTS_CONTEXT_KEY)
+    if documents is None:
+        documents = get_documents_by_alias()
+
+    pks_by_document = defaultdict(set)
+    for instance in instances:
+        index_name = getattr(getattr(instance, 'meta', None), 'index', None)
+        document = documents.get(ElasticsearchUtils.get_alias_by_index_name(index_name)) if index_name else None
+        es_pk = get_hit_pk(instance) if document else None
+        if es_pk:
+            pks_by_document[document].add(es_pk)
+
+    model_objects = context.setdefault(MODEL_OBJECTS_CONTEXT_KEY, {})
+    for document, pks in pks_by_document.items():
+        objects = document().get_queryset().in_bulk(pks)
+        for pk in pks:
+            if pk not in objects:
+                log.error("Object could not be found in database for %s with pk '%r'.", document.__name__, pk)
+            model_objects[(document, pk)] = objects.get(pk)
+
+    return model_objects
+
+
+# pylint: disable=abstract-method
+class DocumentDSLListSerializer(serializers.ListSerializer):
+    """
+    List serializer for elasticsearch response instances backed by model objects.
+
+    Loads the model objects of all instances in bulk before serializing them one by one.
+    """
+
+    def to_representation(self, data):
+        instances = list(data)
+        self.context[DOCUMENTS_CONTEXT_KEY] = get_documents_by_alias()
+        load_model_objects(self.context, instances)
+        return super().to_representation(instances)
+
 
 class DateTimeSerializerMixin:
     @staticmethod
@@ -28,33 +111,19 @@ class ModelObjectDocumentSerializerMixin:
     def get_model_object_by_instance(self, instance):
         """
         Provide Model object by elasticsearch response instance.
+
+        Objects preloaded by `DocumentDSLListSerializer` are served from the serializer context.
         """
-        document = None
-        _object = None
-        index_or_alias_name = ElasticsearchUtils.get_alias_by_index_name(instance.meta.index)
-        for doc in registry.get_documents():
-            if index_or_alias_name == doc._index._name:  # pylint: disable=protected-access
-                document = doc
-                break
-        hit = self._build_hit(instance)
-        es_pk = hit['_source'].get('pk')
-        if document and es_pk:
-            try:
-                _object = document(hit).get_queryset().get(pk=es_pk)
-            except ObjectDoesNotExist:
-                log.error("Object could not be found in database for SearchResult '%r'.", self)
-
-        return _object
+        document = get_document_by_index_name(instance.meta.index, self.context)
+        es_pk = get_hit_pk(instance)
+        if not (document and es_pk):
+            return None
 
-    @staticmethod
-    def _build_hit(instance):
-        return {
-            '_id': instance.meta.id,
-            '_index': instance.meta.index,
-            '_score': instance.meta.score,
-            '_source': instance.to_dict(),
-            '_type': instance.meta.doc_type,
-        }
+        model_objects = self.context.get(MODEL_OBJECTS_CONTEXT_KEY, {})
+        if (document, es_pk) not in model_objects:
+            model_objects = load_model_objects(self.context, [instance])
+
+        return model_objects[(document, es_pk)]
 
 
 class DocumentDSLSerializerMixin(ModelObjectDocumentSerializerMixin):
@@ -3,22 +3,26 @@ import datetime
 import pytz
 from django_elasticsearch_dsl_drf.serializers import DocumentSerializer
 from rest_framework import serializers
-from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_product_skills, get_whitelisted_serialized_skills
 
 from course_discovery.apps.api import serializers as cd_serializers
-from course_discovery.apps.api.serializers import ContentTypeSerializer, CourseWithProgramsSerializer
+from course_discovery.apps.api.serializers import (
+    ContentTypeSerializer, CourseWithProgramsSerializer, ProductSkillsSerializerMixin
+)
 from course_discovery.apps.course_metadata.utils import get_course_run_estimated_hours
 from course_discovery.apps.edx_elasticsearch_dsl_extensions.serializers import BaseDjangoESDSLFacetSerializer
 
 from ..constants import BASE_SEARCH_INDEX_FIELDS, COMMON_IGNORED_FIELDS
 from ..documents import CourseDocument
-from .common import DateTimeSerializerMixin, DocumentDSLSerializerMixin, ModelObjectDocumentSerializerMixin
+from .common import (
+    DateTimeSerializerMixin, DocumentDSLListSerializer, DocumentDSLSerializerMixin, ModelObjectDocumentSerializerMixin
+)
 
 __all__ = ('CourseSearchDocumentSerializer',)
 
 
-class CourseSearchDocumentSerializer(ModelObjectDocumentSerializerMixin, DateTimeSerializerMixin, DocumentSerializer):
+class CourseSearchDocumentSerializer(
+    ModelObjectDocumentSerializerMixin, ProductSkillsSerializerMixin, DateTimeSerializerMixin, DocumentSerializer
+):
     """
     Serializer for course elasticsearch document.
     """
@@ -97,13 +101,6 @@ class CourseSearchDocumentSerializer(ModelObjectDocumentSerializerMixin, DateTim
         seat_types = [seat.slug for course_run in result.object.course_runs.all() for seat in course_run.seat_types]
         return list(set(seat_types))
 
-    def get_skill_names(self, result):
-        course_skills = get_whitelisted_product_skills(result.key, product_type=ProductTypes.Course)
-        return list(set(course_skill.skill.name for course_skill in course_skills))
-
-    def get_skills(self, result):
-        return get_whitelisted_serialized_skills(result.key, product_type=ProductTypes.Course)
-
     def get_end_date(self, result):
         return self.handle_datetime_field(result.end_date)
 
@@ -131,6 +128,7 @@ class CourseSearchDocumentSerializer(ModelObjectDocumentSerializerMixin, DateTim
         """
 
         document = CourseDocument
+        list_serializer_class = DocumentDSLListSerializer
         ignore_fields = COMMON_IGNORED_FIELDS
         fields = BASE_SEARCH_INDEX_FIELDS + (
             'full_description',
@@ -177,4 +175,5 @@ class CourseSearchModelSerializer(DocumentDSLSerializerMixin, ContentTypeSeriali
 
     class Meta(CourseWithProgramsSerializer.Meta):
         document = CourseDocument
+        list_serializer_class = DocumentDSLListSerializer
         fields = ContentTypeSerializer.Meta.fields + CourseWithProgramsSerializer.Meta.fields
@@ -1,19 +1,19 @@
 from django_elasticsearch_dsl_drf.serializers import DocumentSerializer
 from rest_framework import serializers
-from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_product_skills, get_whitelisted_serialized_skills
 
-from course_discovery.apps.api.serializers import ContentTypeSerializer, CourseRunWithProgramsSerializer
+from course_discovery.apps.api.serializers import (
+    ContentTypeSerializer, CourseRunWithProgramsSerializer, ProductSkillsSerializerMixin
+)
 from course_discovery.apps.edx_elasticsearch_dsl_extensions.serializers import BaseDjangoESDSLFacetSerializer
 
 from ..constants import BASE_SEARCH_INDEX_FIELDS, COMMON_IGNORED_FIELDS
 from ..documents import CourseRunDocument
-from .common import DateTimeSerializerMixin, DocumentDSLSerializerMixin
+from .common import DateTimeSerializerMixin, DocumentDSLListSerializer, DocumentDSLSerializerMixin
 
 __all__ = ('CourseRunSearchDocumentSerializer',)
 
 
-class CourseRunSearchDocumentSerializer(DateTimeSerializerMixin, DocumentSerializer):
+class CourseRunSearchDocumentSerializer(ProductSkillsSerializerMixin, DateTimeSerializerMixin, DocumentSerializer):
     """
     Serializer for course run elasticsearch document.
     """
@@ -37,12 +37,8 @@ class CourseRunSearchDocumentSerializer(DateTimeSerializerMixin, DocumentSeriali
     def get_enrollment_end(self, obj):
         return self.handle_datetime_field(obj.enrollment_end)
 
-    def get_skill_names(self, result):
-        course_skills = get_whitelisted_product_skills(result.course_key, product_type=ProductTypes.Course)
-        return list(set(course_skill.skill.name for course_skill in course_skills))
-
-    def get_skills(self, result):
-        return get_whitelisted_serialized_skills(result.course_key, product_type=ProductTypes.Course)
+    def get_skills_key(self, obj):
+        return obj.course_key
 
     class Meta:
         """
@@ -120,4 +116,5 @@ class CourseRunSearchModelSerializer(
         """
 
         document = CourseRunDocument
+        list_serializer_class = DocumentDSLListSerializer
         fields = ContentTypeSerializer.Meta.fields + CourseRunWithProgramsSerializer.Meta.fields
@@ -7,7 +7,9 @@ from course_discovery.apps.learner_pathway.api.serializers import LearnerPathway
 
 from ..constants import BASE_SEARCH_INDEX_FIELDS, COMMON_IGNORED_FIELDS
 from ..documents import LearnerPathwayDocument
-from .common import DateTimeSerializerMixin, DocumentDSLSerializerMixin, ModelObjectDocumentSerializerMixin
+from .common import (
+    DateTimeSerializerMixin, DocumentDSLListSerializer, DocumentDSLSerializerMixin, ModelObjectDocumentSerializerMixin
+)
 
 __all__ = ('LearnerPathwaySearchDocumentSerializer',)
 
@@ -35,6 +37,7 @@ class LearnerPathwaySearchDocumentSerializer(
         """
 
         document = LearnerPathwayDocument
+        list_serializer_class = DocumentDSLListSerializer
         ignore_fields = COMMON_IGNORED_FIELDS
         fields = (
             BASE_SEARCH_INDEX_FIELDS + (
@@ -60,4 +63,5 @@ class LearnerPathwaySearchModelSerializer(DocumentDSLSerializerMixin, ContentTyp
         """
 
         document = LearnerPathwayDocument
+        list_serializer_class = DocumentDSLListSerializer
         fields = ContentTypeSerializer.Meta.fields + LearnerPathwaySerializer.Meta.fields
@@ -6,7 +6,7 @@ from course_discovery.apps.edx_elasticsearch_dsl_extensions.serializers import B
 
 from ..constants import BASE_SEARCH_INDEX_FIELDS, COMMON_IGNORED_FIELDS
 from ..documents import PersonDocument
-from .common import DocumentDSLSerializerMixin
+from .common import DocumentDSLListSerializer, DocumentDSLSerializerMixin
 
 __all__ = ('PersonSearchDocumentSerializer',)
 
@@ -66,4 +66,5 @@ class PersonSearchModelSerializer(DocumentDSLSerializerMixin, ContentTypeSeriali
         """
 
         document = PersonDocument
+        list_serializer_class = DocumentDSLListSerializer
         fields = ContentTypeSerializer.Meta.fields + MinimalPersonSerializer.Meta.fields
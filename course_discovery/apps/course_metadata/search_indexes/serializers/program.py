@@ -3,19 +3,18 @@ import json
 from django_elasticsearch_dsl_drf.serializers import DocumentSerializer
 from rest_framework import serializers
 from taxonomy.choices import ProductTypes
-from taxonomy.utils import get_whitelisted_product_skills, get_whitelisted_serialized_skills
 
-from course_discovery.apps.api.serializers import ContentTypeSerializer, ProgramSerializer
+from course_discovery.apps.api.serializers import ContentTypeSerializer, ProductSkillsSerializerMixin, ProgramSerializer
 from course_discovery.apps.edx_elasticsearch_dsl_extensions.serializers import BaseDjangoESDSLFacetSerializer
 
 from ..constants import BASE_PROGRAM_FIELDS, BASE_SEARCH_INDEX_FIELDS, COMMON_IGNORED_FIELDS
 from ..documents import ProgramDocument
-from .common import DocumentDSLSerializerMixin
+from .common import DocumentDSLListSerializer, DocumentDSLSerializerMixin
 
 __all__ = ('ProgramSearchDocumentSerializer',)
 
 
-class ProgramSearchDocumentSerializer(DocumentSerializer):
+class ProgramSearchDocumentSerializer(ProductSkillsSerializerMixin, DocumentSerializer):
     """
     Serializer for program elasticsearch document.
     """
@@ -24,16 +23,14 @@ class ProgramSearchDocumentSerializer(DocumentSerializer):
     skill_names = serializers.SerializerMethodField()
     skills = serializers.SerializerMethodField()
 
+    skills_product_type = ProductTypes.Program
+
     def get_authoring_organizations(self, program):
         organizations = program.authoring_organization_bodies
         return [json.loads(organization) for organization in organizations] if organizations else []
 
-    def get_skill_names(self, program):
-        program_skills = get_whitelisted_product_skills(program.uuid, product_type=ProductTypes.Program)
-        return list(set(program_skill.skill.name for program_skill in program_skills))
-
-    def get_skills(self, program):
-        return get_whitelisted_serialized_skills(program.uuid, product_type=ProductTypes.Program)
+    def get_skills_key(self, obj):
+        return obj.uuid
 
     class Meta:
         """
@@ -92,4 +89,5 @@ class ProgramSearchModelSerializer(DocumentDSLSerializerMixin, ContentTypeSerial
         """
 
         document = ProgramDocument
+        list_serializer_class = DocumentDSLListSerializer
         fields = ContentTypeSerializer.Meta.fields + ProgramSerializer.Meta.fields
@@ -0,0 +1,46 @@
+from django.test import TestCase
+
+from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin
+from course_discovery.apps.course_metadata.search_indexes.documents import CourseDocument
+from course_discovery.apps.course_metadata.tests.factories import (
+    CourseFactory, CourseRunFactory, CourseRunTypeFactory, SeatFactory
+)
+
+
+class CourseDocumentTests(ElasticsearchTestMixin, TestCase):
+    VISIBLE_RUN_FIELDS = (
+        'availability', 'course_runs', 'end', 'enrollment_end', 'enrollment_start', 'languages', 'org',
+        'seat_types', 'start', 'status',
+    )
+
+    def setUp(self):
+        super().setUp()
+        self.courses = CourseFactory.create_batch(3)
+        for course in self.courses:
+            for course_run in CourseRunFactory.create_batch(2, course=course):
+                SeatFactory(course_run=course_run)
+            CourseRunFactory(course=course, type=CourseRunTypeFactory(is_marketable=False))
+
+    def test_get_indexing_queryset_loads_visible_runs(self):
+        """ Verify that courses handed out for indexing carry their visible runs and need no extra queries. """
+        document = CourseDocument()
+        courses = list(document.get_indexing_queryset())
+
+        assert len(courses) == len(self.courses)
+        with self.assertNumQueries(0):
+            for course in courses:
+                assert len(course.visible_course_runs) == 2
+                for field in self.VISIBLE_RUN_FIELDS:
+                    getattr(document, f'prepare_{field}')(course)
+
+    def test_prepare_matches_unchunked_course(self):
+        """ Verify that bulk-loaded courses are prepared the same way as courses loaded one at a time. """
+        document = CourseDocument()
+        for course in document.get_indexing_queryset():
+            unchunked_course = document.get_queryset().get(pk=course.pk)
+            for field in self.VISIBLE_RUN_FIELDS:
+                prepare = getattr(document, f'prepare_{field}')
+                value, expected = prepare(course), prepare(unchunked_course)
+                if isinstance(value, list):
+                    value, expected = sorted(map(str, value)), sorted(map(str, expected))
+                assert value == expected
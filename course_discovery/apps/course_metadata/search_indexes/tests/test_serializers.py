@@ -0,0 +1,32 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from elasticsearch_dsl.query import Q as ESDSLQ
+
+from course_discovery.apps.api.tests.test_utils import make_request
+from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin
+from course_discovery.apps.course_metadata.search_indexes.documents import PersonDocument
+from course_discovery.apps.course_metadata.search_indexes.serializers import PersonSearchModelSerializer
+from course_discovery.apps.course_metadata.tests.factories import PersonFactory
+
+
+class DocumentDSLListSerializerTests(ElasticsearchTestMixin, TestCase):
+    def serialize_people(self):
+        self.refresh_index()
+        results = PersonDocument.search().query(ESDSLQ('match_all')).execute()
+        context = {'request': make_request()}
+        with CaptureQueriesContext(connection) as queries:
+            data = PersonSearchModelSerializer(results, many=True, context=context).data
+        person_queries = [query for query in queries if 'FROM "course_metadata_person"' in query['sql']]
+        return results, data, person_queries
+
+    def test_objects_loaded_in_bulk(self):
+        """ Verify the model objects of search results are loaded with a single query. """
+        PersonFactory.create_batch(5)
+        results, data, person_queries = self.serialize_people()
+
+        assert len(data) == 5
+        assert len(person_queries) == 1
+        assert data == [
+            PersonSearchModelSerializer(result, context={'request': make_request()}).data for result in results
+        ]
@@ -1,5 +1,6 @@
 import logging
-import time
+import threading
+import weakref
 from datetime import datetime, timezone
 
 import pytz
@@ -8,6 +9,7 @@ from celery import shared_task
 from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import Q
 from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
@@ -17,21 +19,26 @@ from openedx_events.content_authoring.signals import COURSE_CATALOG_INFO_CHANGED
 from course_discovery.apps.api.cache import api_change_receiver
 from course_discovery.apps.core.models import Partner
 from course_discovery.apps.course_metadata.constants import MASTERS_PROGRAM_TYPE_SLUG
-from course_discovery.apps.course_metadata.data_loaders.api import CoursesApiDataLoader
+from course_discovery.apps.course_metadata.events import record_course_catalog_event
 from course_discovery.apps.course_metadata.models import (
-    AdditionalMetadata, CertificateInfo, Course, CourseEntitlement, CourseLocationRestriction, CourseRun, Curriculum,
-    CurriculumCourseMembership, CurriculumProgramMembership, GeoLocation, Organization, ProductMeta, ProductValue,
-    Program
+    AdditionalMetadata, CertificateInfo, Course, CourseCatalogEvent, CourseEntitlement, CourseLocationRestriction,
+    CourseRun, Curriculum, CurriculumCourseMembership, CurriculumProgramMembership, DataLoaderCheckpoint,
+    DataLoaderFingerprint, GeoLocation, Organization, ProductMeta, ProductValue, Program, Seat
 )
 from course_discovery.apps.course_metadata.publishers import ProgramMarketingSitePublisher
 from course_discovery.apps.course_metadata.salesforce import (
     populate_official_with_existing_draft, requires_salesforce_update
 )
-from course_discovery.apps.course_metadata.tasks import update_org_program_and_courses_ent_sub_inclusion
+from course_discovery.apps.course_metadata.tasks import (
+    refresh_program_aggregates, update_org_program_and_courses_ent_sub_inclusion
+)
 from course_discovery.apps.course_metadata.utils import data_modified_timestamp_update, get_salesforce_util
 
 logger = logging.getLogger(__name__)
 
+# Bookkeeping models, whose changes are not reflected in the API.
+API_CACHE_EXEMPT_MODELS = (CourseCatalogEvent, DataLoaderCheckpoint, DataLoaderFingerprint)
+
 
 @receiver(pre_delete, sender=Program)
 def delete_program(sender, instance, **kwargs):  # pylint: disable=unused-argument
@@ -109,6 +116,8 @@ def connect_api_change_receiver():
     of the API while providing closer-to-optimal cache TTLs.
     """
     for model in apps.get_app_config('course_metadata').get_models():
+        if model in API_CACHE_EXEMPT_MODELS:
+            continue
         for signal in (post_save, post_delete):
             signal.connect(api_change_receiver, sender=model)
 
@@ -116,6 +125,118 @@ def connect_api_change_receiver():
 connect_api_change_receiver()
 
 
+class ProgramAggregateRefresh:
+    """
+    Refresh of the aggregates of programs, queued once the transaction is committed with the ids of all the objects
+    changed in it.
+    """
+    def __init__(self):
+        self.ids = {'program_ids': set(), 'course_ids': set(), 'course_run_ids': set()}
+        self.queued = False
+
+    def __call__(self):
+        self.queued = True
+        refresh_program_aggregates.delay(**{key: sorted(ids) for key, ids in self.ids.items()})
+
+
+# The refreshes pending on the connections of the current thread, by connection alias and savepoint ids. Only
+# the on_commit hooks hold the refreshes, so they drop out once the hooks run or are discarded on rollback.
+_pending_program_aggregate_refreshes = threading.local()
+
+
+def schedule_program_aggregate_refresh(**ids):
+    """
+    Refresh the aggregates of programs once the current transaction is committed, along with the other refreshes
+    scheduled during the transaction, or its current savepoint.
+
+    Arguments:
+        ids: the `program_ids`, `course_ids` or `course_run_ids` of the objects whose programs are refreshed
+    """
+    if not any(ids.values()):
+        return
+
+    pending = getattr(_pending_program_aggregate_refreshes, 'refreshes', None)
+    if pending is None:
+        pending = _pending_program_aggregate_refreshes.refreshes = weakref.WeakValueDictionary()
+
+    connection = transaction.get_connection()
+    key = (connection.alias, tuple(connection.savepoint_ids))
+    refresh = pending.get(key)
+    scheduled = refresh is not None and not refresh.queued
+    if not scheduled:
+        refresh = ProgramAggregateRefresh()
+    for key_name, values in ids.items():
+        refresh.ids[key_name].update(values)
+    if not scheduled:
+        if connection.in_atomic_block:
+            pending[key] = refresh
+        transaction.on_commit(refresh)
+
+
+def program_aggregate_change_receiver(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Refresh the aggregates of the programs a saved or deleted course, course run, seat or entitlement belongs to,
+    once the change is committed. See ProgramAggregate.
+    """
+    if getattr(instance, 'draft', False):
+        return
+
+    if isinstance(instance, Program):
+        schedule_program_aggregate_refresh(program_ids=[instance.pk])
+    elif isinstance(instance, Course):
+        if kwargs.get('signal') is pre_delete:
+            # The programs of the course can't be found once its program memberships are deleted.
+            schedule_program_aggregate_refresh(program_ids=list(instance.programs.values_list('pk', flat=True)))
+        else:
+            schedule_program_aggregate_refresh(course_ids=[instance.pk])
+    elif isinstance(instance, Seat):
+        schedule_program_aggregate_refresh(course_run_ids=[instance.course_run_id])
+    else:
+        schedule_program_aggregate_refresh(course_ids=[instance.course_id])
+
+
+def program_membership_changed(sender, instance, action, reverse, pk_set, **kwargs):  # pylint: disable=unused-argument
+    """
+    Refresh the aggregates of programs whose courses or excluded course runs changed, once the change is committed.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    schedule_program_aggregate_refresh(program_ids=list(pk_set or ()) if reverse else [instance.pk])
+
+
+def get_program_aggregate_signals(model):
+    # Courses are handled before they are deleted, while the programs they belong to can still be found.
+    return (post_save, pre_delete) if model is Course else (post_save, post_delete)
+
+
+def connect_program_aggregate_receivers():
+    """
+    Refresh the aggregates of programs when the objects they are computed from change.
+    """
+    for model in (Course, CourseRun, CourseEntitlement, Seat):
+        for signal in get_program_aggregate_signals(model):
+            signal.connect(program_aggregate_change_receiver, sender=model)
+    post_save.connect(program_aggregate_change_receiver, sender=Program)
+    for through in (Program.courses.through, Program.excluded_course_runs.through):
+        m2m_changed.connect(program_membership_changed, sender=through)
+
+
+def disconnect_program_aggregate_receivers():
+    """
+    Stop refreshing the aggregates of programs after each change, e.g. while loading data in bulk.
+    """
+    for model in (Course, CourseRun, CourseEntitlement, Seat):
+        for signal in get_program_aggregate_signals(model):
+            signal.disconnect(program_aggregate_change_receiver, sender=model)
+    post_save.disconnect(program_aggregate_change_receiver, sender=Program)
+    for through in (Program.courses.through, Program.excluded_course_runs.through):
+        m2m_changed.disconnect(program_membership_changed, sender=through)
+
+
+connect_program_aggregate_receivers()
+
+
 @receiver(pre_save, sender=CourseRun)
 def ensure_external_key_uniqueness__course_run(sender, instance, **kwargs):  # pylint: disable=unused-argument
     """
@@ -350,6 +471,8 @@ def update_course_data_from_event(**kwargs):
         logger.error('Received null or incorrect data from COURSE_CATALOG_INFO_CHANGED.')
         return
 
+    delay = 0
+    event_timestamp = datetime.now(tz=timezone.utc)
     event_metadata = kwargs.get('metadata')
     if event_metadata:
         event_timestamp = event_metadata.time
@@ -357,7 +480,7 @@ def update_course_data_from_event(**kwargs):
         if time_diff.seconds < settings.EVENT_BUS_MESSAGE_DELAY_THRESHOLD_SECONDS:
             logger.debug(f"COURSE_CATALOG_INFO_CHANGED event received within the delay "
                          f"applicable window for course run {course_data.course_key}.")
-            time.sleep(settings.EVENT_BUS_PROCESSING_DELAY_SECONDS)
+            delay = settings.EVENT_BUS_PROCESSING_DELAY_SECONDS
 
     # Handle optional fields.
     schedule_data = course_data.schedule_data
@@ -376,11 +499,9 @@ def update_course_data_from_event(**kwargs):
         'pacing': course_data.schedule_data.pacing,
     }
 
-    # Currently, we are not passing along partner information as part of the event.
-    # Because of this, we are assuming that all events are going to the default id for now.
-    partner = Partner.objects.get(id=settings.DEFAULT_PARTNER_ID)
-    data_loader = CoursesApiDataLoader(partner, enable_api=False)
-    data_loader.process_single_course_run(body)
+    # Events are stored before they are acknowledged, then applied in batches by the update_course_runs_from_events
+    # task.
+    record_course_catalog_event(body, event_timestamp, delay)
 
 
 def course_m2m_changed(sender, instance, action, **kwargs):
@@ -4,8 +4,16 @@ Celery tasks for course metadata.
 import logging
 
 from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
 
-from course_discovery.apps.course_metadata.models import Course, CourseType, Program, ProgramType
+from course_discovery.apps.api.cache import get_family_cache_tags, invalidate_cache_tags
+from course_discovery.apps.core.models import Partner
+from course_discovery.apps.course_metadata.data_loaders.api import CoursesApiDataLoader
+from course_discovery.apps.course_metadata.models import (
+    Course, CourseCatalogEvent, CourseType, Program, ProgramAggregate, ProgramType
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -50,3 +58,57 @@ def update_org_program_and_courses_ent_sub_inclusion(org_pk, org_sub_inclusion):
     LOGGER.info(sub_tag_log, org_pk, len(programs), 'programs')
     for program in programs:
         program.save()
+
+
+@shared_task()
+def update_course_runs_from_events():
+    """
+    Task to update course runs with the data received from COURSE_CATALOG_INFO_CHANGED events, see
+    CourseCatalogEvent. Each run of the task applies all the pending events that are due.
+    """
+    # Currently, we are not passing along partner information as part of the event.
+    # Because of this, we are assuming that all events are going to the default id for now.
+    partner = Partner.objects.get(id=settings.DEFAULT_PARTNER_ID)
+    data_loader = CoursesApiDataLoader(partner, enable_api=False)
+    events = CourseCatalogEvent.objects.filter(applied=False, apply_after__lte=timezone.now())
+    event_ids = list(events.order_by('time').values_list('pk', flat=True))
+    LOGGER.info('Updating %d course runs from COURSE_CATALOG_INFO_CHANGED events.', len(event_ids))
+    for event_id in event_ids:
+        with transaction.atomic():
+            # The lock keeps concurrent runs of the task from applying the same event, and newer events of the course
+            # run from being stored until this one is applied. Events locked by another run are skipped.
+            event = events.select_for_update(skip_locked=True).filter(pk=event_id).first()
+            if event is None:
+                continue
+            # The loader logs and swallows errors, so a savepoint keeps a failed query from breaking the transaction
+            # the event is marked applied in.
+            with transaction.atomic():
+                data_loader.process_single_course_run(event.body)
+            event.applied = True
+            event.save(update_fields=['applied'])
+
+
+@shared_task()
+def refresh_program_aggregates(program_ids=(), course_ids=(), course_run_ids=()):
+    """
+    Task to refresh the aggregates of programs, after the objects they are computed from changed.
+    Arguments:
+        program_ids (list): primary keys of the programs
+        course_ids (list): primary keys of courses whose programs are refreshed
+        course_run_ids (list): primary keys of course runs whose programs are refreshed
+    """
+    program_ids = set(program_ids)
+    if course_ids:
+        program_ids.update(Program.objects.filter(courses__in=course_ids).values_list('pk', flat=True))
+    if course_run_ids:
+        program_ids.update(
+            Program.objects.filter(courses__course_runs__in=course_run_ids).values_list('pk', flat=True)
+        )
+    programs = Program.objects.filter(pk__in=program_ids)
+    ProgramAggregate.refresh(programs)
+
+    # Aggregates are refreshed in bulk, without sending the signals invalidating the API cache.
+    tags = set()
+    for program_uuid, partner_id in programs.values_list('uuid', 'partner_id'):
+        tags |= get_family_cache_tags('program', program_uuid, partner_id)
+    invalidate_cache_tags(tags)
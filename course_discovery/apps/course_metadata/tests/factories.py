@@ -748,6 +748,13 @@ class ProgramFactory(ProgramBaseFactory):
     status = ProgramStatus.Active
 
 
+class ProgramAggregateFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = ProgramAggregate
+
+    program = factory.SubFactory(ProgramFactory)
+
+
 class ProgramSubscriptionFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = ProgramSubscription
@@ -1,5 +1,6 @@
 import datetime
 from collections import ChainMap
+from unittest import mock
 
 import ddt
 import pytest
@@ -11,7 +12,9 @@ from pytz import UTC
 from conftest import TEST_DOMAIN
 from course_discovery.apps.core.models import Currency, Partner
 from course_discovery.apps.core.tests.factories import PartnerFactory, SiteFactory
-from course_discovery.apps.course_metadata.algolia_models import AlgoliaProxyCourse, AlgoliaProxyProgram
+from course_discovery.apps.course_metadata.algolia_models import (
+    AlgoliaProxyCourse, AlgoliaProxyProduct, AlgoliaProxyProgram, get_course_availability, get_owners
+)
 from course_discovery.apps.course_metadata.choices import ExternalProductStatus, ProgramStatus
 from course_discovery.apps.course_metadata.models import CourseRunStatus, CourseType, ProductValue
 from course_discovery.apps.course_metadata.tests.factories import (
@@ -806,3 +809,47 @@ class TestAlgoliaProxyProgram(TestAlgoliaProxyWithEdxPartner):
         assert program.product_value_per_click_international == ProductValue.DEFAULT_VALUE_PER_CLICK
         assert program.product_value_per_lead_usa == ProductValue.DEFAULT_VALUE_PER_LEAD
         assert program.product_value_per_lead_international == ProductValue.DEFAULT_VALUE_PER_LEAD
+
+
+@pytest.mark.django_db
+class TestAlgoliaProxyProduct(TestAlgoliaProxyWithEdxPartner):
+    ALGOLIA_MODELS_PATH = 'course_discovery.apps.course_metadata.algolia_models'
+
+    def test_memoized_across_languages(self):
+        """ Verify the attributes of a product are computed once for all the languages it is indexed in. """
+        course = self.create_current_upgradeable_course()
+        course.authoring_organizations.add(OrganizationFactory())
+        english = AlgoliaProxyProduct(course, 'en')
+        spanish = AlgoliaProxyProduct(course, 'es_419')
+
+        with mock.patch(f'{self.ALGOLIA_MODELS_PATH}.get_owners', wraps=get_owners) as mock_get_owners:
+            assert english.owners() == spanish.owners()
+            assert english.partner_names() == spanish.partner_names()
+            english.should_index()
+            spanish.should_index_spanish()
+
+        mock_get_owners.assert_called_once_with(course)
+
+    def test_translated_fields_memoized_per_language(self):
+        """ Verify translated attributes are computed once for each language. """
+        course = self.create_current_upgradeable_course()
+        english = AlgoliaProxyProduct(course, 'en')
+        spanish = AlgoliaProxyProduct(course, 'es_419')
+
+        with mock.patch(
+            f'{self.ALGOLIA_MODELS_PATH}.get_course_availability', wraps=get_course_availability
+        ) as mock_get_course_availability:
+            for __ in range(2):
+                english.availability_level()
+                spanish.availability_level()
+
+        assert mock_get_course_availability.call_count == 2
+
+    def test_not_memoized_outside_indexing(self):
+        """ Verify the attributes of products that are not being indexed are computed every time they are read. """
+        course = self.create_current_upgradeable_course()
+
+        with mock.patch(f'{self.ALGOLIA_MODELS_PATH}.get_owners', wraps=get_owners) as mock_get_owners:
+            assert course.owners == course.owners
+
+        assert mock_get_owners.call_count == 2
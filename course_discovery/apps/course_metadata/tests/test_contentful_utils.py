@@ -1,23 +1,30 @@
 """
 Unit tests for Contentful Utility Functions
 """
+import json
+import os
+import tempfile
 from unittest import mock
 
 import pytest
+from contentful.errors import BadRequestError
 from django.conf import settings
 from django.core.cache import cache
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from requests.exceptions import ConnectionError as RequestsConnectionError
 from testfixtures import LogCapture
 
 from course_discovery.apps.course_metadata.contentful_utils import (
-    aggregate_contentful_data, fetch_and_transform_bootcamp_contentful_data, fetch_and_transform_degree_contentful_data,
-    get_contentful_cache_key, get_data_from_contentful, rich_text_to_plain_text
+    CONTENTFUL_SNAPSHOT_FILE_NAME, CONTENTFUL_SNAPSHOT_VERSION, aggregate_contentful_data,
+    fetch_and_transform_bootcamp_contentful_data, fetch_and_transform_degree_contentful_data, get_contentful_cache_key,
+    get_data_from_contentful, rich_text_to_plain_text
 )
 from course_discovery.apps.course_metadata.tests.contentful_utils.contentful_mock_data import (
     MockContenfulDegreeResponse, MockContentfulBootcampResponse, create_contentful_entry
 )
 
 LOGGER_NAME = 'course_discovery.apps.course_metadata.contentful_utils'
+CONTENTFUL_UTILS_PATH = 'course_discovery.apps.course_metadata.contentful_utils'
 
 
 @pytest.mark.usefixtures('django_cache')
@@ -26,6 +33,7 @@ class TestContentfulUtils(TestCase):
     Test get_data_from_contentful.
     """
 
+    @mock.patch(f'{CONTENTFUL_UTILS_PATH}.CONTENTFUL_PAGE_SIZE', 10)
     @mock.patch('course_discovery.apps.course_metadata.contentful_utils.Client')
     def test_get_data_from_contentful(self, mock_client):
         """
@@ -41,6 +49,7 @@ class TestContentfulUtils(TestCase):
         self.assertDictEqual(
             contentful_data[0].raw, mock_response.mock_contentful_bootcamp_entry.raw)
 
+    @mock.patch(f'{CONTENTFUL_UTILS_PATH}.CONTENTFUL_PAGE_SIZE', 10)
     @mock.patch('course_discovery.apps.course_metadata.contentful_utils.Client')
     def test_get_cached_data_from_contentful(self, mock_client):
         """
@@ -69,6 +78,38 @@ class TestContentfulUtils(TestCase):
             assert len(contentful_data) == 2
             assert contentful_data[0].uuid == mock_response.mock_contentful_bootcamp_entry.uuid
 
+    @mock.patch(f'{CONTENTFUL_UTILS_PATH}.CONTENTFUL_PAGE_SIZE', 10)
+    @mock.patch('course_discovery.apps.course_metadata.contentful_utils.Client')
+    def test_get_data_from_contentful_pages(self, mock_client):
+        """
+        Test get_data_from_contentful returns the entries of every page, in order.
+        """
+        mock_client.return_value.entries.side_effect = lambda query: mock.Mock(
+            total=25, items=list(range(query.get('skip', 0), min(query.get('skip', 0) + query['limit'], 25)))
+        )
+
+        assert get_data_from_contentful(settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE) == list(range(25))
+        assert mock_client.return_value.entries.call_count == 3
+
+    @mock.patch(f'{CONTENTFUL_UTILS_PATH}.CONTENTFUL_PAGE_SIZE', 16)
+    @mock.patch('course_discovery.apps.course_metadata.contentful_utils.Client')
+    def test_get_data_from_contentful_response_too_big(self, mock_client):
+        """
+        Test get_data_from_contentful requests fewer entries at a time when Contentful answers the response is too big.
+        """
+        too_big = mock.Mock(status_code=400, json=lambda: {'message': 'Response size too big.'})
+
+        def entries(query):
+            skip = query.get('skip', 0)
+            # The entries from the 10th are too big to be fetched more than two at a time.
+            if query['limit'] > (2 if skip + query['limit'] > 10 else 4):
+                raise BadRequestError(too_big)
+            return mock.Mock(total=14, items=list(range(skip, min(skip + query['limit'], 14))))
+
+        mock_client.return_value.entries.side_effect = entries
+
+        assert get_data_from_contentful(settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE) == list(range(14))
+
     def test_rich_text_to_plain_text(self):
         """
         Test rich_text_to_plain_text utility which transforms rich text to plain text.
@@ -195,3 +236,158 @@ class TestContentfulUtils(TestCase):
 
         transformed_data = fetch_and_transform_degree_contentful_data()
         self.assertDictEqual(expected_response, transformed_data)
+
+
+@mock.patch(f'{CONTENTFUL_UTILS_PATH}.Client')
+class TestContentfulSnapshot(TestCase):
+    """
+    Test the snapshots of the data transformed from Contentful.
+    """
+
+    def setUp(self):
+        super().setUp()
+        snapshot_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(snapshot_dir.cleanup)
+        settings_override = override_settings(
+            CONTENTFUL_SNAPSHOT_DIR=snapshot_dir.name, CONTENTFUL_SNAPSHOT_SYNC_INTERVAL=0,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.snapshot_path = os.path.join(snapshot_dir.name, CONTENTFUL_SNAPSHOT_FILE_NAME)
+
+    def mock_sync(self, mock_client, sync_token, items=()):
+        mock_client.return_value.sync.return_value = mock.Mock(
+            items=list(items), next_page_url='', next_sync_token=sync_token
+        )
+
+    def test_snapshot(self, mock_client):
+        """
+        Test the transformed data is stored in a snapshot, with the sync token it is up to date with.
+        """
+        mock_client.return_value.entries.return_value = MockContentfulBootcampResponse
+        self.mock_sync(mock_client, 'first-token')
+
+        transformed_data = fetch_and_transform_bootcamp_contentful_data()
+
+        assert transformed_data == MockContentfulBootcampResponse().bootcamp_transformed_data
+        mock_client.return_value.sync.assert_called_once_with({'initial': True})
+        with open(self.snapshot_path) as snapshot_file:
+            snapshot = json.load(snapshot_file)
+        assert snapshot['version'] == CONTENTFUL_SNAPSHOT_VERSION
+        assert snapshot['sync_token'] == 'first-token'
+        bootcamp_snapshot = snapshot['content_types'][settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE]
+        assert bootcamp_snapshot['data'] == transformed_data
+        assert not bootcamp_snapshot['stale']
+        assert 'seo' in bootcamp_snapshot['linked_content_types']
+
+    def test_snapshot_unchanged(self, mock_client):
+        """
+        Test the snapshot is used without fetching entries when nothing changed in Contentful since it was taken.
+        """
+        mock_client.return_value.entries.return_value = MockContentfulBootcampResponse
+        self.mock_sync(mock_client, 'first-token')
+        transformed_data = fetch_and_transform_bootcamp_contentful_data()
+        mock_client.return_value.entries.reset_mock()
+        self.mock_sync(mock_client, 'second-token')
+
+        assert fetch_and_transform_bootcamp_contentful_data() == transformed_data
+
+        mock_client.return_value.sync.assert_called_once_with({'sync_token': 'first-token'})
+        mock_client.return_value.entries.assert_not_called()
+        with open(self.snapshot_path) as snapshot_file:
+            assert json.load(snapshot_file)['sync_token'] == 'second-token'
+
+    def test_snapshot_changed(self, mock_client):
+        """
+        Test the entries are fetched again when something changed in Contentful since the snapshot was taken.
+        """
+        mock_client.return_value.entries.return_value = MockContentfulBootcampResponse
+        self.mock_sync(mock_client, 'first-token')
+        fetch_and_transform_bootcamp_contentful_data()
+        mock_client.return_value.entries.reset_mock()
+        self.mock_sync(mock_client, 'second-token', items=[mock.Mock()])
+
+        fetch_and_transform_bootcamp_contentful_data()
+
+        mock_client.return_value.entries.assert_called_once()
+
+    def test_snapshot_changed_content_types(self, mock_client):
+        """
+        Test only the content types whose entries, or the entries they link to, changed are fetched again.
+        """
+        mock_client.return_value.entries.return_value = MockContentfulBootcampResponse
+        self.mock_sync(mock_client, 'first-token')
+        fetch_and_transform_bootcamp_contentful_data()
+        mock_client.return_value.entries.reset_mock()
+
+        self.mock_sync(mock_client, 'second-token', items=[create_contentful_entry('unrelated', {})])
+        fetch_and_transform_bootcamp_contentful_data()
+        mock_client.return_value.entries.assert_not_called()
+
+        self.mock_sync(mock_client, 'third-token', items=[create_contentful_entry('seo', {})])
+        fetch_and_transform_bootcamp_contentful_data()
+        mock_client.return_value.entries.assert_called_once()
+
+    @override_settings(CONTENTFUL_SNAPSHOT_SYNC_INTERVAL=60)
+    def test_snapshot_single_sync(self, mock_client):
+        """
+        Test Contentful is synced once for all the content types.
+        """
+        degree_response = mock.Mock(items=[MockContenfulDegreeResponse().mock_contentful_degree_entry], total=1)
+        mock_client.return_value.entries.side_effect = lambda query: (
+            MockContentfulBootcampResponse if query['content_type'] == settings.BOOTCAMP_CONTENTFUL_CONTENT_TYPE
+            else degree_response
+        )
+        self.mock_sync(mock_client, 'first-token')
+
+        fetch_and_transform_bootcamp_contentful_data()
+        fetch_and_transform_degree_contentful_data()
+
+        mock_client.return_value.sync.assert_called_once_with({'initial': True})
+        assert mock_client.return_value.entries.call_count == 2
+
+    def test_snapshot_contentful_error(self, mock_client):
+        """
+        Test the snapshot is used when Contentful can't be reached, and the error raised when there is none.
+        """
+        mock_client.return_value.sync.side_effect = RequestsConnectionError
+        with pytest.raises(RequestsConnectionError):
+            fetch_and_transform_bootcamp_contentful_data()
+
+        mock_client.return_value.sync.side_effect = None
+        mock_client.return_value.entries.return_value = MockContentfulBootcampResponse
+        self.mock_sync(mock_client, 'first-token')
+        transformed_data = fetch_and_transform_bootcamp_contentful_data()
+
+        self.mock_sync(mock_client, 'second-token', items=[mock.Mock()])
+        mock_client.return_value.entries.side_effect = RequestsConnectionError
+        with LogCapture(LOGGER_NAME) as log_capture:
+            assert fetch_and_transform_bootcamp_contentful_data() == transformed_data
+        assert 'using its last snapshot' in str(log_capture)
+
+    @override_settings(CONTENTFUL_SNAPSHOT_SYNC_INTERVAL=60)
+    def test_snapshot_recent(self, mock_client):
+        """
+        Test a recent snapshot is used without asking Contentful for changes.
+        """
+        mock_client.return_value.entries.return_value = MockContentfulBootcampResponse
+        self.mock_sync(mock_client, 'first-token')
+        transformed_data = fetch_and_transform_bootcamp_contentful_data()
+        mock_client.reset_mock()
+
+        assert fetch_and_transform_bootcamp_contentful_data() == transformed_data
+        mock_client.assert_not_called()
+
+    def test_snapshot_version(self, mock_client):
+        """
+        Test snapshots of another version are rebuilt.
+        """
+        with open(self.snapshot_path, 'w') as snapshot_file:
+            json.dump({'version': CONTENTFUL_SNAPSHOT_VERSION - 1, 'sync_token': 'old-token', 'synced': 0},
+                      snapshot_file)
+        mock_client.return_value.entries.return_value = MockContentfulBootcampResponse
+        self.mock_sync(mock_client, 'first-token')
+
+        assert fetch_and_transform_bootcamp_contentful_data() == \
+            MockContentfulBootcampResponse().bootcamp_transformed_data
+        mock_client.return_value.sync.assert_called_once_with({'initial': True})
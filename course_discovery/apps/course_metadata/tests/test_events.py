@@ -0,0 +1,89 @@
+import datetime
+from unittest import mock
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from freezegun import freeze_time
+
+from course_discovery.apps.core.tests.factories import PartnerFactory
+from course_discovery.apps.course_metadata.events import record_course_catalog_event
+from course_discovery.apps.course_metadata.models import CourseCatalogEvent
+from course_discovery.apps.course_metadata.tasks import update_course_runs_from_events
+
+EVENTS_PATH = 'course_discovery.apps.course_metadata.events'
+COURSE_RUN_KEY = 'course-v1:edX+DemoX+1T2024'
+
+
+@freeze_time('2024-01-01 12:00:00')
+@override_settings(EVENT_BUS_BATCH_WINDOW_SECONDS=5)
+class RecordCourseCatalogEventTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        apply_async_patcher = mock.patch(f'{EVENTS_PATH}.update_course_runs_from_events.apply_async')
+        self.mock_apply_async = apply_async_patcher.start()
+        self.addCleanup(apply_async_patcher.stop)
+        self.time = timezone.now()
+
+    def test_record(self):
+        """ Verify events are stored, then applied once the window elapses. """
+        assert record_course_catalog_event({'id': COURSE_RUN_KEY}, self.time, delay=60)
+
+        event = CourseCatalogEvent.objects.get(course_run_key=COURSE_RUN_KEY)
+        assert event.body == {'id': COURSE_RUN_KEY}
+        assert event.time == self.time
+        assert event.apply_after == self.time + datetime.timedelta(seconds=65)
+        assert not event.applied
+        self.mock_apply_async.assert_called_once_with(countdown=65)
+
+    def test_coalesce(self):
+        """ Verify only the latest event of a course run is kept, and applied again if it was already applied. """
+        record_course_catalog_event({'id': COURSE_RUN_KEY, 'name': 'Old'}, self.time)
+        CourseCatalogEvent.objects.update(applied=True)
+
+        assert record_course_catalog_event(
+            {'id': COURSE_RUN_KEY, 'name': 'New'}, self.time + datetime.timedelta(seconds=1),
+        )
+
+        event = CourseCatalogEvent.objects.get(course_run_key=COURSE_RUN_KEY)
+        assert event.body == {'id': COURSE_RUN_KEY, 'name': 'New'}
+        assert not event.applied
+        assert self.mock_apply_async.call_count == 2
+
+    def test_out_of_order(self):
+        """ Verify events older than the latest event of a course run are ignored. """
+        record_course_catalog_event({'id': COURSE_RUN_KEY, 'name': 'New'}, self.time)
+        self.mock_apply_async.reset_mock()
+
+        assert not record_course_catalog_event(
+            {'id': COURSE_RUN_KEY, 'name': 'Old'}, self.time - datetime.timedelta(seconds=1),
+        )
+
+        assert CourseCatalogEvent.objects.get(course_run_key=COURSE_RUN_KEY).body['name'] == 'New'
+        self.mock_apply_async.assert_not_called()
+
+
+class UpdateCourseRunsFromEventsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        PartnerFactory(id=settings.DEFAULT_PARTNER_ID)
+
+    @mock.patch('course_discovery.apps.course_metadata.tasks.CoursesApiDataLoader.process_single_course_run')
+    def test_apply_due_events(self, mock_process_single_course_run):
+        """ Verify the pending events that are due are applied once, and the others are left pending. """
+        now = timezone.now()
+        due, later = (
+            CourseCatalogEvent.objects.create(
+                course_run_key=key, body={'id': key}, time=now, apply_after=now + datetime.timedelta(seconds=seconds),
+            )
+            for key, seconds in (('course-v1:edX+Due+1T2024', -1), ('course-v1:edX+Later+1T2024', 60))
+        )
+
+        update_course_runs_from_events()
+        update_course_runs_from_events()
+
+        mock_process_single_course_run.assert_called_once_with(due.body)
+        due.refresh_from_db()
+        later.refresh_from_db()
+        assert due.applied
+        assert not later.applied
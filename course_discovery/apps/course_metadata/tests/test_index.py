@@ -0,0 +1,125 @@
+import datetime
+from unittest import mock
+
+import pytest
+from algoliasearch_django.settings import SETTINGS
+from django.test import override_settings
+from pytz import UTC
+
+from course_discovery.apps.course_metadata.algolia_local import LocalAlgoliaClient
+from course_discovery.apps.course_metadata.algolia_models import AlgoliaProxyCourse, AlgoliaProxyProduct
+from course_discovery.apps.course_metadata.index import ProductMetaIndex, iterate_in_chunks
+from course_discovery.apps.course_metadata.models import Course
+from course_discovery.apps.course_metadata.tests.factories import OrganizationFactory, SourceFactory
+from course_discovery.apps.course_metadata.tests.test_algolia_models import TestAlgoliaProxyWithEdxPartner
+
+INDEX_PATH = 'course_discovery.apps.course_metadata.index'
+
+
+@pytest.mark.django_db
+class ProductMetaIndexTests(TestAlgoliaProxyWithEdxPartner):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Products are loaded from the database when indexing.
+        cls.edxPartner.save()
+
+    def setUp(self):
+        super().setUp()
+        for name in ('fetch_and_transform_bootcamp_contentful_data', 'fetch_and_transform_degree_contentful_data'):
+            patcher = mock.patch(f'{INDEX_PATH}.{name}', return_value={})
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.client = LocalAlgoliaClient()
+        self.index = ProductMetaIndex(AlgoliaProxyProduct, self.client, SETTINGS)
+
+    def create_indexable_course(self):
+        course = self.create_current_upgradeable_course()
+        course.authoring_organizations.add(OrganizationFactory())
+        return course
+
+    def test_iterate_in_chunks(self):
+        courses = [self.create_indexable_course() for __ in range(3)]
+
+        chunked = list(iterate_in_chunks(AlgoliaProxyCourse.objects.prefetch_related('course_runs'), chunk_size=2))
+
+        assert chunked == sorted(courses, key=lambda course: course.pk)
+
+    def test_reindex_all(self):
+        """ Verify indexable products are saved to the English and Spanish indices in batches. """
+        courses = [self.create_indexable_course() for __ in range(3)]
+        hidden_course = self.create_indexable_course()
+        hidden_course.authoring_organizations.clear()
+
+        self.index.reindex_all(batch_size=2)
+
+        for index_name in ('product', 'spanish_product'):
+            index = self.client.indices[index_name]
+            assert set(index.objects) == {f'course-{course.uuid}' for course in courses}
+            assert self.client.indices[f'{index_name}_tmp'].requests['save_objects'] == 2
+
+    def test_reindex_all_single_pass(self):
+        """ Verify the products are loaded once for both indices, and the rules of the indices are kept. """
+        self.create_indexable_course()
+        for index_name in ('product', 'spanish_product'):
+            self.client.init_index(index_name).rules = {'rule': {'objectID': 'rule'}}
+
+        with mock.patch(f'{INDEX_PATH}.iterate_in_chunks', wraps=iterate_in_chunks) as mock_iterate_in_chunks:
+            self.index.reindex_all()
+
+        # Once for the courses, and once for the programs.
+        assert mock_iterate_in_chunks.call_count == 2
+        for index_name in ('product', 'spanish_product'):
+            index = self.client.indices[index_name]
+            assert len(index.objects) == 1
+            assert 'rule' in index.rules
+
+    def test_update_modified_records(self):
+        """ Verify only the products modified since the given datetime are pushed to the indices. """
+        unmodified_course = self.create_indexable_course()
+        modified_course = self.create_indexable_course()
+        removed_course = self.create_indexable_course()
+        self.index.reindex_all()
+
+        since = datetime.datetime.now(UTC)
+        AlgoliaProxyCourse.objects.filter(pk=unmodified_course.pk).update(
+            data_modified_timestamp=since - datetime.timedelta(days=1), title='Not pushed',
+        )
+        AlgoliaProxyCourse.objects.filter(pk=modified_course.pk).update(
+            data_modified_timestamp=since, title='Pushed',
+        )
+        AlgoliaProxyCourse.objects.filter(pk=removed_course.pk).update(data_modified_timestamp=since)
+        removed_course.authoring_organizations.clear()
+
+        self.index.update_modified_records(since)
+
+        for index_name in ('product', 'spanish_product'):
+            index = self.client.indices[index_name]
+            assert index.requests['partial_update_objects'] == 1
+            assert index.requests['delete_objects'] == 1
+            assert set(index.objects) == {f'course-{unmodified_course.uuid}', f'course-{modified_course.uuid}'}
+            assert index.objects[f'course-{unmodified_course.uuid}']['title'] == unmodified_course.title
+            assert index.objects[f'course-{modified_course.uuid}']['title'] == 'Pushed'
+
+    def test_update_modified_records_removed_products(self):
+        """ Verify deleted products, and products excluded since the last update, are deleted from the indices. """
+        deleted_course = self.create_indexable_course()
+        ended_course = self.create_indexable_course()
+        excluded_course = self.create_indexable_course()
+        self.index.reindex_all()
+
+        since = datetime.datetime.now(UTC)
+        AlgoliaProxyCourse.objects.filter(pk__in=[ended_course.pk, excluded_course.pk]).update(
+            data_modified_timestamp=since - datetime.timedelta(days=1),
+        )
+        Course.objects.get(pk=deleted_course.pk).delete()
+        # The course run ends, without the course being modified.
+        ended_course.course_runs.update(end=since, enrollment_end=since)
+        AlgoliaProxyCourse.objects.filter(pk=excluded_course.pk).update(product_source=SourceFactory(slug='excluded'))
+
+        with override_settings(ALGOLIA_INDEX_EXCLUDED_SOURCES=['excluded']):
+            self.index.update_modified_records(since)
+
+        for index_name in ('product', 'spanish_product'):
+            assert not self.client.indices[index_name].objects
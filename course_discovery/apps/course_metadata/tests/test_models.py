@@ -34,7 +34,8 @@ from course_discovery.apps.course_metadata.models import (
     FAQ, AbstractHeadingBlurbModel, AbstractMediaModel, AbstractNamedModel, AbstractTitleDescriptionModel,
     AbstractValueModel, CorporateEndorsement, Course, CourseEditor, CourseRun, CourseRunType, CourseType, Curriculum,
     CurriculumCourseMembership, CurriculumCourseRunExclusion, CurriculumProgramMembership, DegreeCost, DegreeDeadline,
-    Endorsement, Organization, OrganizationMapping, Program, ProgramType, Ranking, Seat, SeatType, Subject, Topic
+    Endorsement, Organization, OrganizationMapping, Program, ProgramAggregate, ProgramType, Ranking, Seat, SeatType,
+    Subject, Topic
 )
 from course_discovery.apps.course_metadata.publishers import (
     CourseRunMarketingSitePublisher, ProgramMarketingSitePublisher
@@ -2456,6 +2457,65 @@ class ProgramTests(TestCase):
         expected_price_ranges = [{'currency': 'USD', 'min': Decimal(100), 'max': Decimal(600), 'total': Decimal(600)}]
         assert program.price_ranges == expected_price_ranges
 
+    def test_aggregate_refresh(self):
+        """ Verify the values computed from the courses of a program are stored, and read back without queries. """
+        program = self.create_program_with_seats()
+        assert program.aggregate_values == ProgramAggregate.compute(program)
+
+        ProgramAggregate.refresh(Program.objects.filter(pk=program.pk))
+        program = Program.objects.select_related('aggregate').get(pk=program.pk)
+
+        with self.assertNumQueries(0):
+            values = program.aggregate_values
+        assert values == ProgramAggregate.compute(program)
+        assert values['price_ranges'] == [
+            {'currency': 'USD', 'min': Decimal(100), 'max': Decimal(600), 'total': Decimal(600)}
+        ]
+        assert values['seat_types'] == [Seat.CREDIT, Seat.VERIFIED]
+
+    def test_aggregate_refreshed_on_change(self):
+        """ Verify the aggregate of a program is refreshed once a change to its seats is committed. """
+        with self.captureOnCommitCallbacks(execute=True):
+            program = self.create_program_with_seats()
+        seat = Seat.objects.get(course_run__course__programs=program, type__slug=Seat.VERIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            seat.price = 200
+            seat.save()
+
+        aggregate = ProgramAggregate.objects.get(program=program)
+        assert aggregate.get_values()['price_ranges'][0]['min'] == Decimal(200)
+
+    @mock.patch('course_discovery.apps.course_metadata.signals.refresh_program_aggregates.delay')
+    def test_aggregate_refresh_coalesced(self, mock_delay):
+        """ Verify the changes committed together refresh the aggregates of programs once. """
+        with self.captureOnCommitCallbacks(execute=True):
+            program = self.create_program_with_seats()
+        mock_delay.reset_mock()
+        course_run = program.courses.get().course_runs.get()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for seat in course_run.seats.all():
+                seat.price += 1
+                seat.save()
+            course_run.save()
+
+        mock_delay.assert_called_once_with(
+            program_ids=[], course_ids=[course_run.course_id], course_run_ids=[course_run.pk],
+        )
+
+    @mock.patch('course_discovery.apps.course_metadata.signals.refresh_program_aggregates.delay')
+    def test_aggregate_refreshed_on_course_delete(self, mock_delay):
+        """ Verify the aggregates of the programs a deleted course belonged to are refreshed. """
+        with self.captureOnCommitCallbacks(execute=True):
+            program = self.create_program_with_seats()
+        mock_delay.reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            program.courses.get().delete()
+
+        assert program.pk in mock_delay.call_args.kwargs['program_ids']
+
     def test_price_ranges_multiple_course(self):
         """ Verifies the price_range property of a program with multiple courses """
         currency = Currency.objects.get(code='USD')
@@ -8,6 +8,7 @@ from django.test import TestCase
 
 from course_discovery.apps.course_metadata.choices import CourseRunStatus, ProgramStatus
 from course_discovery.apps.course_metadata.models import Course, CourseRun, Program
+from course_discovery.apps.course_metadata.query import is_course_run_enrollable, is_course_run_marketable
 from course_discovery.apps.course_metadata.tests.factories import CourseRunFactory, ProgramFactory, SeatFactory
 
 
@@ -125,6 +126,30 @@ class CourseRunQuerySetTests(TestCase):
         assert CourseRun.objects.marketable().exists() == is_published
 
 
+@pytest.mark.usefixtures('course_run_states')
+class CourseRunPredicateTests(TestCase):
+    def test_predicates_match_queryset(self):
+        """ Verify the in memory predicates agree with the enrollable() and marketable() queries. """
+        for state in self.states():
+            course_run = CourseRunFactory()
+            for function in state:
+                function(course_run)
+            course_run.save()
+
+            course_runs = CourseRun.objects.filter(id=course_run.id)
+            course_run = course_runs.prefetch_related('seats').select_related('type').get()
+            assert is_course_run_enrollable(course_run) == course_runs.enrollable().exists()
+            assert is_course_run_marketable(course_run) == course_runs.marketable().exists()
+
+    def test_marketable_type(self):
+        """ Verify course runs of a type that is not marketable are not marketable. """
+        course_run = CourseRunFactory(status=CourseRunStatus.Published, type__is_marketable=False)
+        SeatFactory(course_run=course_run)
+
+        assert not is_course_run_marketable(course_run)
+        assert not CourseRun.objects.marketable().exists()
+
+
 @ddt.ddt
 class ProgramQuerySetTests(TestCase):
     @ddt.data(
@@ -23,21 +23,25 @@ from course_discovery.apps.course_metadata.algolia_models import (
 from course_discovery.apps.course_metadata.choices import CourseRunStatus
 from course_discovery.apps.course_metadata.models import (
     BackfillCourseRunSlugsConfig, BackpopulateCourseTypeConfig, BulkModifyProgramHookConfig, BulkUpdateImagesConfig,
-    BulkUploadTagsConfig, CourseRun, CSVDataLoaderConfiguration, Curriculum, CurriculumProgramMembership,
-    DataLoaderConfig, DeduplicateHistoryConfig, DeletePersonDupsConfig, DrupalPublishUuidConfig, LevelTypeTranslation,
-    MigratePublisherToCourseMetadataConfig, ProfileImageDownloadConfig, Program, ProgramTypeTranslation,
-    RemoveRedirectsConfig, SubjectTranslation, TagCourseUuidsConfig, TopicTranslation
+    BulkUploadTagsConfig, CourseCatalogEvent, CourseRun, CSVDataLoaderConfiguration, Curriculum,
+    CurriculumProgramMembership, DataLoaderConfig, DataLoaderFingerprint, DeduplicateHistoryConfig,
+    DeletePersonDupsConfig, DrupalPublishUuidConfig, LevelTypeTranslation, MigratePublisherToCourseMetadataConfig,
+    ProfileImageDownloadConfig, Program, ProgramTypeTranslation, RemoveRedirectsConfig, SubjectTranslation,
+    TagCourseUuidsConfig, TopicTranslation
+)
+from course_discovery.apps.course_metadata.signals import (
+    API_CACHE_EXEMPT_MODELS, _duplicate_external_key_message, update_course_data_from_event
 )
-from course_discovery.apps.course_metadata.signals import _duplicate_external_key_message, update_course_data_from_event
 from course_discovery.apps.course_metadata.tests import factories
 
 LOGGER_NAME = 'course_discovery.apps.course_metadata.signals'
 
 
 @pytest.mark.django_db
+@mock.patch('course_discovery.apps.api.cache.invalidate_cache_tags')
 @mock.patch('course_discovery.apps.api.cache.set_api_timestamp')
 class TestCacheInvalidation:
-    def test_model_change(self, mock_set_api_timestamp):
+    def test_model_change(self, mock_set_api_timestamp, mock_invalidate_cache_tags):
         """
         Verify that the API cache is invalidated after course_metadata models
         are saved or deleted.
@@ -62,6 +66,9 @@ class TestCacheInvalidation:
                          LevelTypeTranslation, SearchDefaultResultsConfiguration, BulkUpdateImagesConfig,
                          BulkUploadTagsConfig, CSVDataLoaderConfiguration, DeduplicateHistoryConfig]:
                 continue
+            # Bookkeeping models don't invalidate the API cache.
+            if model in API_CACHE_EXEMPT_MODELS:
+                continue
             if 'abstract' in model.__name__.lower() or 'historical' in model.__name__.lower():
                 continue
 
@@ -72,13 +79,76 @@ class TestCacheInvalidation:
             # Verify that model creation and deletion invalidates the API cache.
             instance = factory()
 
-            assert mock_set_api_timestamp.called
+            assert mock_set_api_timestamp.called or mock_invalidate_cache_tags.called
             mock_set_api_timestamp.reset_mock()
+            mock_invalidate_cache_tags.reset_mock()
 
             instance.delete()
 
-            assert mock_set_api_timestamp.called
+            assert mock_set_api_timestamp.called or mock_invalidate_cache_tags.called
             mock_set_api_timestamp.reset_mock()
+            mock_invalidate_cache_tags.reset_mock()
+
+    def test_exempt_models(self, mock_set_api_timestamp, mock_invalidate_cache_tags):
+        """
+        Verify that changes to the bookkeeping of the data loaders don't invalidate the API cache.
+        """
+        fingerprint = DataLoaderFingerprint.objects.create(
+            partner=PartnerFactory(), loader='CoursesApiDataLoader', key='course-v1:edX+DemoX+1T2024', fingerprint='0',
+        )
+        fingerprint.delete()
+
+        assert not mock_set_api_timestamp.called
+        assert not mock_invalidate_cache_tags.called
+
+    def test_targeted_invalidation(self, mock_set_api_timestamp, mock_invalidate_cache_tags):
+        """
+        Verify that changes to course runs only invalidate the cached responses tagged with their course.
+        """
+        course_run = factories.CourseRunFactory()
+        mock_set_api_timestamp.reset_mock()
+        mock_invalidate_cache_tags.reset_mock()
+
+        course_run.save()
+
+        course_tags = {
+            'course',
+            f'course:partner:{course_run.course.partner_id}',
+            f'course:{course_run.course.uuid}',
+        }
+        assert not mock_set_api_timestamp.called
+        assert mock_invalidate_cache_tags.called
+        # Saving a run may also touch its course, which has the same tags.
+        assert all(call.args == (course_tags,) for call in mock_invalidate_cache_tags.call_args_list)
+
+    def test_targeted_invalidation_of_programs(self, mock_set_api_timestamp, mock_invalidate_cache_tags):
+        """
+        Verify that changes to seats also invalidate the cached responses tagged with the programs of their course.
+        """
+        seat = factories.SeatFactory()
+        program = factories.ProgramFactory(courses=[seat.course_run.course])
+        mock_set_api_timestamp.reset_mock()
+        mock_invalidate_cache_tags.reset_mock()
+
+        seat.save()
+
+        assert not mock_set_api_timestamp.called
+        mock_invalidate_cache_tags.assert_called_once()
+        assert {
+            f'program:partner:{program.partner_id}', f'program:{program.uuid}', f'course:{seat.course_run.course.uuid}'
+        } <= mock_invalidate_cache_tags.call_args.args[0]
+
+    def test_course_deletion(self, mock_set_api_timestamp, mock_invalidate_cache_tags):  # pylint: disable=unused-argument
+        """
+        Verify that deleting a course invalidates every cached response, since its programs can't be found anymore.
+        """
+        course = factories.CourseFactory()
+        factories.ProgramFactory(courses=[course])
+        mock_set_api_timestamp.reset_mock()
+
+        course.delete()
+
+        assert mock_set_api_timestamp.called
 
 
 @ddt.ddt
@@ -858,11 +928,11 @@ class TestCourseDataUpdateSignal(TestCase):
             update_course_data_from_event(catalog_info=catalog_data)
             assert 'An error occurred while updating' in captured_logs.output[1]
 
-    @mock.patch('time.sleep')
-    def test_event_processing_delay(self, sleep_patch):
+    @mock.patch('course_discovery.apps.course_metadata.events.update_course_runs_from_events.apply_async')
+    def test_event_processing_delay(self, apply_async_patch):
         """
-        Verify that event processing is artificially delayed if the event is received within delay
-        applicable time window.
+        Verify that event processing is delayed, without blocking the consumer, if the event is received within
+        delay applicable time window.
         """
         metadata = EventsMetadata(event_type='catalog-data-changed', minorversion=0)
         with override_settings(EVENT_BUS_MESSAGE_DELAY_THRESHOLD_SECONDS=120):
@@ -874,4 +944,7 @@ class TestCourseDataUpdateSignal(TestCase):
                 assert f"COURSE_CATALOG_INFO_CHANGED event received within the " \
                        f"delay applicable window for course run {self.course_key}." in logger.output[0]
 
-        sleep_patch.assert_called_once_with(settings.EVENT_BUS_PROCESSING_DELAY_SECONDS)
+        apply_async_patch.assert_called_once_with(countdown=settings.EVENT_BUS_PROCESSING_DELAY_SECONDS)
+        event = CourseCatalogEvent.objects.get(course_run_key=str(self.course_key))
+        assert event.time == metadata.time
+        assert not event.applied
@@ -10,6 +10,7 @@ import pytz
 import requests
 import responses
 from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 
 from course_discovery.apps.api.tests.mixins import SiteMixin
@@ -29,7 +30,7 @@ from course_discovery.apps.course_metadata.tests.factories import (
 )
 from course_discovery.apps.course_metadata.tests.mixins import MarketingSiteAPIClientTestMixin
 from course_discovery.apps.course_metadata.utils import (
-    calculated_seat_upgrade_deadline, clean_html, convert_svg_to_png_from_url, create_missing_entitlement,
+    ImageFetcher, calculated_seat_upgrade_deadline, clean_html, convert_svg_to_png_from_url, create_missing_entitlement,
     download_and_save_course_image, download_and_save_program_image, ensure_draft_world, fetch_getsmarter_products,
     is_google_drive_url, serialize_entitlement_for_ecommerce_api, serialize_seat_for_ecommerce_api,
     transform_skills_data
@@ -951,6 +952,75 @@ class TestDownloadAndSaveImage(TestCase):
         assert str(course.uuid) in course.organization_logo_override.name
 
 
+class TestImageSourceCaching(TestCase):
+    """ Test that images are neither downloaded nor saved again when they were not modified """
+
+    IMAGE_URL = 'https://example.com/cached-image.png'
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.course = CourseFactory(card_image_url=self.IMAGE_URL, image=None)
+
+    def mock_image_response(self, headers=None):
+        def callback(request):
+            if headers and request.headers.get('If-None-Match') == headers.get('ETag'):
+                return 304, {}, b''
+            return 200, dict(headers or {}, **{'Content-Type': 'image/png'}), TestDownloadAndSaveImage.IMG_CONTENT
+
+        responses.add_callback(responses.GET, self.IMAGE_URL, callback=callback)
+
+    @responses.activate
+    def test_not_modified(self):
+        """ Verify an image is not downloaded again when the server answers a conditional request as not modified. """
+        self.mock_image_response(headers={'ETag': '"abc"'})
+        assert download_and_save_course_image(self.course, self.IMAGE_URL) is True
+
+        with mock.patch('stdimage.models.StdImageFieldFile.save') as mock_save:
+            assert download_and_save_course_image(self.course, self.IMAGE_URL) is True
+
+        mock_save.assert_not_called()
+        assert responses.calls[1].request.headers['If-None-Match'] == '"abc"'
+        assert responses.calls[1].response.status_code == 304
+
+    @responses.activate
+    def test_same_content(self):
+        """ Verify an image with the same content as the one saved is not saved again. """
+        self.mock_image_response()
+        assert download_and_save_course_image(self.course, self.IMAGE_URL) is True
+
+        with mock.patch('stdimage.models.StdImageFieldFile.save') as mock_save:
+            assert download_and_save_course_image(self.course, self.IMAGE_URL) is True
+
+        mock_save.assert_not_called()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_not_modified_for_other_object(self):
+        """ Verify an image not modified since it was saved for another object is downloaded in full. """
+        self.mock_image_response(headers={'ETag': '"abc"'})
+        other_course = CourseFactory(card_image_url=self.IMAGE_URL, image=None)
+        assert download_and_save_course_image(other_course, self.IMAGE_URL) is True
+
+        assert download_and_save_course_image(self.course, self.IMAGE_URL) is True
+
+        self.course.refresh_from_db()
+        assert self.course.image.read() == TestDownloadAndSaveImage.IMG_CONTENT
+        assert [call.response.status_code for call in responses.calls] == [200, 304, 200]
+
+    @responses.activate
+    def test_image_fetcher(self):
+        """ Verify images prefetched by an ImageFetcher are downloaded once. """
+        self.mock_image_response()
+        with ImageFetcher(max_workers=2) as image_fetcher:
+            image_fetcher.prefetch([self.IMAGE_URL, self.IMAGE_URL, None])
+            assert download_and_save_course_image(self.course, self.IMAGE_URL, image_fetcher=image_fetcher) is True
+
+        assert len(responses.calls) == 1
+        self.course.refresh_from_db()
+        assert self.course.image.read() == TestDownloadAndSaveImage.IMG_CONTENT
+
+
 class TestGEAGApiProductDetails(TestCase):
     """
     Test for GEAG API Product Details using getsmarter_api_client
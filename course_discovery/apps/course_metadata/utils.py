@@ -1,8 +1,11 @@
+import concurrent.futures
 import datetime
+import hashlib
 import logging
 import random
 import string
 import uuid
+from collections import namedtuple
 from tempfile import NamedTemporaryFile
 from urllib.parse import urljoin, urlparse
 
@@ -12,6 +15,7 @@ import requests
 from bs4 import BeautifulSoup
 from cairosvg import svg2png
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.base import ContentFile
 from django.db import models, transaction
 from django.utils.functional import cached_property
@@ -33,6 +37,8 @@ from course_discovery.apps.publisher.utils import VALID_CHARS_IN_COURSE_NUM_AND_
 logger = logging.getLogger(__name__)
 
 RESERVED_ELASTICSEARCH_QUERY_OPERATORS = ('AND', 'OR', 'NOT', 'TO',)
+IMAGE_SOURCE_CACHE_KEY = 'image_source.{}'
+SAVED_IMAGE_CACHE_KEY = 'saved_image.{}.{}.{}'
 
 
 def clean_query(query):
@@ -733,27 +739,161 @@ def get_file_from_drive_link(image_url):
     return content_type, content
 
 
-def download_and_save_course_image(course, image_url, data_field='image', headers=None):
+class FetchedImage(namedtuple('FetchedImage', ['status_code', 'content_type', 'content', 'content_hash'])):
+    """
+    Image downloaded from a url, see fetch_image.
+
+    `content` is None when the image was not modified since it was last downloaded, in which case `content_hash`
+    is the hash of the content downloaded then.
+    """
+
+
+def get_content_hash(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def fetch_image(image_url, headers=None, conditional=True):
+    """
+    Download an image from a url.
+
+    The ETag and Last-Modified headers the image was last downloaded with are cached, so that a conditional request
+    tells when the image was not modified since, sparing the download.
+
+    Arguments:
+        image_url (str): url of the image, either a Google Drive link or a direct link
+        headers (dict): headers of the request
+        conditional (bool): whether to make a conditional request, if the image was downloaded before
+
+    Returns:
+        FetchedImage
+    """
+    if is_google_drive_url(image_url):
+        content_type, content = get_file_from_drive_link(image_url)
+        return FetchedImage(requests.codes.ok, content_type, content, get_content_hash(content))  # pylint: disable=no-member
+
+    cache_key = IMAGE_SOURCE_CACHE_KEY.format(get_content_hash(image_url.encode('utf-8')))
+    source = cache.get(cache_key) if conditional else None
+    request_headers = dict(headers or {})
+    if source:
+        if source['etag']:
+            request_headers['If-None-Match'] = source['etag']
+        if source['last_modified']:
+            request_headers['If-Modified-Since'] = source['last_modified']
+
+    response = requests.get(image_url, headers=request_headers)  # pylint: disable=missing-timeout
+    if source and response.status_code == requests.codes.not_modified:  # pylint: disable=no-member
+        return FetchedImage(requests.codes.ok, source['content_type'], None, source['content_hash'])  # pylint: disable=no-member
+    if response.status_code != requests.codes.ok:  # pylint: disable=no-member
+        return FetchedImage(response.status_code, None, response.content, None)
+
+    content_type = response.headers['Content-Type'].lower()
+    content_hash = get_content_hash(response.content)
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        cache.set(cache_key, {
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_type': content_type,
+            'content_hash': content_hash,
+        }, settings.IMAGE_SOURCE_CACHE_TIMEOUT)
+    return FetchedImage(response.status_code, content_type, response.content, content_hash)
+
+
+class ImageFetcher:
+    """
+    Downloads images with a bounded pool of threads, ahead of the time they are saved.
+
+    Usage:
+        with ImageFetcher(headers=headers) as image_fetcher:
+            image_fetcher.prefetch(image_urls)
+            for course, image_url in ...:
+                download_and_save_course_image(course, image_url, image_fetcher=image_fetcher)
+    """
+
+    def __init__(self, max_workers=None, headers=None):
+        self.headers = headers
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers or settings.IMAGE_DOWNLOAD_MAX_WORKERS)
+        self.futures = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """ Cancel the downloads that didn't start, and wait for the others to end. """
+        for future in self.futures.values():
+            future.cancel()
+        self.executor.shutdown()
+
+    def prefetch(self, image_urls):
+        """ Start downloading the images at the given urls. """
+        for image_url in image_urls:
+            if image_url and image_url not in self.futures:
+                self.futures[image_url] = self.executor.submit(fetch_image, image_url, self.headers)
+
+    def fetch(self, image_url):
+        """ Return the image at a url, waiting for it to be downloaded if it was prefetched. """
+        future = self.futures.get(image_url)
+        return future.result() if future else fetch_image(image_url, self.headers)
+
+
+def _get_saved_image_cache_key(instance, data_field):
+    return SAVED_IMAGE_CACHE_KEY.format(instance._meta.label_lower, instance.pk, data_field)
+
+
+def _is_image_saved(instance, data_field, field_file, image):
+    """ Return True if the image is the one last saved in the field, which holds it still. """
+    saved = cache.get(_get_saved_image_cache_key(instance, data_field))
+    return bool(field_file) and saved == {'name': field_file.name, 'content_hash': image.content_hash}
+
+
+def _record_saved_image(instance, data_field, field_file, image):
+    cache.set(
+        _get_saved_image_cache_key(instance, data_field),
+        {'name': field_file.name, 'content_hash': image.content_hash},
+        settings.IMAGE_SOURCE_CACHE_TIMEOUT,
+    )
+
+
+def _get_image(instance, data_field, field_file, image_url, headers, image_fetcher):
+    """
+    Download the image to save in a field, returning None if the field already holds it.
+    """
+    image = image_fetcher.fetch(image_url) if image_fetcher else fetch_image(image_url, headers)
+    if image.status_code == requests.codes.ok and _is_image_saved(instance, data_field, field_file, image):  # pylint: disable=no-member
+        return None
+    if image.content is None:
+        # The image was not modified since it was downloaded for another object.
+        image = fetch_image(image_url, image_fetcher.headers if image_fetcher else headers, conditional=False)
+    return image
+
+
+def download_and_save_course_image(course, image_url, data_field='image', headers=None, image_fetcher=None):
     """
     Helper method to download an image from a provided image url and save it
     in the data field mentioned, defaulting to course card image.
+
+    The image is neither downloaded nor saved again if it was not modified since it was last saved in the field.
+    Images can be downloaded ahead of time by an ImageFetcher.
     """
     try:
-        if is_google_drive_url(image_url):
-            content_type, content = get_file_from_drive_link(image_url)
-            extension = IMAGE_TYPES.get(content_type)
-        else:
-            response = requests.get(image_url, headers=headers)  # pylint: disable=missing-timeout
+        field_file = course.image if data_field == 'image' else getattr(course, data_field, None)
+        image = _get_image(course, data_field, field_file, image_url, headers, image_fetcher)
+        if image is None:
+            logger.info('Image for course [%s] from [%s] is unchanged and will not be saved again.', course.key,
+                        image_url)
+            return True
 
-            if response.status_code == requests.codes.ok:  # pylint: disable=no-member
-                content_type = response.headers['Content-Type'].lower()
-                extension = IMAGE_TYPES.get(content_type)
-                content = response.content
+        if image.status_code != requests.codes.ok:  # pylint: disable=no-member
+            msg = 'Failed to download image for course [%s] from [%s]! Response was [%d]:\n%s'
+            logger.error(msg, course.key, image_url, image.status_code, image.content)
+            return False
 
-            else:
-                msg = 'Failed to download image for course [%s] from [%s]! Response was [%d]:\n%s'
-                logger.error(msg, course.key, image_url, response.status_code, response.content)
-                return False
+        content_type, content = image.content_type, image.content
+        extension = IMAGE_TYPES.get(content_type)
 
         if extension:
             filename = '{uuid}.{extension}'.format(uuid=str(course.uuid), extension=extension)
@@ -771,6 +911,8 @@ def download_and_save_course_image(course, image_url, data_field='image', header
                 else:
                     logger.error('Update organization logo override failed for course [%s]', course.key)
                     return False
+            if field_file is not None:
+                _record_saved_image(course, data_field, field_file, image)
             logger.info(f'Image for course {course.key} successfully updated in {data_field} field')
             return True
         else:
@@ -805,27 +947,30 @@ def is_google_drive_url(url):
     return parsed_url.hostname == 'drive.google.com'
 
 
-def download_and_save_program_image(program, image_url, data_field='image', headers=None):
+def download_and_save_program_image(program, image_url, data_field='image', headers=None, image_fetcher=None):
     """
     Helper method to download an image from a provided image url and save it
     in the data field mentioned, defaulting to program card image.
+
+    The image is neither downloaded nor saved again if it was not modified since it was last saved in the field.
+    Images can be downloaded ahead of time by an ImageFetcher.
     """
     # TODO: refactor and merge program image download to use the same code as course image download
     try:
-        if is_google_drive_url(image_url):
-            content_type, content = get_file_from_drive_link(image_url)
-            extension = IMAGE_TYPES.get(content_type)
-        else:
-            response = requests.get(image_url, headers=headers)  # pylint: disable=missing-timeout
+        field_file = program.card_image if data_field == 'image' else getattr(program, data_field, None)
+        image = _get_image(program, data_field, field_file, image_url, headers, image_fetcher)
+        if image is None:
+            logger.info('Image for program [%s] from [%s] is unchanged and will not be saved again.', program.title,
+                        image_url)
+            return True
+
+        if image.status_code != requests.codes.ok:  # pylint: disable=no-member
+            msg = 'Failed to download image for program [%s] from [%s]! Response was [%d]:\n%s'
+            logger.error(msg, program.title, image_url, image.status_code, image.content)
+            return False
 
-            if response.status_code == requests.codes.ok:  # pylint: disable=no-member
-                content_type = response.headers['Content-Type'].lower()
-                extension = IMAGE_TYPES.get(content_type)
-                content = response.content
-            else:
-                msg = 'Failed to download image for program [%s] from [%s]! Response was [%d]:\n%s'
-                logger.error(msg, program.title, image_url, response.status_code, response.content)
-                return False
+        content_type, content = image.content_type, image.content
+        extension = IMAGE_TYPES.get(content_type)
 
         if extension:
             filename = '{uuid}.{extension}'.format(uuid=str(program.uuid), extension=extension)
@@ -835,6 +980,8 @@ def download_and_save_program_image(program, image_url, data_field='image', head
                 program.card_image.save(filename, ContentFile(content))
             elif data_field == 'organization_logo_override':
                 program.organization_logo_override.save(filename, ContentFile(content))
+            if field_file is not None:
+                _record_saved_image(program, data_field, field_file, image)
             logger.info('Image for program [%s] successfully updated.', program.title)
             return True
         else:
@@ -1,24 +1,59 @@
+import concurrent.futures
 import datetime
 import logging
+import math
 import time
 from collections import namedtuple
 
 from django.conf import settings
 from django.core.management import CommandError
+from django.db import connection
 from django_elasticsearch_dsl.management.commands.search_index import Command as DjangoESDSLCommand
 from django_elasticsearch_dsl.registries import registry
+from elasticsearch.helpers import bulk, scan
 from elasticsearch_dsl import Mapping
-from elasticsearch_dsl.connections import get_connection
+from elasticsearch_dsl.connections import connections, get_connection
 
-from course_discovery.apps.core.utils import ElasticsearchUtils
+from course_discovery.apps.core.utils import ElasticsearchUtils, parse_since
 
 OLD_AND_NEW_INDEX_NAMES = slice(2, 4)
+# Number of pk range shards created per worker process, so that a slow shard does not hold up the whole build.
+SHARDS_PER_PROCESS = 4
 
 AliasMapper = namedtuple('AliasMapper',
                          'document registered_index new_index_name alias record_count')
 logger = logging.getLogger(__name__)
 
 
+def populate_shard(document, index_name, min_pk, max_pk, parallel=False, refresh=None):
+    """
+    Index the objects of a document whose pks are within [min_pk, max_pk] into the given index.
+
+    Runs in a worker process. Like `execute_parallel_loader` in `refresh_course_metadata`, the database
+    and Elasticsearch connections copied from the parent process are dropped, so that this process opens its own.
+
+    Returns:
+        (tuple): Number of objects indexed and the number of seconds it took.
+    """
+    connection.close()
+    connections.create_connection(**settings.ELASTICSEARCH_DSL['default'])
+    document._index._name = index_name  # pylint: disable=protected-access
+
+    start = time.time()
+    doc = document()
+    queryset = doc.get_queryset().filter(pk__gte=min_pk, pk__lte=max_pk)
+    indexed_count = 0
+
+    def count_indexed(objects):
+        nonlocal indexed_count
+        for obj in objects:
+            indexed_count += 1
+            yield obj
+
+    doc.update(count_indexed(doc.iterate_for_indexing(queryset)), parallel=parallel, refresh=refresh)
+    return indexed_count, time.time() - start
+
+
 class Command(DjangoESDSLCommand):
     help = 'Manage elasticsearch index.'
     backends = []
@@ -44,6 +79,14 @@ class Command(DjangoESDSLCommand):
             help='Run populate/rebuild update single threaded'
         )
         parser.set_defaults(parallel=getattr(settings, 'ELASTICSEARCH_DSL_PARALLEL', False))
+        parser.add_argument(
+            '--processes',
+            type=int,
+            dest='processes',
+            default=getattr(settings, 'ELASTICSEARCH_DSL_POPULATE_PROCESSES', 1),
+            help='Number of worker processes used to populate new indices. Each document is split into pk '
+                 'ranges that are prepared and indexed by the workers concurrently.'
+        )
         parser.add_argument(
             '--refresh',
             action='store_true',
@@ -62,6 +105,20 @@ class Command(DjangoESDSLCommand):
             '--disable-change-limit', action='store_true', dest='disable_change_limit',
             help='Disables checks limiting the number of records modified.'
         )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            dest='incremental',
+            help='Update the live indices in place with the objects changed recently, instead of rebuilding them. '
+                 'Objects that no longer exist are removed from the indices.'
+        )
+        parser.add_argument(
+            '--since',
+            dest='since',
+            default=None,
+            help='ISO 8601 datetime (UTC unless an offset is given). Implies --incremental and only updates '
+                 'the objects changed since then. Defaults to one day ago.'
+        )
         parser.add_argument(
             '-u',
             '--using',
@@ -84,7 +141,11 @@ class Command(DjangoESDSLCommand):
 
         self.backends = (specified_backend,) if specified_backend else supported_backends
         models = self._get_models(options['models'])
-        self._update(models, options)
+        if options.get('incremental') or options.get('since'):
+            options['since'] = parse_since(options.get('since'))
+            self._incremental_update(models, options)
+        else:
+            self._update(models, options)
 
     def _update(self, models, options):
         """
@@ -107,7 +168,10 @@ class Command(DjangoESDSLCommand):
         conn = get_connection()
         while indexes_pending and run_attempts < 1:  # Only try once, as retries gave buggy results. See VAN-391
             run_attempts += 1
-            self._populate(models, options)
+            if options.get('processes', 1) > 1:
+                self._populate_sharded(alias_mappings, options)
+            else:
+                self._populate(models, options)
             for doc, __, new_index_name, alias, record_count in alias_mappings:
                 # Run a sanity check to ensure we aren't drastically changing the
                 # index, which could be indicative of a bug.
@@ -132,6 +196,133 @@ class Command(DjangoESDSLCommand):
 
         return True
 
+    def _populate(self, models, options):
+        """
+        Populate the new indices of the given models.
+
+        Unlike the parent command, a single document instance both iterates over the objects and prepares
+        them, so that the related data its `prepare_chunk` loads in bulk is read while preparing.
+        """
+        parallel = options['parallel']
+        for document in registry.get_documents(models):
+            doc = document()
+            self.stdout.write("Indexing {} '{}' objects {}".format(
+                doc.get_queryset().count() if options['count'] else "all",
+                document.django.model.__name__,
+                "(parallel)" if parallel else "")
+            )
+            doc.update(doc.get_indexing_queryset(), parallel=parallel, refresh=options['refresh'])
+
+    def _populate_sharded(self, alias_mappings, options):
+        """
+        Populate the new indices using a pool of worker processes, one pk range shard at a time.
+        """
+        processes = options['processes']
+        with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+            for mapping in alias_mappings:
+                model_name = mapping.document.django.model.__name__
+                shards = self.get_pk_shards(mapping.document, processes * SHARDS_PER_PROCESS)
+                self.stdout.write("Indexing '{}' objects in {} shards with {} processes".format(
+                    model_name, len(shards), processes
+                ))
+
+                start = time.time()
+                futures = {
+                    executor.submit(
+                        populate_shard, mapping.document, mapping.new_index_name, min_pk, max_pk,
+                        options['parallel'], options['refresh'],
+                    ): (min_pk, max_pk)
+                    for min_pk, max_pk in shards
+                }
+                total_count = 0
+                for completed, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                    min_pk, max_pk = futures[future]
+                    count, elapsed = future.result()
+                    total_count += count
+                    logger.info(
+                        'Indexed shard %d/%d of %s (pks %s-%s): %d objects in %.1fs (%.1f objects/s)',
+                        completed, len(shards), model_name, min_pk, max_pk, count, elapsed,
+                        count / elapsed if elapsed else 0,
+                    )
+
+                elapsed = time.time() - start
+                logger.info(
+                    'Indexed %d %s objects in %.1fs (%.1f objects/s)',
+                    total_count, model_name, elapsed, total_count / elapsed if elapsed else 0,
+                )
+
+    @staticmethod
+    def get_pk_shards(document, shard_count):
+        """
+        Split the pks of the objects of a document into at most `shard_count` contiguous ranges of similar size.
+
+        Returns:
+            (list): (min_pk, max_pk) tuples, inclusive.
+        """
+        pks = list(document().get_queryset().order_by('pk').values_list('pk', flat=True).distinct())
+        if not pks:
+            return []
+
+        shard_size = math.ceil(len(pks) / shard_count)
+        return [
+            (pks[start], pks[min(start + shard_size, len(pks)) - 1])
+            for start in range(0, len(pks), shard_size)
+        ]
+
+    def _incremental_update(self, models, options):
+        """
+        Update the live indices in place.
+
+        Objects changed since the given datetime are re-indexed and documents of objects that are no
+        longer indexed are deleted. Mapping changes still require a full update.
+        """
+        since = options['since']
+        conn = get_connection()
+        for document in registry.get_documents(models):
+            doc = document()
+            # pylint: disable=protected-access
+            alias = document._index._name
+            model_name = document.django.model.__name__
+
+            changed_count = doc.get_incremental_queryset(since).count()
+            self.stdout.write("Indexing {} '{}' objects changed since {}".format(changed_count, model_name, since))
+            if changed_count:
+                doc.update(
+                    doc.get_incremental_indexing_queryset(since),
+                    parallel=options['parallel'],
+                    refresh=options['refresh'],
+                )
+
+            stale_ids = self.get_stale_document_ids(conn, doc, alias)
+            if stale_ids and not options.get('disable_change_limit', False):
+                record_count = self.get_record_count(document)
+                if self.percentage_change(record_count - len(stale_ids), record_count) >= \
+                        settings.INDEX_SIZE_CHANGE_THRESHOLD:
+                    raise CommandError(
+                        'Sanity check failed for index [{}]: refusing to delete [{}] of its [{}] records.'.format(
+                            alias, len(stale_ids), record_count
+                        )
+                    )
+
+            self.stdout.write("Deleting {} stale '{}' documents".format(len(stale_ids), model_name))
+            if stale_ids:
+                actions = ({'_op_type': 'delete', '_index': alias, '_id': _id} for _id in stale_ids)
+                bulk(conn, actions, refresh=options['refresh'] or False, raise_on_error=False, ignore_status=404)
+
+        return True
+
+    @staticmethod
+    def get_stale_document_ids(conn, doc, alias):
+        """ Return the ids of the documents in the index whose objects are no longer indexed. """
+        indexed_ids = {
+            hit['_id'] for hit in scan(conn, index=alias, query={'query': {'match_all': {}}}, _source=False)
+        }
+        if not indexed_ids:
+            return set()
+
+        current_ids = {str(pk) for pk in doc.get_queryset().values_list('pk', flat=True)}
+        return indexed_ids - current_ids
+
     @staticmethod
     def percentage_change(current, previous):
         if current == previous:
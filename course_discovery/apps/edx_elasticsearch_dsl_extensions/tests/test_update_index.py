@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
@@ -7,8 +8,11 @@ from django.test import TestCase, override_settings
 from freezegun import freeze_time
 
 from course_discovery.apps.core.tests.mixins import ElasticsearchTestMixin
+from course_discovery.apps.course_metadata.search_indexes.documents import PersonDocument
 from course_discovery.apps.course_metadata.tests.factories import CourseRunFactory, PersonFactory, ProgramFactory
+from course_discovery.apps.edx_elasticsearch_dsl_extensions.management.commands.update_index import Command
 from course_discovery.apps.edx_elasticsearch_dsl_extensions.tests.mixins import SearchIndexTestMixin
+from course_discovery.apps.taxonomy_support.utils import get_whitelisted_skills_in_bulk
 
 
 @override_settings(ELASTICSEARCH_DSL_SIGNAL_PROCESSOR='django_elasticsearch_dsl.signals.BaseSignalProcessor')
@@ -65,3 +69,75 @@ class UpdateIndexTests(ElasticsearchTestMixin, SearchIndexTestMixin, TestCase):
                         'update_index.Command.sanity_check_new_index') as mock_sanity_check_new_index:
             call_command('update_index', disable_change_limit=True)
             assert not mock_sanity_check_new_index.called
+
+    @freeze_time('2016-06-21')
+    def test_processes(self):
+        """ Verify new indices can be populated by a pool of workers, one pk range shard at a time. """
+        people = PersonFactory.create_batch(5)
+
+        # Threads share the in-memory test database, which worker processes cannot see.
+        with mock.patch('course_discovery.apps.edx_elasticsearch_dsl_extensions.management.commands.'
+                        'update_index.concurrent.futures.ProcessPoolExecutor', ThreadPoolExecutor):
+            call_command('update_index', models=['course_metadata.Person'], processes=2, refresh=True,
+                         disable_change_limit=True)
+
+        response = self.conn.search(index='person_20160621_000000')
+        assert {hit['_id'] for hit in response['hits']['hits']} == {str(person.pk) for person in people}
+
+    def test_populate_loads_skills_in_bulk(self):
+        """ Verify the skills of the indexed products are loaded once per chunk, not once per object. """
+        ProgramFactory.create_batch(3)
+
+        with mock.patch('course_discovery.apps.taxonomy_support.utils.get_whitelisted_skills_in_bulk',
+                        wraps=get_whitelisted_skills_in_bulk) as mock_get_skills:
+            call_command('update_index', models=['course_metadata.Program'], disable_change_limit=True)
+
+        assert mock_get_skills.call_count == 1
+
+    def test_get_pk_shards(self):
+        """ Verify the objects of a document are split into contiguous pk ranges of similar size. """
+        people = PersonFactory.create_batch(5)
+        pks = sorted(person.pk for person in people)
+
+        shards = Command.get_pk_shards(PersonDocument, 2)
+
+        assert shards == [(pks[0], pks[2]), (pks[3], pks[4])]
+        assert Command.get_pk_shards(PersonDocument, 10) == [(pk, pk) for pk in pks]
+
+    def test_incremental(self):
+        """ Verify incremental updates index changed objects in place and delete stale documents. """
+        with freeze_time('2016-06-21'):
+            stale_person, person = PersonFactory.create_batch(2)
+            call_command('update_index', disable_change_limit=True)
+
+        new_person = PersonFactory()
+        stale_person_id = stale_person.pk
+        stale_person.delete()
+
+        with mock.patch('course_discovery.apps.edx_elasticsearch_dsl_extensions.management.commands.'
+                        'update_index.Command._update') as mock_update:
+            call_command('update_index', models=['course_metadata.Person'], since='2016-06-22', refresh=True,
+                         disable_change_limit=True)
+            assert not mock_update.called
+
+        alias = settings.ELASTICSEARCH_INDEX_NAMES[
+            'course_discovery.apps.course_metadata.search_indexes.documents.person'
+        ]
+        indexed_ids = {hit['_id'] for hit in self.conn.search(index=alias)['hits']['hits']}
+        assert indexed_ids == {str(person.pk), str(new_person.pk)}
+        assert str(stale_person_id) not in indexed_ids
+
+    def test_incremental_sanity_check_error(self):
+        """ Verify incremental updates refuse to delete a large share of an index. """
+        with freeze_time('2016-06-21'):
+            people = PersonFactory.create_batch(2)
+            call_command('update_index', disable_change_limit=True)
+
+        people[0].delete()
+        with pytest.raises(CommandError):
+            call_command('update_index', models=['course_metadata.Person'], incremental=True)
+
+    def test_invalid_since(self):
+        """ Verify an unparsable --since datetime is rejected. """
+        with pytest.raises(CommandError):
+            call_command('update_index', since='yesterday')
@@ -27,6 +27,17 @@ class AbstractModelMeta(ABCMeta, type(models.Model)):
     pass
 
 
+def get_course_skills(course_key, product_skills=None):
+    """
+    Return the serialized whitelisted skills of a course.
+
+    Skills are read from `product_skills` (a `ProductSkills` memo of course skills) when it is given.
+    """
+    if product_skills is not None:
+        return product_skills.get_serialized_skills(course_key)
+    return get_whitelisted_serialized_skills(course_key, product_type=ProductTypes.Course)
+
+
 class LearnerPathwayNode(models.Model, metaclass=AbstractModelMeta):
     """
     Abstract model for learner pathway related models.
@@ -44,9 +55,11 @@ class LearnerPathwayNode(models.Model, metaclass=AbstractModelMeta):
         """
 
     @abstractmethod
-    def get_skills(self) -> [str]:
+    def get_skills(self, product_skills=None) -> [str]:
         """
         Subclasses must implement this method to calculate and return the list of aggregated skills.
+
+        `product_skills` is an optional `ProductSkills` memo of course skills to read the skills from.
         """
 
     @classmethod
@@ -134,9 +147,15 @@ class LearnerPathway(TimeStampedModel):
         """
         Return the list of aggregated skills.
         """
+        return self.get_skills()
+
+    def get_skills(self, product_skills=None) -> [str]:
+        """
+        Return the list of aggregated skills, optionally read from a `ProductSkills` memo of course skills.
+        """
         skills = []
         for step in self.steps.all():
-            step_skills = step.get_skills()
+            step_skills = step.get_skills(product_skills=product_skills)
             for step_skill in step_skills:
                 if step_skill not in skills:
                     skills.append(step_skill)
@@ -204,11 +223,11 @@ class LearnerPathwayStep(models.Model):
             sum(estimated_completion_times_of_nodes[-self.min_requirement:]),
         )
 
-    def get_skills(self):
+    def get_skills(self, product_skills=None):
         already_added_skills = set()
         skills_aggregated = []
         for node in self.get_nodes():
-            skills = node.get_skills()
+            skills = node.get_skills(product_skills=product_skills)
             for skill in skills:
                 if skill['name'] not in already_added_skills:
                     skills_aggregated.append(skill)
@@ -247,11 +266,11 @@ class LearnerPathwayCourse(LearnerPathwayNode):
         """
         return get_advertised_course_run_estimated_hours(self.course) or 0
 
-    def get_skills(self) -> [str]:
+    def get_skills(self, product_skills=None) -> [str]:
         """
         Return list of dicts where each dict contain skill name and skill description.
         """
-        return get_whitelisted_serialized_skills(self.course.key, product_type=ProductTypes.Course)
+        return get_course_skills(self.course.key, product_skills)
 
     def __str__(self):
         """
@@ -289,13 +308,13 @@ class LearnerPathwayProgram(LearnerPathwayNode):
 
         return program_estimated_time_of_completion
 
-    def get_skills(self) -> [str]:
+    def get_skills(self, product_skills=None) -> [str]:
         """
         Return list of dicts where each dict contain skill name and skill description.
         """
         program_skills = []
         for program_course in self.program.courses.all():
-            program_skills += get_whitelisted_serialized_skills(program_course.key, product_type=ProductTypes.Course)
+            program_skills += get_course_skills(program_course.key, product_skills)
 
         return program_skills
 
@@ -337,11 +356,11 @@ class LearnerPathwayBlock(LearnerPathwayNode):
         """
         return 0
 
-    def get_skills(self) -> [str]:
+    def get_skills(self, product_skills=None) -> [str]:
         """
         Return list of dicts where each dict contain skill name and skill description.
         """
-        return get_whitelisted_serialized_skills(self.course.key, product_type=ProductTypes.Course)
+        return get_course_skills(self.course.key, product_skills)
 
     def __str__(self):
         """
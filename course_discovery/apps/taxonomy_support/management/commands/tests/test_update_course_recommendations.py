@@ -1,7 +1,9 @@
 import ddt
 import pytest
 from django.core.management import CommandError, call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from course_discovery.apps.course_metadata.tests.factories import (
     CourseFactory, CourseSkillsFactory, SkillFactory, SubjectFactory
@@ -82,3 +84,46 @@ class UpdateCourseRecommendationsCommandTests(TestCase):
             call_command('update_course_recommendations', '-uuids', self.course1.uuid)
         course_recommendations_count = CourseRecommendation.objects.all().count()
         self.assertEqual(course_recommendations_count, 1)
+
+    def test_recommendation_ratios(self):
+        """ Verify that recommendations store the number and ratio of the skills and subjects shared by courses. """
+        call_command('update_course_recommendations', '--all')
+        recommendation = CourseRecommendation.objects.get(course=self.course1, recommended_course=self.course2)
+
+        assert recommendation.skills_intersection_length == 2
+        assert recommendation.skills_intersection_ratio == 2 / 3
+        assert recommendation.subjects_intersection_length == 0
+        assert recommendation.subjects_intersection_ratio == 0
+
+    def test_draft_courses_not_recommended(self):
+        """ Verify that draft courses sharing subjects with courses are left out of their recommendations. """
+        CourseFactory(subjects=self.course1.subjects.all(), draft=True)
+
+        call_command('update_course_recommendations', '--all')
+
+        assert CourseRecommendation.objects.filter(course=self.course1).count() == 1
+        assert not CourseRecommendation.objects.filter(recommended_course__draft=True).exists()
+
+    def test_recommendations_replaced(self):
+        """ Verify that the previous recommendations of updated courses are replaced. """
+        call_command('update_course_recommendations', '--all')
+        call_command('update_course_recommendations', '--all')
+
+        assert CourseRecommendation.objects.filter(course=self.course1).count() == 1
+        assert CourseRecommendation.objects.filter(course=self.course2).count() == 1
+
+    def test_query_count_independent_of_course_count(self):
+        """ Verify that the skills and subjects of courses are loaded once, whatever the number of courses. """
+        call_command('update_course_recommendations', '--all')
+        with CaptureQueriesContext(connection) as queries:
+            call_command('update_course_recommendations', '--all')
+        query_count = len(queries)
+
+        subject = self.course1.subjects.first()
+        for course in CourseFactory.create_batch(5, subjects=[subject], draft=False):
+            CourseSkillsFactory(course_key=course.key, skill=SkillFactory())
+        with CaptureQueriesContext(connection) as queries:
+            call_command('update_course_recommendations', '--all')
+
+        assert len(queries) == query_count
+        assert CourseRecommendation.objects.filter(course=self.course1).count() == 6
@@ -1,5 +1,6 @@
 import datetime
 import logging
+from collections import Counter, defaultdict
 
 from django.core.management import BaseCommand, CommandError
 from django.db.models import Q
@@ -13,6 +14,90 @@ from course_discovery.apps.taxonomy_support.models import CourseRecommendation,
 logger = logging.getLogger(__name__)
 
 RECOMMENDATION_OBJECTS_CHUNK_SIZE = 10000
+RECOMMENDED_COURSES_CHUNK_SIZE = 1000
+
+
+class CourseSimilarityIndex:
+    """
+    Skills and subjects of every course, loaded once and indexed by skill and subject.
+
+    Courses are only compared with the courses sharing at least one skill or subject with them, whose number of
+    shared skills and subjects is counted from the index.
+    """
+
+    def __init__(self):
+        self.course_uuids = dict(Course.objects.values_list('id', 'uuid'))
+        course_ids_by_key = defaultdict(list)
+        for course_id, key in Course.objects.values_list('id', 'key'):
+            course_ids_by_key[key].append(course_id)
+
+        self.course_skills = defaultdict(set)
+        for course_key, skill_name in CourseSkills.objects.values_list('course_key', 'skill__name'):
+            for course_id in course_ids_by_key.get(course_key, ()):
+                self.course_skills[course_id].add(skill_name)
+
+        self.course_subjects = defaultdict(set)
+        # Draft courses are not recommended, like they are not loaded above.
+        course_subjects = Course.subjects.through.objects.filter(course__draft=False)
+        for course_id, subject_id in course_subjects.values_list('course_id', 'subject_id'):
+            self.course_subjects[course_id].add(subject_id)
+
+        self.skill_courses = self.build_inverted_index(self.course_skills)
+        self.subject_courses = self.build_inverted_index(self.course_subjects)
+
+    @staticmethod
+    def build_inverted_index(course_terms):
+        term_courses = defaultdict(list)
+        for course_id, terms in course_terms.items():
+            for term in terms:
+                term_courses[term].append(course_id)
+        return term_courses
+
+    @staticmethod
+    def count_shared_terms(terms, term_courses):
+        """ Returns the number of the given terms each course has. """
+        counts = Counter()
+        for term in terms:
+            counts.update(term_courses[term])
+        return counts
+
+    @staticmethod
+    def get_jaccard_index(intersection_length, length, candidate_length):
+        union_length = length + candidate_length - intersection_length
+        return intersection_length / union_length if union_length != 0 else 0
+
+    def get_course_recommendations(self, course_id):
+        """
+        Returns the unsaved recommendations of a course, or None if the course has no skills and no subjects.
+        """
+        course_skills = self.course_skills.get(course_id, set())
+        course_subjects = self.course_subjects.get(course_id, set())
+        if not course_skills and not course_subjects:
+            return None
+
+        skills_intersection_lengths = self.count_shared_terms(course_skills, self.skill_courses)
+        subjects_intersection_lengths = self.count_shared_terms(course_subjects, self.subject_courses)
+        course_uuid = self.course_uuids[course_id]
+        recommendation_objects = []
+        for candidate_id in skills_intersection_lengths.keys() | subjects_intersection_lengths.keys():
+            if self.course_uuids[candidate_id] == course_uuid:
+                continue
+            skills_intersection_length = skills_intersection_lengths[candidate_id]
+            subjects_intersection_length = subjects_intersection_lengths[candidate_id]
+            recommendation_objects.append(CourseRecommendation(
+                course_id=course_id,
+                recommended_course_id=candidate_id,
+                skills_intersection_ratio=self.get_jaccard_index(
+                    skills_intersection_length, len(course_skills), len(self.course_skills.get(candidate_id, ())),
+                ),
+                skills_intersection_length=skills_intersection_length,
+                subjects_intersection_ratio=self.get_jaccard_index(
+                    subjects_intersection_length, len(course_subjects),
+                    len(self.course_subjects.get(candidate_id, ())),
+                ),
+                subjects_intersection_length=subjects_intersection_length,
+            ))
+        return recommendation_objects
 
 
 class Command(BaseCommand):
@@ -46,51 +131,14 @@ class Command(BaseCommand):
         config = UpdateCourseRecommendationsConfig.get_solo()
         return {'all': config.all_courses, 'uuids': config.uuids.split(), 'num_past_days': config.num_past_days}
 
-    def get_course_recommendations(self, course, all_courses):
-        """ Adds recommendations for a course. """
-        course_skills = set(list(
-            CourseSkills.objects.filter(course_key=course.key).values_list('skill__name', flat=True)
-        ))
-        course_subjects = set(list(course.subjects.all()))
-        course_skills_count = len(course_skills)
-        course_subjects_count = len(course_subjects)
-        if course_skills_count == 0 and course_subjects_count == 0:
-            return [], False
-        recommendation_objects = []
-        for course_candidate in all_courses:
-            if course.uuid == course_candidate.uuid:
-                continue
-            course_candidate_skills = set(list(
-                CourseSkills.objects.filter(course_key=course_candidate.key).values_list('skill__name', flat=True)
-            ))
-            skills_intersection = course_skills.intersection(course_candidate_skills)
-            skills_intersection_length = len(skills_intersection)
-            skills_union = course_skills.union(course_candidate_skills)
-            skills_union_length = len(skills_union)
-            skills_intersection_ratio = skills_intersection_length / skills_union_length \
-                if skills_union_length != 0 else 0
-            course_candidate_subjects = set(list(course_candidate.subjects.all()))
-            subjects_intersection = course_subjects.intersection(course_candidate_subjects)
-            subjects_intersection_length = len(subjects_intersection)
-            subjects_union = course_subjects.union(course_candidate_subjects)
-            subjects_union_length = len(subjects_union)
-            subjects_intersection_ratio = subjects_intersection_length / subjects_union_length \
-                if subjects_union_length != 0 else 0
-            if skills_intersection_length > 0 or subjects_intersection_length > 0:
-                obj = CourseRecommendation(
-                    course=course,
-                    recommended_course=course_candidate,
-                    skills_intersection_ratio=skills_intersection_ratio,
-                    skills_intersection_length=skills_intersection_length,
-                    subjects_intersection_ratio=subjects_intersection_ratio,
-                    subjects_intersection_length=subjects_intersection_length
-                )
-                recommendation_objects.append(obj)
-        return recommendation_objects, True
+    def save_recommendations(self, course_ids, recommendation_objects):
+        """ Replaces the recommendations of the given courses. """
+        CourseRecommendation.objects.filter(course_id__in=course_ids).delete()
+        CourseRecommendation.objects.bulk_create(recommendation_objects, batch_size=1000)
 
     def add_recommendations(self, **kwargs):
         """ Adds recommendations for courses. """
-        all_courses = Course.objects.all().prefetch_related('subjects')
+        all_courses = Course.objects.all()
         if kwargs['uuids']:
             courses = Course.objects.filter(uuid__in=kwargs['uuids']).all()
         elif kwargs['all']:
@@ -106,19 +154,23 @@ class Command(BaseCommand):
                 course_count=courses.count()
             )
         )
+        similarity_index = CourseSimilarityIndex()
         failures = set()
+        recommended_course_ids = []
         recommendation_object_chunks = []
-        for course in courses:
-            recommendation_objects, success = self.get_course_recommendations(course, all_courses)
-            if success:
+        for course in courses.only('id', 'uuid', 'key'):
+            recommendation_objects = similarity_index.get_course_recommendations(course.id)
+            if recommendation_objects is not None:
+                recommended_course_ids.append(course.id)
                 recommendation_object_chunks.extend(recommendation_objects)
-                CourseRecommendation.objects.filter(course=course).delete()
             else:
                 failures.add(course)
-            if len(recommendation_object_chunks) > RECOMMENDATION_OBJECTS_CHUNK_SIZE:
-                CourseRecommendation.objects.bulk_create(recommendation_object_chunks, batch_size=1000)
+            if (len(recommendation_object_chunks) > RECOMMENDATION_OBJECTS_CHUNK_SIZE or
+                    len(recommended_course_ids) >= RECOMMENDED_COURSES_CHUNK_SIZE):
+                self.save_recommendations(recommended_course_ids, recommendation_object_chunks)
+                recommended_course_ids.clear()
                 recommendation_object_chunks.clear()
-        CourseRecommendation.objects.bulk_create(recommendation_object_chunks, batch_size=1000)
+        self.save_recommendations(recommended_course_ids, recommendation_object_chunks)
         if failures:
             keys = sorted(f'{failure.key} ({failure.id})' for failure in failures)
             logger.warning(
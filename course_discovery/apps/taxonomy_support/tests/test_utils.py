@@ -0,0 +1,62 @@
+"""
+Tests for the bulk product skills helpers.
+"""
+from django.test import TestCase
+from taxonomy.choices import ProductTypes
+from taxonomy.utils import get_whitelisted_serialized_skills
+
+from course_discovery.apps.course_metadata.tests.factories import CourseSkillsFactory, ProgramSkillFactory
+from course_discovery.apps.taxonomy_support.utils import ProductSkills, get_whitelisted_skills_in_bulk
+
+
+class GetWhitelistedSkillsInBulkTests(TestCase):
+    def test_course_skills(self):
+        """ Verify whitelisted skills of several courses are returned with a single query. """
+        first_skill = CourseSkillsFactory(course_key='edX+First')
+        second_skill = CourseSkillsFactory(course_key='edX+Second')
+        CourseSkillsFactory(course_key='edX+Second', is_blacklisted=True)
+
+        with self.assertNumQueries(1):
+            skills = get_whitelisted_skills_in_bulk(['edX+First', 'edX+Second', 'edX+Third'])
+
+        assert skills == {
+            'edX+First': [first_skill.skill],
+            'edX+Second': [second_skill.skill],
+            'edX+Third': [],
+        }
+
+    def test_program_skills(self):
+        """ Verify program skills are looked up by uuid and keyed by its string form. """
+        program_skill = ProgramSkillFactory()
+
+        skills = get_whitelisted_skills_in_bulk([program_skill.program_uuid], product_type=ProductTypes.Program)
+
+        assert skills == {str(program_skill.program_uuid): [program_skill.skill]}
+
+
+class ProductSkillsTests(TestCase):
+    def test_load_once(self):
+        """ Verify skills loaded in bulk are served from memory afterwards. """
+        course_skill = CourseSkillsFactory(course_key='edX+First')
+        CourseSkillsFactory(course_key='edX+Second')
+        product_skills = ProductSkills()
+
+        with self.assertNumQueries(1):
+            product_skills.load(['edX+First', 'edX+Second'])
+            product_skills.load(['edX+First'])
+
+        with self.assertNumQueries(0):
+            skill_names = product_skills.get_skill_names('edX+First')
+            serialized_skills = product_skills.get_serialized_skills('edX+First')
+
+        assert skill_names == [course_skill.skill.name]
+        assert serialized_skills == get_whitelisted_serialized_skills('edX+First')
+
+    def test_get_skills_not_loaded(self):
+        """ Verify skills of a product that was not loaded are looked up on demand. """
+        course_skill = CourseSkillsFactory(course_key='edX+First')
+        product_skills = ProductSkills()
+
+        assert not product_skills.is_loaded('edX+First')
+        assert product_skills.get_skills('edX+First') == [course_skill.skill]
+        assert product_skills.is_loaded('edX+First')
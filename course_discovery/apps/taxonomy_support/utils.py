@@ -0,0 +1,73 @@
+"""
+Helpers for reading product skills from the taxonomy app in bulk.
+
+taxonomy-connector only exposes per-product lookups (`get_whitelisted_product_skills` and
+`get_whitelisted_serialized_skills`), which cost one query for every course or program serialized or indexed.
+"""
+from collections import defaultdict
+
+from taxonomy.choices import ProductTypes
+from taxonomy.serializers import SkillSerializer
+from taxonomy.utils import get_product_skill_model_and_identifier
+
+SKILLS_QUERY_CHUNK_SIZE = 500
+
+
+def get_whitelisted_skills_in_bulk(keys_or_uuids, product_type=ProductTypes.Course):
+    """
+    Get the whitelisted skills of several products of the same type.
+
+    Arguments:
+        keys_or_uuids (iterable): Keys (courses) or uuids (programs) of the products whose skills need to be returned.
+        product_type (str): String indicating about the product type.
+
+    Returns:
+        (dict): Mapping of the string form of each key or uuid to the list of its whitelisted `Skill` objects.
+    """
+    skill_model, identifier = get_product_skill_model_and_identifier(product_type)
+    keys_or_uuids = list({str(key_or_uuid) for key_or_uuid in keys_or_uuids})
+    skills = defaultdict(list)
+
+    for start in range(0, len(keys_or_uuids), SKILLS_QUERY_CHUNK_SIZE):
+        product_skills = skill_model.objects.filter(
+            **{'{}__in'.format(identifier): keys_or_uuids[start:start + SKILLS_QUERY_CHUNK_SIZE]},
+            is_blacklisted=False,
+        ).select_related('skill__category', 'skill__subcategory__category').order_by('id')
+        for product_skill in product_skills:
+            skills[str(getattr(product_skill, identifier))].append(product_skill.skill)
+
+    return {key_or_uuid: skills[key_or_uuid] for key_or_uuid in keys_or_uuids}
+
+
+class ProductSkills:
+    """
+    Memo of the whitelisted skills of products of one type.
+
+    Skills are loaded in bulk by `load` and kept for the lifetime of the instance, which should
+    be scoped to a single request or indexing run.
+    """
+
+    def __init__(self, product_type=ProductTypes.Course):
+        self.product_type = product_type
+        self._skills = {}
+
+    def load(self, keys_or_uuids):
+        """
+        Load the skills of all given products that have not been loaded yet, in as few queries as possible.
+        """
+        missing = {str(key_or_uuid) for key_or_uuid in keys_or_uuids} - self._skills.keys()
+        if missing:
+            self._skills.update(get_whitelisted_skills_in_bulk(missing, self.product_type))
+
+    def is_loaded(self, key_or_uuid):
+        return str(key_or_uuid) in self._skills
+
+    def get_skills(self, key_or_uuid):
+        self.load([key_or_uuid])
+        return self._skills[str(key_or_uuid)]
+
+    def get_skill_names(self, key_or_uuid):
+        return list({skill.name for skill in self.get_skills(key_or_uuid)})
+
+    def get_serialized_skills(self, key_or_uuid):
+        return SkillSerializer(self.get_skills(key_or_uuid), many=True).data
@@ -429,6 +429,16 @@ REST_FRAMEWORK_EXTENSIONS = {
     'DEFAULT_OBJECT_CACHE_KEY_FUNC': 'course_discovery.apps.api.cache.timestamped_object_key_constructor',
 }
 
+# Seconds a worker may spend rendering a cached API response while other workers missing the same
+# cache key wait for it instead of rendering it again. Set to 0 to let every worker render on a miss.
+API_CACHE_LOCK_TIMEOUT = 60
+# Seconds after the API cache is invalidated during which workers waiting on another worker's render
+# are served the previously rendered response instead. Set to 0 to always wait for fresh responses.
+API_CACHE_STALE_WHILE_REVALIDATE_SECONDS = 0
+# Codec compressing the API responses stored in the cache, see course_discovery.apps.api.cache.GzipCacheCodec.
+API_CACHE_CODEC = 'course_discovery.apps.api.cache.GzipCacheCodec'
+API_CACHE_CODEC_OPTIONS = {'level': 6}
+
 # NOTE (CCB): JWT_SECRET_KEY is intentionally not set here to avoid production releases with a public value.
 # Set a value in a downstream settings file.
 JWT_AUTH = {
@@ -462,6 +472,10 @@ SYNONYMS_MODULE = 'course_discovery.settings.synonyms'
 # Thus set the 'chunk_size'
 ELASTICSEARCH_DSL_QUERYSET_PAGINATION = 10000
 
+# Number of objects whose related data is bulk-loaded together before their documents are prepared.
+# See BaseDocument.prepare_chunk.
+ELASTICSEARCH_DSL_PREPARE_CHUNK_SIZE = 500
+
 # Defining default pagination for all requests to ElasticSearch,
 # whose parameters 'size' and 'from' are not explicitly set.
 ELASTICSEARCH_DSL_LOAD_PER_QUERY = 10000
@@ -709,6 +723,11 @@ DEFAULT_PRODUCT_SOURCE_SLUG = ''
 CONTENTFUL_SPACE_ID = None
 CONTENTFUL_CONTENT_DELIVERY_API_KEY = None
 CONTENTFUL_ENVIRONMENT = None
+# Directory where the data transformed from Contentful is kept, to be shared by all the processes of a host.
+# When None, every process fetches the data, see get_data_from_contentful.
+CONTENTFUL_SNAPSHOT_DIR = None
+# Number of seconds a snapshot of Contentful data is used before checking Contentful for changes.
+CONTENTFUL_SNAPSHOT_SYNC_INTERVAL = 60 * 5
 LMS_API_URLS = {
     'api_access_request': 'api-admin/api/v1/api_access_request/',
     'blocks': 'api/courses/v1/blocks/',
@@ -725,6 +744,15 @@ CSV_LOADER_TYPE_SOURCE_REQUIRED_FIELDS = {
 
 EVENT_BUS_PROCESSING_DELAY_SECONDS = 60
 EVENT_BUS_MESSAGE_DELAY_THRESHOLD_SECONDS = 60
+# COURSE_CATALOG_INFO_CHANGED events are applied in batches, this many seconds after they are received. Set the window
+# to 0 to apply every event as soon as it is received.
+EVENT_BUS_BATCH_WINDOW_SECONDS = 5
+
+# Number of threads data loaders download images with, see ImageFetcher.
+IMAGE_DOWNLOAD_MAX_WORKERS = 8
+# Seconds the validators and content hash of downloaded images are cached for, to skip downloading and saving
+# images that were not modified since.
+IMAGE_SOURCE_CACHE_TIMEOUT = 60 * 60 * 24 * 30
 
 ALGOLIA_INDEX_EXCLUDED_SOURCES = []
 
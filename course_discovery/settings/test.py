@@ -82,6 +82,9 @@ CELERY_BROKER_URL = 'memory://localhost/'
 
 ################################### END CELERY ###################################
 
+# Apply course catalog events as soon as they are received.
+EVENT_BUS_BATCH_WINDOW_SECONDS = 0
+
 PRODUCT_API_URL = 'http://www.example.com'
 
 BOOTCAMP_CONTENTFUL_CONTENT_TYPE = 'bootCampPage'